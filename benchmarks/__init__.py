@@ -0,0 +1,16 @@
+"""
+Performance benchmarks.
+
+Benchmarks are standalone scripts run against the configured database, e.g.:
+    python -m benchmarks.csv_export
+"""
+
+import os
+
+import django
+
+
+def setup():
+    """Configure Django for a standalone benchmark script."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "simpleevent.settings")
+    django.setup()
@@ -0,0 +1,222 @@
+"""
+Sync (WSGI) vs async (ASGI) read path load benchmark.
+
+Seeds events and performances, starts the threaded development server and
+uvicorn, then drives both with concurrent clients against the event detail
+and performance list endpoints. Reports p50/p99 latency, throughput, the
+peak server thread count and the number of connections the server reset.
+
+Rows are seeded with ``manage.py seed_benchmark`` and committed so that the
+servers can see them, data seeded before is replaced. They are removed at
+the end by ``seed_benchmark --clear``.
+
+Usage:
+    python -m benchmarks.async_load [--performances 10000] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from . import setup
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+HOST = "127.0.0.1"
+
+SERVERS = {
+    "wsgi": (
+        8101,
+        [sys.executable, "manage.py", "runserver", "--noreload", f"{HOST}:8101"],
+        {
+            "event detail": "/api/events/{event_id}/",
+            "performance list": "/api/performances/",
+        },
+    ),
+    "asgi": (
+        8102,
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "simpleevent.asgi:application",
+            "--host",
+            HOST,
+            "--port",
+            "8102",
+            "--log-level",
+            "warning",
+        ],
+        {
+            "event detail": "/api/async/events/{event_id}/",
+            "performance list": "/api/async/performances/",
+        },
+    ),
+}
+
+
+async def fetch(port, path):
+    """Send a single GET request and return its latency in milliseconds."""
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection(HOST, port)
+    writer.write(
+        f"GET {path} HTTP/1.1\r\nHost: {HOST}\r\nConnection: close\r\n\r\n".encode()
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    assert response.startswith(b"HTTP/1.1 200"), response[:200]
+    return (time.perf_counter() - started) * 1000
+
+
+def get_thread_count(pid):
+    """Return the number of threads of a process (Linux only)."""
+    try:
+        status = Path(f"/proc/{pid}/status").read_text()
+    except OSError:
+        return 0
+    for line in status.splitlines():
+        if line.startswith("Threads:"):
+            return int(line.split()[1])
+    return 0
+
+
+async def load(port, path, pid, requests, concurrency):
+    """Run ``requests`` requests with ``concurrency`` concurrent clients."""
+    queue = asyncio.Queue()
+    for _request in range(requests):
+        queue.put_nowait(path)
+    timings = []
+    errors = 0
+    threads = 0
+
+    async def client():
+        nonlocal errors
+        while not queue.empty():
+            try:
+                timings.append(await fetch(port, queue.get_nowait()))
+            except ConnectionError:
+                # The listen backlog of the server overflowed.
+                errors += 1
+
+    async def monitor():
+        nonlocal threads
+        while True:
+            threads = max(threads, get_thread_count(pid))
+            await asyncio.sleep(0.05)
+
+    monitor_task = asyncio.create_task(monitor())
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _client in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    monitor_task.cancel()
+
+    quantiles = statistics.quantiles(timings, n=100)
+    return {
+        "p50": quantiles[49],
+        "p99": quantiles[98],
+        "rps": len(timings) / elapsed,
+        "threads": threads,
+        "errors": errors,
+    }
+
+
+def wait_for_server(port, timeout=30):
+    """Wait until the server accepts connections."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            asyncio.run(fetch(port, "/api/schema/"))
+            return
+        except (OSError, AssertionError):
+            time.sleep(0.2)
+    raise RuntimeError(f"Server on port {port} did not start.")
+
+
+def run_server(name, event_id, requests, concurrency):
+    """Start a server, load its endpoints and stop it."""
+    port, command, paths = SERVERS[name]
+    env = {**os.environ, "ALLOWED_HOSTS": f"{HOST},localhost", "DEBUG": ""}
+    process = subprocess.Popen(
+        command,
+        cwd=BASE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_server(port)
+        results = {}
+        for endpoint, path in paths.items():
+            path = path.format(event_id=event_id)
+            # Warm up connections and caches.
+            asyncio.run(load(port, path, process.pid, concurrency, concurrency))
+            results[endpoint] = asyncio.run(
+                load(port, path, process.pid, requests, concurrency)
+            )
+        return results
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--performances", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    # Every in-flight async request holds a database connection, keep it
+    # below PostgreSQL max_connections (100 by default).
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    setup()
+    from django.core.management import call_command
+
+    from core.management.commands.seed_benchmark import NAME_PREFIX, Command
+    from core.models import Event
+
+    from .query_plans import PERFORMANCES_PER_EVENT
+
+    events = max(args.performances // PERFORMANCES_PER_EVENT, 1)
+    call_command(
+        "seed_benchmark",
+        events=events,
+        performances_per_event=PERFORMANCES_PER_EVENT,
+        artists=0,
+        clear=True,
+    )
+
+    try:
+        event_id = (
+            Event.objects.filter(name__startswith=f"{NAME_PREFIX}Event ")
+            .order_by("start")
+            .values_list("id", flat=True)[events // 2]
+        )
+        results = {
+            name: run_server(name, event_id, args.requests, args.concurrency)
+            for name in SERVERS
+        }
+    finally:
+        Command().clear()
+
+    print(
+        f"{'server':>6} {'endpoint':>17} {'p50 ms':>8} {'p99 ms':>8} "
+        f"{'req/s':>8} {'threads':>8} {'errors':>8}"
+    )
+    for name, endpoints in results.items():
+        for endpoint, result in endpoints.items():
+            print(
+                f"{name:>6} {endpoint:>17} {result['p50']:>8.2f} "
+                f"{result['p99']:>8.2f} {result['rps']:>8.1f} "
+                f"{result['threads']:>8} {result['errors']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+CSV export memory and throughput benchmark.
+
+Compares the materialized export (whole result loaded into memory) with the
+streaming export (server-side cursor, fixed-size batches). Every measurement
+runs in a fresh process, so the reported peak RSS belongs to one export only.
+Seeded rows are rolled back after each measurement.
+
+Usage:
+    python -m benchmarks.csv_export [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import csv
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from . import setup
+
+SIZES = [10_000, 100_000, 1_000_000]
+MODES = ["materialized", "streaming"]
+
+
+def seed_events(count):
+    """Insert ``count`` events with a single INSERT ... SELECT."""
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO core_event (name, start, "end", updated_at)
+            SELECT 'BenchmarkEvent' || n,
+                   now() + n * interval '1 minute',
+                   now() + n * interval '1 minute' + interval '1 hour',
+                   now()
+            FROM generate_series(1, %s) AS n
+            """,
+            [count],
+        )
+
+
+def export_materialized(export_spec, csvfile):
+    """Export the way it was done before streaming: load everything first."""
+    from core.helpers import format_value, get_queryset_from_export_spec
+
+    rows = list(get_queryset_from_export_spec(export_spec))
+    writer = csv.writer(csvfile)
+    writer.writerow(export_spec["fields"])
+    writer.writerows([format_value(value) for value in row] for row in rows)
+
+
+def export_streaming(export_spec, csvfile):
+    """Export with a server-side cursor and fixed-size batches."""
+    from core.helpers import (
+        get_queryset_from_export_spec,
+        iter_queryset,
+        write_csv_rows,
+    )
+
+    queryset = get_queryset_from_export_spec(export_spec)
+    write_csv_rows(csvfile, export_spec["fields"], iter_queryset(queryset))
+
+
+def measure(size, mode):
+    """Run a single measurement and return its result."""
+    setup()
+    from django.db import transaction
+
+    export_spec = {
+        "model": "core.Event",
+        "filters": {},
+        "fields": ["id", "name", "start", "end"],
+    }
+    export = export_streaming if mode == "streaming" else export_materialized
+
+    with transaction.atomic():
+        seed_events(size)
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        with tempfile.TemporaryFile("w", encoding="utf-8") as csvfile:
+            started = time.perf_counter()
+            export(export_spec, csvfile)
+            elapsed = time.perf_counter() - started
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        transaction.set_rollback(True)
+
+    return {
+        "rows": size,
+        "mode": mode,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(size / elapsed),
+        "peak_rss_mb": round(rss_after / 1024, 1),
+        "peak_rss_growth_mb": round((rss_after - rss_before) / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--measure", nargs=2, metavar=("SIZE", "MODE"))
+    args = parser.parse_args()
+
+    if args.measure:
+        size, mode = args.measure
+        print(json.dumps(measure(int(size), mode)))
+        return
+
+    print(f"{'rows':>10} {'mode':>13} {'seconds':>8} {'rows/s':>9} {'peak RSS MB':>12}")
+    for size in args.sizes:
+        for mode in MODES:
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "benchmarks.csv_export",
+                    "--measure",
+                    str(size),
+                    mode,
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+                env=os.environ,
+            ).stdout
+            result = json.loads(output)
+            print(
+                f"{result['rows']:>10} {result['mode']:>13} {result['seconds']:>8} "
+                f"{result['rows_per_second']:>9} {result['peak_rss_mb']:>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
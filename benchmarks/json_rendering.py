@@ -0,0 +1,82 @@
+"""
+JSON rendering and parsing CPU benchmark.
+
+Renders a page of the performance list with the DRF ``JSONRenderer`` and
+with ``ORJSONRenderer`` and parses a bulk create payload with the DRF
+``JSONParser`` and ``ORJSONParser``. Reports the CPU time per response.
+Seeded rows are rolled back at the end.
+
+Usage:
+    python -m benchmarks.json_rendering [--page-size 500] [--repeat 200]
+"""
+
+import argparse
+import io
+import statistics
+import time
+
+from . import setup
+
+
+def measure(function, repeat):
+    """Return the median CPU time of ``function`` in microseconds."""
+    timings = []
+    for _repeat in range(repeat):
+        started = time.process_time_ns()
+        function()
+        timings.append((time.process_time_ns() - started) / 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    setup()
+    from django.db import transaction
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    from core import models
+    from core.api.parsers import ORJSONParser
+    from core.api.renderers import ORJSONRenderer
+    from core.api.serializers import PerformanceSerializer
+
+    from .query_plans import seed
+
+    with transaction.atomic():
+        seed(args.page_size)
+        performances = models.Performance.objects.prefetch_related("artists")[
+            : args.page_size
+        ]
+        data = {"next": None, "previous": None}
+        data["results"] = PerformanceSerializer(performances, many=True).data
+        transaction.set_rollback(True)
+
+    body = JSONRenderer().render(data["results"])
+    results = {
+        ("render", "json"): measure(lambda: JSONRenderer().render(data), args.repeat),
+        ("render", "orjson"): measure(
+            lambda: ORJSONRenderer().render(data), args.repeat
+        ),
+        ("parse", "json"): measure(
+            lambda: JSONParser().parse(io.BytesIO(body)), args.repeat
+        ),
+        ("parse", "orjson"): measure(
+            lambda: ORJSONParser().parse(io.BytesIO(body)), args.repeat
+        ),
+    }
+
+    print(f"{len(data['results'])} performances, {len(body)} bytes")
+    print(f"{'step':>6} {'library':>8} {'CPU us':>10}")
+    for (step, library), cpu_time in results.items():
+        print(f"{step:>6} {library:>8} {cpu_time:>10.1f}")
+    for step in ("render", "parse"):
+        saved = results[(step, "json")] - results[(step, "orjson")]
+        print(f"{step} CPU saved per response: {saved:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Cursor vs offset pagination benchmark for the performance list endpoint.
+
+Seeds performances and measures the latency of page 1 and a deep page with
+the cursor pagination used by the API and with limit/offset pagination.
+Seeded rows are rolled back at the end.
+
+Usage:
+    python -m benchmarks.pagination [--performances 1000000] [--page 10000]
+"""
+
+import argparse
+import statistics
+import time
+from base64 import b64encode
+from urllib.parse import urlencode
+
+from . import setup
+
+REPEAT = 20
+
+
+def measure(view, query_params):
+    """Return the median latency of a list request in milliseconds."""
+    from rest_framework.test import APIRequestFactory
+
+    factory = APIRequestFactory()
+    timings = []
+    for _repeat in range(REPEAT):
+        request = factory.get("/api/performances/", query_params)
+        started = time.perf_counter()
+        response = view(request)
+        response.render()
+        timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200, response.data
+    return statistics.median(timings)
+
+
+def encode_cursor(position):
+    """Encode a cursor pointing right after ``position``."""
+    token = urlencode({"p": position}).encode("ascii")
+    return b64encode(token).decode("ascii")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--performances", type=int, default=1_000_000)
+    parser.add_argument("--page", type=int, default=10_000)
+    args = parser.parse_args()
+
+    setup()
+    from django.db import transaction
+    from django.test import override_settings
+    from rest_framework.pagination import LimitOffsetPagination
+
+    from core import models
+    from core.api.pagination import StartCursorPagination
+    from core.api.views import PerformanceViewSet
+
+    from .query_plans import seed
+
+    page_size = StartCursorPagination.page_size
+    offset = (args.page - 1) * page_size
+    cursor_view = PerformanceViewSet.as_view({"get": "list"})
+    offset_view = PerformanceViewSet.as_view(
+        {"get": "list"},
+        queryset=PerformanceViewSet.queryset.order_by("start", "id"),
+        pagination_class=LimitOffsetPagination,
+    )
+
+    with override_settings(ALLOWED_HOSTS=["testserver"]), transaction.atomic():
+        seed(args.performances)
+        # The row right before the deep page, its start is the cursor position.
+        previous = models.Performance.objects.order_by("start", "id")[offset - 1]
+
+        results = {
+            ("cursor", 1): measure(cursor_view, {}),
+            ("cursor", args.page): measure(
+                cursor_view, {"cursor": encode_cursor(str(previous.start))}
+            ),
+            ("offset", 1): measure(offset_view, {"limit": page_size, "offset": 0}),
+            ("offset", args.page): measure(
+                offset_view, {"limit": page_size, "offset": offset}
+            ),
+        }
+
+        transaction.set_rollback(True)
+
+    print(f"{'pagination':>10} {'page':>6} {'median ms':>10}")
+    for (pagination, page), latency in results.items():
+        print(f"{pagination:>10} {page:>6} {latency:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
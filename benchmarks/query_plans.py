@@ -0,0 +1,132 @@
+"""
+Query plans benchmark for the Performance and Event composite indexes.
+
+Seeds events and performances, then prints the plan and execution time of
+the queries used by the API with and without the composite indexes. The
+indexes are dropped inside the same transaction and everything is rolled
+back at the end.
+
+Usage:
+    python -m benchmarks.query_plans [--performances 1000000]
+"""
+
+import argparse
+
+from . import setup
+
+PERFORMANCES_PER_EVENT = 100
+
+INDEXES = ["core_perf_event_start_idx", "core_event_start_end_idx"]
+
+QUERIES = {
+    # EventRetrieveSerializer.get_performances
+    "event performances ordered by start": """
+        SELECT * FROM core_performance
+        WHERE event_id = %(event_id)s
+        ORDER BY start
+    """,
+    # EventSerializer.update timeframe check
+    "performances out of event timeframe": """
+        SELECT 1 FROM core_performance
+        WHERE event_id = %(event_id)s
+          AND (start < %(start)s OR "end" > %(end)s)
+        LIMIT 1
+    """,
+    # Overlap check for a new performance
+    "overlapping performances": """
+        SELECT 1 FROM core_performance
+        WHERE event_id = %(event_id)s
+          AND start < %(end)s AND "end" > %(start)s
+        LIMIT 1
+    """,
+    # Events in a one week time window
+    "events in time window": """
+        SELECT * FROM core_event
+        WHERE start >= %(start)s
+          AND start < %(start)s + interval '7 days'
+          AND "end" <= %(start)s + interval '8 days'
+    """,
+}
+
+
+def seed(performances):
+    """Insert events and their performances with INSERT ... SELECT."""
+    from django.db import connection
+
+    events = max(performances // PERFORMANCES_PER_EVENT, 1)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO core_event (name, start, "end", updated_at)
+            SELECT 'BenchmarkEvent' || n,
+                   timestamptz '2024-01-01' + n * interval '1 day',
+                   timestamptz '2024-01-01' + n * interval '1 day' + interval '1 day',
+                   now()
+            FROM generate_series(1, %s) AS n
+            """,
+            [events],
+        )
+        cursor.execute(
+            """
+            INSERT INTO core_performance (event_id, start, "end", updated_at)
+            SELECT e.id,
+                   e.start + n * interval '10 minutes',
+                   e.start + (n + 1) * interval '10 minutes',
+                   now()
+            FROM core_event e, generate_series(0, %s - 1) AS n
+            WHERE e.name LIKE 'BenchmarkEvent%%'
+            """,
+            [PERFORMANCES_PER_EVENT],
+        )
+        cursor.execute("ANALYZE core_event")
+        cursor.execute("ANALYZE core_performance")
+        cursor.execute(
+            """
+            SELECT id, start, "end" FROM core_event
+            WHERE name = 'BenchmarkEvent' || %s
+            """,
+            [events // 2],
+        )
+        event_id, start, end = cursor.fetchone()
+    return {"event_id": event_id, "start": start, "end": end}
+
+
+def explain(params):
+    """Print the plan summary of every benchmarked query."""
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        for name, query in QUERIES.items():
+            cursor.execute(f"EXPLAIN (ANALYZE, FORMAT TEXT) {query}", params)
+            plan = [row[0] for row in cursor.fetchall()]
+            print(f"  {name}:")
+            for line in plan:
+                if "Scan" in line or "Sort" in line or "Execution Time" in line:
+                    print(f"    {line.strip()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--performances", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    setup()
+    from django.db import connection, transaction
+
+    with transaction.atomic():
+        params = seed(args.performances)
+
+        print("With composite indexes:")
+        explain(params)
+
+        with connection.cursor() as cursor:
+            for index in INDEXES:
+                cursor.execute(f'DROP INDEX "{index}"')
+        print("Without composite indexes:")
+        explain(params)
+
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    main()
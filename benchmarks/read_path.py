@@ -0,0 +1,115 @@
+"""
+Read path benchmark for the performance representation.
+
+Builds the representation of 10k performances (3 artists each) with
+``PerformanceSerializer`` over prefetched model instances and with the
+``values()`` based read path of ``core.api.readers``. Seeded rows are
+rolled back at the end.
+
+Usage:
+    python -m benchmarks.read_path [--performances 10000] [--repeat 5]
+"""
+
+import argparse
+import statistics
+import time
+
+from . import setup
+
+ARTISTS = 1000
+ARTISTS_PER_PERFORMANCE = 3
+
+
+def seed_artists():
+    """Insert artists and assign some of them to every seeded performance."""
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO core_artist (name, music_genre)
+            SELECT 'BenchmarkArtist' || n, 'rock' FROM generate_series(1, %s) AS n
+            """,
+            [ARTISTS],
+        )
+        cursor.execute(
+            """
+            INSERT INTO core_performance_artists (performance_id, artist_id)
+            SELECT p.id, a.id
+            FROM core_performance p
+            JOIN core_event e ON e.id = p.event_id
+            CROSS JOIN LATERAL (
+                SELECT id FROM core_artist
+                WHERE name LIKE 'BenchmarkArtist%%'
+                ORDER BY md5(p.id::text || id::text)
+                LIMIT %s
+            ) a
+            WHERE e.name LIKE 'BenchmarkEvent%%'
+            """,
+            [ARTISTS_PER_PERFORMANCE],
+        )
+        cursor.execute("ANALYZE")
+
+
+def measure(function, repeat):
+    """Return the median wall time of ``function`` in milliseconds."""
+    timings = []
+    for _repeat in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--performances", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup()
+    from django.db import transaction
+
+    from core import models
+    from core.api.readers import build_performances, get_performance_rows
+    from core.api.serializers import PerformanceSerializer
+
+    from .query_plans import seed
+
+    with transaction.atomic():
+        seed(args.performances)
+        seed_artists()
+        queryset = models.Performance.objects.filter(
+            event__name__startswith="BenchmarkEvent"
+        ).order_by("start", "id")
+
+        serializer_data = PerformanceSerializer(
+            queryset.prefetch_related("artists"), many=True
+        ).data
+        reader_data = build_performances(get_performance_rows(queryset))
+        assert [dict(row) for row in serializer_data] == reader_data
+
+        results = {
+            "serializer": measure(
+                lambda: PerformanceSerializer(
+                    queryset.prefetch_related("artists"), many=True
+                ).data,
+                args.repeat,
+            ),
+            "reader": measure(
+                lambda: build_performances(get_performance_rows(queryset)),
+                args.repeat,
+            ),
+        }
+
+        transaction.set_rollback(True)
+
+    count = len(reader_data)
+    print(f"{count} performances, {ARTISTS_PER_PERFORMANCE} artists each")
+    print(f"{'path':>10} {'median ms':>10} {'us/object':>10}")
+    for path, latency in results.items():
+        print(f"{path:>10} {latency:>10.1f} {latency * 1000 / count:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+API benchmark runner.
+
+Measures p50/p99 latency and throughput of the event retrieve and list,
+performance list, event create and update endpoints and of the CSV export
+against the data created by ``manage.py seed_benchmark``. Results are
+written as JSON, so runs of different releases can be compared. Every
+request commits like in production, created events are deleted and names
+of updated events are restored afterwards.
+
+Usage:
+    python manage.py seed_benchmark
+    python -m benchmarks.runner [--requests 200] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+from datetime import datetime, timedelta
+
+from . import setup
+
+
+def summarize(timings, elapsed):
+    """Summarize request latencies in milliseconds."""
+    quantiles = statistics.quantiles(timings, n=100)
+    return {
+        "requests": len(timings),
+        "p50_ms": round(quantiles[49], 3),
+        "p99_ms": round(quantiles[98], 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "throughput_rps": round(len(timings) / elapsed, 1),
+    }
+
+
+def measure(make_request, requests):
+    """Run ``requests`` requests and summarize them."""
+    timings = []
+    started = time.perf_counter()
+    for index in range(requests):
+        request_started = time.perf_counter()
+        response = make_request(index)
+        timings.append((time.perf_counter() - request_started) * 1000)
+        assert response.status_code < 300, response.content[:200]
+    return summarize(timings, time.perf_counter() - started)
+
+
+def get_scenarios(client, rng, event_names, created_ids, updated_names):
+    """
+    Get request makers of the measured endpoints.
+
+    Ids of created events are appended to ``created_ids`` and the original
+    names of updated events are stored in ``updated_names``, for the clean up.
+    """
+    from core.management.commands.seed_benchmark import NAME_PREFIX
+
+    event_ids = list(event_names)
+    start = datetime.fromisoformat("2100-01-01T00:00:00")
+
+    def create_event(index):
+        event_start = start + timedelta(days=index)
+        response = client.post(
+            "/api/events/",
+            {
+                "name": f"{NAME_PREFIX}Runner {index}",
+                "start": event_start.strftime("%Y-%m-%d %H:%M:%S"),
+                "end": (event_start + timedelta(hours=12)).strftime(
+                    "%Y-%m-%d %H:%M:%S"
+                ),
+            },
+            content_type="application/json",
+        )
+        if response.status_code == 201:
+            created_ids.append(response.json()["id"])
+        return response
+
+    def update_event(index):
+        event_id = rng.choice(event_ids)
+        updated_names[event_id] = event_names[event_id]
+        return client.patch(
+            f"/api/events/{event_id}/",
+            {"name": f"{NAME_PREFIX}Runner updated {event_id}-{index}"},
+            content_type="application/json",
+        )
+
+    return {
+        "event retrieve": lambda index: client.get(
+            f"/api/events/{rng.choice(event_ids)}/"
+        ),
+        "event list": lambda index: client.get("/api/events/"),
+        "performance list": lambda index: client.get("/api/performances/"),
+        "event create": create_event,
+        "event update": update_event,
+    }
+
+
+def clean_up(created_ids, updated_names):
+    """Delete created events and restore names of updated events."""
+    from core.models import Event
+
+    # Model methods send the signals recording tombstones and invalidating
+    # cached payloads.
+    Event.objects.filter(pk__in=created_ids).delete()
+    for event in Event.objects.filter(pk__in=updated_names):
+        event.name = updated_names[event.pk]
+        event.save(update_fields=["name"])
+
+
+def measure_export(runs):
+    """Measure full events CSV exports."""
+    from django.conf import settings
+
+    from core.helpers import generate_file_from_export_spec
+
+    export_spec = {
+        "model": "core.Event",
+        "filters": {},
+        "fields": ["id", "name", "start", "end"],
+    }
+    timings = []
+    started = time.perf_counter()
+    for _run in range(runs):
+        run_started = time.perf_counter()
+        file_url = generate_file_from_export_spec("benchmark", export_spec)
+        timings.append((time.perf_counter() - run_started) * 1000)
+        os.remove(os.path.join(settings.MEDIA_ROOT, os.path.basename(file_url)))
+    return summarize(timings, time.perf_counter() - started)
+
+
+def get_metadata():
+    """Get the environment and dataset the results were measured with."""
+    import django
+
+    from core import models
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "measured_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "dataset": {
+            "events": models.Event.objects.count(),
+            "performances": models.Performance.objects.count(),
+            "artists": models.Artist.objects.count(),
+            "performance_artists": models.Performance.artists.through.objects.count(),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--export-runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark-results.json")
+    args = parser.parse_args()
+
+    setup()
+    from django.core.cache import cache
+    from django.test import Client, override_settings
+
+    from core import models
+    from core.management.commands.seed_benchmark import NAME_PREFIX
+
+    rng = random.Random(args.seed)
+    event_names = dict(
+        models.Event.objects.filter(
+            name__startswith=f"{NAME_PREFIX}Event "
+        ).values_list("id", "name")
+    )
+    if not event_names:
+        raise SystemExit("No benchmark data, run manage.py seed_benchmark first.")
+
+    client = Client()
+    results = {}
+    created_ids, updated_names = [], {}
+    scenarios = get_scenarios(client, rng, event_names, created_ids, updated_names)
+    try:
+        with override_settings(ALLOWED_HOSTS=["testserver"]):
+            for name, make_request in scenarios.items():
+                cache.clear()
+                results[name] = measure(make_request, args.requests)
+                print(f"{name:>17}: {results[name]}")
+    finally:
+        clean_up(created_ids, updated_names)
+    results["csv export"] = measure_export(args.export_runs)
+    print(f"{'csv export':>17}: {results['csv export']}")
+
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump({"metadata": get_metadata(), "results": results}, file, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,27 @@
 from django.contrib import admin
 
-from .models import Artist
+from .models import Artist, WebhookDelivery, WebhookDeliveryAttempt
+
 
 class ArtistModelAdmin(admin.ModelAdmin):
     pass
 
 
-admin.site.register(Artist, ArtistModelAdmin)
\ No newline at end of file
+admin.site.register(Artist, ArtistModelAdmin)
+
+
+class WebhookDeliveryAttemptInline(admin.TabularInline):
+    model = WebhookDeliveryAttempt
+    fields = ["attempted_at", "response_status", "error"]
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+
+class WebhookDeliveryModelAdmin(admin.ModelAdmin):
+    list_display = ["url", "status", "attempts", "response_status", "created_at"]
+    list_filter = ["status"]
+    inlines = [WebhookDeliveryAttemptInline]
+
+
+admin.site.register(WebhookDelivery, WebhookDeliveryModelAdmin)
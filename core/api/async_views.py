@@ -0,0 +1,136 @@
+"""
+Core module API async views.
+
+Read-only endpoints for ASGI servers. A request waiting on the database
+or on a slow client does not hold a worker thread, so a single process can
+serve many concurrent connections. Responses are the same as the ones of
+the DRF viewsets.
+"""
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.request import Request
+
+from .. import models
+from ..cache import (
+    discard_event_version,
+    get_event_cache_key,
+    get_event_version,
+    get_performances_version,
+)
+from .filters import PerformanceFilterBackend
+from .pagination import StartCursorPagination
+from .readers import (
+    build_performances,
+    get_event_detail,
+    get_event_document,
+    get_performance_rows,
+    use_event_document,
+)
+from .renderers import ORJSONRenderer
+from .views import ConditionalGetMixin
+
+
+class AsyncJSONView(ConditionalGetMixin, View):
+    """Base async view rendering JSON like the DRF viewsets."""
+
+    http_method_names = ["get", "head"]
+
+    def render(self, data, status=200):
+        """
+        Render data to a JSON response.
+
+        Parameters:
+            data (dict): Response data.
+            status (int): Response status code.
+
+        Returns:
+            HttpResponse: The response.
+        """
+        return HttpResponse(
+            ORJSONRenderer().render(data),
+            content_type="application/json",
+            status=status,
+        )
+
+
+class EventRetrieveAsyncView(AsyncJSONView):
+    """Event retrieve async view."""
+
+    query_budget = {"get": 2}
+
+    async def get(self, request, pk):
+        # Cached and tagged like by EventViewSet.retrieve.
+        use_document = use_event_document()
+        version = await sync_to_async(get_event_version)(pk)
+        name = f"event-{pk}-document" if use_document else f"event-{pk}"
+        response = self.get_not_modified_response(request, name, version)
+        if response is not None:
+            return response
+
+        cache_key = get_event_cache_key(pk, version, document=use_document)
+        data = await cache.aget(cache_key)
+        if data is None:
+            get_data = get_event_document if use_document else get_event_detail
+            data = await sync_to_async(get_data)(pk)
+            if data is None:
+                await sync_to_async(discard_event_version)(pk)
+                return self.render({"detail": NotFound.default_detail}, status=404)
+            await cache.aset(cache_key, data, settings.EVENT_RETRIEVE_CACHE_TIMEOUT)
+
+        # Documents built by the database are JSON already.
+        if use_document:
+            response = HttpResponse(data, content_type="application/json")
+        else:
+            response = self.render(data)
+        return self.set_version_headers(response, name, version)
+
+
+class PerformanceListAsyncView(AsyncJSONView):
+    """Performance list async view."""
+
+    # Used by the filter backend.
+    action = "list"
+    query_budget = {"get": 1}
+
+    async def get(self, request):
+        version = await sync_to_async(get_performances_version)()
+        response = self.get_not_modified_response(request, "performances", version)
+        if response is not None:
+            return response
+
+        try:
+            data = await sync_to_async(self.get_page)(Request(request))
+        except APIException as exc:
+            # Invalid filters or cursor, rendered like DRF exception handler.
+            detail = exc.detail
+            if not isinstance(detail, (list, dict)):
+                detail = {"detail": detail}
+            return self.render(detail, status=exc.status_code)
+
+        return self.set_version_headers(self.render(data), "performances", version)
+
+    def get_page(self, request):
+        """
+        Get filtered and paginated performances.
+
+        The cursor paginator evaluates the queryset synchronously, so this
+        runs in a worker thread while the event loop keeps serving.
+
+        Parameters:
+            request (Request): The request.
+
+        Returns:
+            dict: Paginated response data.
+        """
+        queryset = models.Performance.objects.all()
+        queryset = PerformanceFilterBackend().filter_queryset(request, queryset, self)
+        paginator = StartCursorPagination()
+        page = paginator.paginate_queryset(
+            get_performance_rows(queryset), request, view=self
+        )
+        return paginator.get_paginated_response(build_performances(page)).data
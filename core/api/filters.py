@@ -0,0 +1,53 @@
+"""
+Core module API filters.
+"""
+
+from django.db.models import Exists, OuterRef
+from rest_framework.filters import BaseFilterBackend
+
+from .. import models
+from . import serializers
+
+
+class PerformanceFilterBackend(BaseFilterBackend):
+    """
+    Performance list filters.
+
+    Time filters are range predicates on indexed columns, artist filters
+    are semi-joins through the artists table, so only matching rows are read.
+    """
+
+    actions = ("list", "download")
+
+    def filter_queryset(self, request, queryset, view):
+        if view.action not in self.actions:
+            return queryset
+
+        serializer = serializers.PerformanceFilterSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        filters = serializer.validated_data
+
+        if "start_after" in filters:
+            queryset = queryset.filter(start__gte=filters["start_after"])
+        if "end_before" in filters:
+            queryset = queryset.filter(end__lte=filters["end_before"])
+        if "event" in filters:
+            queryset = queryset.filter(event_id=filters["event"])
+
+        performance_artists = models.Performance.artists.through.objects.filter(
+            performance_id=OuterRef("pk")
+        )
+        if "artist" in filters:
+            queryset = queryset.filter(
+                Exists(performance_artists.filter(artist__name=filters["artist"]))
+            )
+        if "music_genre" in filters:
+            queryset = queryset.filter(
+                Exists(
+                    performance_artists.filter(
+                        artist__music_genre=filters["music_genre"]
+                    )
+                )
+            )
+
+        return queryset
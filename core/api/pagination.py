@@ -0,0 +1,22 @@
+"""
+Core module API pagination.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class StartCursorPagination(CursorPagination):
+    """
+    Keyset pagination ordered by start.
+
+    The cursor holds the start of the page boundary, pages are fetched with
+    an index range scan on ("start", "id") from that start instead of an
+    OFFSET scan from the first row. Rows sharing the boundary start are
+    skipped with an offset, so deep pages cost about the same as the first
+    one unless many rows start at the same time.
+    """
+
+    ordering = ("start", "id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
@@ -0,0 +1,192 @@
+"""
+Core module API readers.
+
+Read-only responses built directly from ``values()`` rows. They render the
+same JSON as the read side of the model serializers without creating model
+instances or DRF field trees per object. Artist names are aggregated into
+an array by the database.
+
+With the "postgres" EVENT_RETRIEVE_ENGINE the whole event detail document
+is built by PostgreSQL and passed to the response as JSON text.
+"""
+
+from django.conf import settings
+from django.contrib.postgres.expressions import ArraySubquery
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.models import OuterRef
+from django.utils import timezone
+from rest_framework.settings import api_settings
+
+from .. import models
+from .renderers import format_datetime
+
+
+def get_performance_rows(queryset):
+    """
+    Get performance rows with their artist names.
+
+    Artists are aggregated by a correlated subquery, it is evaluated only
+    for the returned rows, e.g. a single page.
+
+    Parameters:
+        queryset (QuerySet): Performance queryset.
+
+    Returns:
+        QuerySet: Queryset of dicts with "id", "start", "end" and
+        "artist_names" keys.
+    """
+    # Ordered by the relation id, like the serializers list the artists.
+    artist_names = (
+        models.Performance.artists.through.objects.filter(performance=OuterRef("pk"))
+        .order_by("id")
+        .values("artist__name")
+    )
+    return (
+        queryset.prefetch_related(None)
+        .values("id", "start", "end")
+        .annotate(artist_names=ArraySubquery(artist_names))
+    )
+
+
+def build_performance(row):
+    """Build the ``PerformanceSerializer`` representation of a row."""
+    return {
+        "id": row["id"],
+        "artists": row["artist_names"],
+        "start": format_datetime(row["start"]),
+        "end": format_datetime(row["end"]),
+    }
+
+
+def build_performances(rows):
+    """Build the representations of performance rows."""
+    return [build_performance(row) for row in rows]
+
+
+def get_event_detail(event_id):
+    """
+    Get the ``EventRetrieveSerializer`` representation of an event.
+
+    Parameters:
+        event_id (int): Event id.
+
+    Returns:
+        dict | None: Event with its performances ordered by start, None if
+        the event does not exist.
+    """
+    event = (
+        models.Event.objects.filter(pk=event_id)
+        .values("id", "name", "start", "end")
+        .first()
+    )
+    if event is None:
+        return None
+    performances = get_performance_rows(
+        models.Performance.objects.filter(event_id=event_id).order_by("start")
+    )
+    return {
+        "id": event["id"],
+        "name": event["name"],
+        "start": format_datetime(event["start"]),
+        "end": format_datetime(event["end"]),
+        "performances": build_performances(performances),
+    }
+
+
+# PostgreSQL equivalent of the "%Y-%m-%d %H:%M:%S" DATETIME_FORMAT.
+SQL_DATETIME_FORMAT = "YYYY-MM-DD HH24:MI:SS"
+
+EVENT_RETRIEVE_ENGINES = ("python", "postgres")
+
+
+def use_event_document():
+    """
+    Check whether event details are built as JSON documents by PostgreSQL.
+
+    Returns:
+        bool: True with the "postgres" EVENT_RETRIEVE_ENGINE.
+
+    Raises:
+        ImproperlyConfigured: The engine is unknown or it does not support
+            the DATETIME_FORMAT.
+    """
+    engine = settings.EVENT_RETRIEVE_ENGINE
+    if engine not in EVENT_RETRIEVE_ENGINES:
+        raise ImproperlyConfigured(
+            f"EVENT_RETRIEVE_ENGINE must be one of {EVENT_RETRIEVE_ENGINES}, "
+            f"not {engine!r}."
+        )
+    if engine != "postgres":
+        return False
+    if api_settings.DATETIME_FORMAT != "%Y-%m-%d %H:%M:%S":
+        raise ImproperlyConfigured(
+            'The "postgres" EVENT_RETRIEVE_ENGINE requires the '
+            '"%Y-%m-%d %H:%M:%S" DATETIME_FORMAT.'
+        )
+    return True
+
+
+def get_event_document(event_id):
+    """
+    Get the ``EventRetrieveSerializer`` representation of an event as JSON.
+
+    The document is built in a single query with json_build_object and
+    json_agg. The json type, unlike jsonb, keeps the keys in the order of
+    the serializer. Datetimes are formatted in the current time zone.
+
+    Parameters:
+        event_id (int): Event id.
+
+    Returns:
+        bytes | None: UTF-8 JSON document, None if the event does not exist.
+    """
+    Event, Performance, Artist = models.Event, models.Performance, models.Artist
+    Through = Performance.artists.through
+    params = {
+        "event_id": event_id,
+        "time_zone": timezone.get_current_timezone_name(),
+        "format": SQL_DATETIME_FORMAT,
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT json_build_object(
+                'id', e.id,
+                'name', e.name,
+                'start', to_char(timezone(%(time_zone)s, e.start), %(format)s),
+                'end', to_char(timezone(%(time_zone)s, e."end"), %(format)s),
+                'performances', COALESCE((
+                    SELECT json_agg(
+                        json_build_object(
+                            'id', p.id,
+                            'artists', COALESCE((
+                                SELECT json_agg(a.name ORDER BY t.id)
+                                FROM {Through._meta.db_table} t
+                                JOIN {Artist._meta.db_table} a ON a.id = t.artist_id
+                                WHERE t.performance_id = p.id
+                            ), '[]'::json),
+                            'start', to_char(
+                                timezone(%(time_zone)s, p.start), %(format)s
+                            ),
+                            'end', to_char(
+                                timezone(%(time_zone)s, p."end"), %(format)s
+                            )
+                        )
+                        ORDER BY p.start, p.id
+                    )
+                    FROM {Performance._meta.db_table} p
+                    WHERE p.event_id = e.id
+                ), '[]'::json)
+            )::text
+            FROM {Event._meta.db_table} e
+            WHERE e.id = %(event_id)s
+            """,
+            params,
+        )
+        row = cursor.fetchone()
+    if row is None:
+        return None
+    # Escaped like by the renderer, they end JavaScript string literals.
+    document = row[0].replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+    return document.encode()
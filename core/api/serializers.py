@@ -2,12 +2,63 @@
 Core module API serializers.
 """
 
+from django.db import IntegrityError, transaction
 from django.db.models import Q
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
-from drf_spectacular.utils import extend_schema_field
+from rest_framework.relations import MANY_RELATION_KWARGS
+from drf_spectacular.utils import extend_schema_field, OpenApiTypes
 
 from .. import models
+from ..cache import get_artist_ids, invalidate_events, invalidate_performances
+from ..helpers import is_parquet_available
+
+
+class ArtistManyRelatedField(serializers.ManyRelatedField):
+    """
+    Many artists field resolving all names with one cached lookup.
+    """
+
+    default_error_messages = {
+        "does_not_exist": _("Artists do not exist: {names}"),
+    }
+
+    def to_internal_value(self, data):
+        """
+        Resolve artist names to ids.
+
+        Parameters:
+            data (list): Artist names.
+
+        Returns:
+            list: Artist ids in the order of names.
+        """
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        names = [str(name) for name in data]
+        artist_ids = get_artist_ids(names)
+        unknown_names = [name for name in names if name not in artist_ids]
+        if unknown_names:
+            self.fail("does_not_exist", names=", ".join(unknown_names))
+        return [artist_ids[name] for name in names]
+
+
+class ArtistSlugRelatedField(serializers.SlugRelatedField):
+    """
+    Artist slug field, with many=True all names are resolved at once.
+    """
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return ArtistManyRelatedField(**list_kwargs)
 
 
 class PerformanceSerializer(serializers.ModelSerializer):
@@ -17,7 +68,7 @@ class PerformanceSerializer(serializers.ModelSerializer):
         queryset=models.Event.objects.all(),
         write_only=True,
     )
-    artists = serializers.SlugRelatedField(
+    artists = ArtistSlugRelatedField(
         queryset=models.Artist.objects.all(),
         many=True,
         slug_field="name",
@@ -42,9 +93,10 @@ class PerformanceSerializer(serializers.ModelSerializer):
             start = data.get("start", getattr(self.instance, "start", None))
             end = data.get("end", getattr(self.instance, "end", None))
 
-            # Check "end" is not "after" start.
-            if start > end:
-                message = _("The end may not be earlier than the start")
+            # Check "end" is after "start", an empty timeframe would not
+            # overlap any other performance.
+            if start >= end:
+                message = _("The end must be later than the start")
                 raise serializers.ValidationError({"end": message})
 
             # Check new performance are in event timeframe
@@ -55,39 +107,191 @@ class PerformanceSerializer(serializers.ModelSerializer):
 
         return data
 
-    def create(self, validated_data):
-        # Get the event and timeframe data from the validated data.
-        event = validated_data["event"]
-        start = validated_data["start"]
-        end = validated_data["end"]
-
-        # Check if there are any existing performances in the event timeframe.
-        if models.Performance.objects.filter(
-            Q(event=event) & Q(start__lt=end) & Q(end__gt=start)
-        ).exists():
-            # Raise a ValidationError if there are any overlapping performances.
+    def raise_overlap_error(self, exc):
+        """
+        Translate an overlap constraint violation into a validation error.
+
+        Parameters:
+            exc (IntegrityError): Error raised by the database.
+        """
+        if models.PERFORMANCE_OVERLAP_CONSTRAINT_NAME in str(exc):
             message = _("Performance timeframe overlaps with another")
             raise serializers.ValidationError({"start": message, "end": message})
+        raise exc
 
-        return super().create(validated_data)
+    def create(self, validated_data):
+        # Overlapping performances are rejected by the database constraint.
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError as exc:
+            self.raise_overlap_error(exc)
 
     def update(self, instance, validated_data):
-        if any(element in validated_data for element in ["start", "end"]):
-            start = validated_data.get("start", instance.start)
-            end = validated_data.get("end", instance.end)
+        # Overlapping performances are rejected by the database constraint.
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError as exc:
+            self.raise_overlap_error(exc)
+
+
+class PerformanceBulkListSerializer(serializers.ListSerializer):
+    """
+    Performance bulk create list serializer.
+
+    Events and artists of the whole batch are resolved with one query each
+    and overlaps are checked with a sort-and-sweep over the batch and one
+    range query per event.
+    """
+
+    def to_internal_value(self, data):
+        """
+        Validate the batch as a whole after validating every item.
+
+        Parameters:
+            data (list): The data to be validated.
+
+        Returns:
+            list: The validated data with events and artists resolved.
+        """
+        items = super().to_internal_value(data)
+        errors = [{} for _item in items]
+
+        event_ids = {item["event"] for item in items}
+        events = models.Event.objects.in_bulk(event_ids)
+        artist_ids = get_artist_ids(name for item in items for name in item["artists"])
+
+        for item, item_errors in zip(items, errors):
+            event = events.get(item["event"])
+            if event is None:
+                item_errors["event"] = _("Invalid pk - object does not exist.")
+                continue
+            item["event"] = event
+
+            unknown_names = [name for name in item["artists"] if name not in artist_ids]
+            if unknown_names:
+                message = _("Artists do not exist: {names}")
+                item_errors["artists"] = message.format(names=", ".join(unknown_names))
+            # Repeated names would insert duplicate through rows.
+            item["artists"] = list(
+                dict.fromkeys(
+                    artist_ids[name] for name in item["artists"] if name in artist_ids
+                )
+            )
+
+            if event.start > item["start"] or event.end < item["end"]:
+                message = _("Performance timeframe is out of the event timeframe")
+                item_errors.update({"start": message, "end": message})
+
+        if not any(errors):
+            self.find_overlaps(items, errors)
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
 
-            # Check for event performances overlapping other timeframes
-            if (
+        return items
+
+    def find_overlaps(self, items, errors):
+        """
+        Mark items overlapping each other or existing performances.
+
+        Parameters:
+            items (list): Validated items with resolved events.
+            errors (list): Error dicts, updated in place.
+        """
+        message = _("Performance timeframe overlaps with another")
+        by_event = {}
+        for index, item in enumerate(items):
+            by_event.setdefault(item["event"].id, []).append(index)
+
+        for event_id, indexes in by_event.items():
+            indexes.sort(key=lambda index: items[index]["start"])
+            # Existing performances never overlap each other, so ordered by
+            # start they are ordered by end as well.
+            existing = list(
                 models.Performance.objects.filter(
-                    Q(event=instance.event) & Q(start__lt=end) & Q(end__gt=start)
+                    event_id=event_id,
+                    start__lt=max(items[index]["end"] for index in indexes),
+                    end__gt=items[indexes[0]]["start"],
                 )
-                .exclude(id=instance.id)
-                .exists()
-            ):
-                message = _("Performance timeframe overlaps with another")
-                raise serializers.ValidationError({"start": message, "end": message})
+                .order_by("start")
+                .values_list("start", "end")
+            )
 
-        return super().update(instance, validated_data)
+            batch_end = None
+            position = 0
+            for index in indexes:
+                start, end = items[index]["start"], items[index]["end"]
+                while position < len(existing) and existing[position][1] <= start:
+                    position += 1
+                overlaps_batch = batch_end is not None and start < batch_end
+                overlaps_existing = (
+                    position < len(existing) and existing[position][0] < end
+                )
+                if overlaps_batch or overlaps_existing:
+                    errors[index].update({"start": message, "end": message})
+                batch_end = end if batch_end is None else max(batch_end, end)
+
+    def create(self, validated_data):
+        """
+        Create performances and their artists with two bulk inserts.
+
+        Parameters:
+            validated_data (list): Validated items.
+
+        Returns:
+            list: Created performances.
+        """
+        performances = [
+            models.Performance(
+                event=item["event"], start=item["start"], end=item["end"]
+            )
+            for item in validated_data
+        ]
+        through_model = models.Performance.artists.through
+        try:
+            with transaction.atomic():
+                models.Performance.objects.bulk_create(performances)
+                through_model.objects.bulk_create(
+                    through_model(performance_id=performance.id, artist_id=artist_id)
+                    for performance, item in zip(performances, validated_data)
+                    for artist_id in item["artists"]
+                )
+        except IntegrityError as exc:
+            # Performances created concurrently after validation.
+            self.child.raise_overlap_error(exc)
+
+        # bulk_create does not send signals.
+        invalidate_performances()
+        invalidate_events({performance.event_id for performance in performances})
+        return performances
+
+
+class PerformanceBulkCreateSerializer(PerformanceSerializer):
+    """Performance bulk create item serializer."""
+
+    event = serializers.IntegerField(write_only=True)
+    artists = serializers.ListField(child=serializers.CharField())
+
+    class Meta(PerformanceSerializer.Meta):
+        list_serializer_class = PerformanceBulkListSerializer
+
+    def validate(self, data):
+        """
+        Object validation. Validate the timeframe, the batch is validated
+        as a whole by the list serializer.
+
+        Parameters:
+            data (dict): The data to be validated.
+
+        Returns:
+            dict: The validated data.
+        """
+        if data["start"] >= data["end"]:
+            message = _("The end must be later than the start")
+            raise serializers.ValidationError({"end": message})
+        return data
 
 
 class EventSerializer(serializers.ModelSerializer):
@@ -156,14 +360,38 @@ class EventRetrieveSerializer(EventSerializer):
 
     @extend_schema_field(PerformanceSerializer(many=True))
     def get_performances(self, instance):
-        performances = instance.performances.order_by("start")
+        # Use performances prefetched in order, order_by would skip the cache.
+        if "performances" in getattr(instance, "_prefetched_objects_cache", {}):
+            performances = instance.performances.all()
+        else:
+            performances = instance.performances.order_by("start")
         return PerformanceSerializer(performances, many=True).data
 
 
 class WebhookSerializer(serializers.Serializer):
     """Webhook serializer."""
 
+    FORMAT_CHOICES = [
+        ("csv", "CSV"),
+        ("csv.gz", "Gzip compressed CSV"),
+        ("parquet", "Parquet"),
+    ]
+
     webhook_url = serializers.URLField(write_only=True)
+    format = serializers.ChoiceField(
+        choices=FORMAT_CHOICES,
+        default="csv",
+        write_only=True,
+    )
+    since = serializers.DateTimeField(required=False, write_only=True)
+
+    def validate_format(self, value):
+        """
+        Validate the export format dependencies are installed.
+        """
+        if value == "parquet" and not is_parquet_available():
+            raise serializers.ValidationError(_("Parquet export is not available."))
+        return value
 
     def validate(self, data):
         """
@@ -176,3 +404,84 @@ class WebhookSerializer(serializers.Serializer):
                 "Invalid URL format. Must start with 'http://' or 'https://'."
             )
         return data
+
+
+class DownloadSerializer(serializers.Serializer):
+    """Download query parameters serializer."""
+
+    FILE_FORMAT_CHOICES = [
+        ("csv", "CSV"),
+        ("ndjson", "Newline-delimited JSON"),
+    ]
+
+    file_format = serializers.ChoiceField(choices=FILE_FORMAT_CHOICES, default="csv")
+
+
+class PerformanceFilterSerializer(serializers.Serializer):
+    """Performance list query parameters serializer."""
+
+    start_after = serializers.DateTimeField(required=False)
+    end_before = serializers.DateTimeField(required=False)
+    event = serializers.IntegerField(required=False)
+    artist = serializers.CharField(required=False)
+    music_genre = serializers.ChoiceField(
+        choices=models.Artist.MUSIC_GENRE_CHOICES,
+        required=False,
+    )
+
+
+class ExportJobSerializer(serializers.ModelSerializer):
+    """Export job status serializer."""
+
+    file_url = serializers.SerializerMethodField()
+    throughput = serializers.SerializerMethodField()
+    eta = serializers.SerializerMethodField()
+
+    class Meta:
+        model = models.ExportJob
+        fields = (
+            "id",
+            "state",
+            "file_format",
+            "total_rows",
+            "rows_written",
+            "bytes_written",
+            "throughput",
+            "eta",
+            "file_url",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+        )
+        read_only_fields = fields
+
+    def get_elapsed(self, instance):
+        """Get seconds the job has been running for."""
+        if not instance.started_at:
+            return None
+        end = instance.finished_at or timezone.now()
+        return (end - instance.started_at).total_seconds()
+
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_file_url(self, instance):
+        return (instance.payload or {}).get("file_url")
+
+    @extend_schema_field(OpenApiTypes.FLOAT)
+    def get_throughput(self, instance):
+        """Get rows written per second."""
+        elapsed = self.get_elapsed(instance)
+        if not elapsed:
+            return None
+        return round(instance.rows_written / elapsed, 1)
+
+    @extend_schema_field(OpenApiTypes.FLOAT)
+    def get_eta(self, instance):
+        """Get estimated seconds left until all rows are written."""
+        if instance.state != "running" or instance.total_rows is None:
+            return None
+        throughput = self.get_throughput(instance)
+        if not throughput:
+            return None
+        rows_left = max(instance.total_rows - instance.rows_written, 0)
+        return round(rows_left / throughput, 1)
@@ -4,14 +4,25 @@ Core module API urls.
 
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from . import views
+from . import async_views, views
 
 router = DefaultRouter()
 router.register(r"events", views.EventViewSet, basename="events")
 router.register(r"performances", views.PerformanceViewSet, basename="performances")
+router.register(r"exports", views.ExportJobViewSet, basename="exports")
 
 app_name = "core"
 
 urlpatterns = [
     path("", include(router.urls)),
+    path(
+        "async/events/<int:pk>/",
+        async_views.EventRetrieveAsyncView.as_view(),
+        name="async-events-detail",
+    ),
+    path(
+        "async/performances/",
+        async_views.PerformanceListAsyncView.as_view(),
+        name="async-performances-list",
+    ),
 ]
@@ -2,40 +2,197 @@
 Core module API views.
 """
 
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from django.views.decorators.csrf import csrf_exempt
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiTypes
 from rest_framework import (
     mixins,
     viewsets,
     views,
     status,
 )
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.decorators import action
 
-from ..tasks import generate_csv_and_send_task
+from ..cache import (
+    discard_event_version,
+    get_event_cache_key,
+    get_event_version,
+    get_performances_version,
+)
+from ..helpers import iter_queryset, stream_csv, stream_ndjson
+from ..exports import request_export
 from .. import models
 from . import serializers
+from .filters import PerformanceFilterBackend
+from .pagination import StartCursorPagination
+from .readers import (
+    build_performances,
+    get_event_detail,
+    get_event_document,
+    get_performance_rows,
+    use_event_document,
+)
+
+
+class ConditionalGetMixin:
+    """
+    Conditional GET support based on a resource version.
+
+    The version is the timestamp of the last change of the resource,
+    maintained on writes, so unchanged resources are answered with
+    304 Not Modified before any serialization happens. Only the ETag is
+    used, Last-Modified has whole second precision and a change made in the
+    same second as the client's copy would be answered with 304.
+    """
+
+    def get_not_modified_response(self, request, name, version):
+        """
+        Get 304 Not Modified response if the client has the current version.
+
+        Parameters:
+            request (Request): The request.
+            name (str): Resource name used in the ETag.
+            version (float): Resource version.
+
+        Returns:
+            HttpResponse | None: Not modified response or None.
+        """
+        return get_conditional_response(request, etag=quote_etag(f"{name}-{version}"))
+
+    def set_version_headers(self, response, name, version):
+        """
+        Set the ETag header of a response.
+
+        Parameters:
+            response (Response): The response.
+            name (str): Resource name used in the ETag.
+            version (float): Resource version.
+
+        Returns:
+            Response: The response.
+        """
+        response["ETag"] = quote_etag(f"{name}-{version}")
+        return response
+
+
+class StreamingDownloadMixin:
+    """
+    Streaming download of all objects as CSV or newline-delimited JSON.
+
+    Rows are read from a server-side cursor and written to the response as
+    they arrive, the body is never buffered in memory or on disk.
+    """
+
+    download_fields = ()
+    download_content_types = {
+        "csv": "text/csv",
+        "ndjson": "application/x-ndjson",
+    }
+    download_streams = {
+        "csv": stream_csv,
+        "ndjson": stream_ndjson,
+    }
+
+    @extend_schema(
+        parameters=[serializers.DownloadSerializer],
+        responses={200: OpenApiTypes.BINARY},
+    )
+    @action(detail=False, methods=["GET"], url_path="download")
+    def download(self, request):
+        """
+        Download objects as a file.
+        """
+        serializer = serializers.DownloadSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        file_format = serializer.validated_data["file_format"]
+
+        queryset = (
+            self.filter_queryset(self.get_queryset())
+            .prefetch_related(None)
+            .order_by("pk")
+            .values_list(*self.download_fields)
+        )
+        stream = self.download_streams[file_format]
+        file_name = f"{queryset.model._meta.model_name}.{file_format}"
+
+        response = StreamingHttpResponse(
+            stream(self.download_fields, iter_queryset(queryset)),
+            content_type=self.download_content_types[file_format],
+        )
+        response["Content-Disposition"] = f'attachment; filename="{file_name}"'
+        return response
 
 
 class EventViewSet(
+    ConditionalGetMixin,
+    StreamingDownloadMixin,
+    mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
     mixins.UpdateModelMixin,
     viewsets.GenericViewSet,
 ):
-    """Event create, update, retrive API viewset"""
+    """Event create, update, list, retrive API viewset"""
 
     queryset = models.Event.objects.all()
     serializer_class = serializers.EventSerializer
+    pagination_class = StartCursorPagination
+    download_fields = ("id", "name", "start", "end")
+    # Maximum number of queries per action, checked by the instrumentation
+    # middleware and the test suite.
+    query_budget = {
+        "list": 1,
+        "retrieve": 2,
+        "create": 2,
+        "update": 3,
+        "partial_update": 3,
+        "download": 1,
+        "initiate_export_csv": 9,
+    }
 
-    def get_queryset(self):
-        match self.action:
-            case "retrieve":
-                return models.Event.objects.prefetch_related(
-                    "performances", "performances__artists"
-                ).all()
-            case _:
-                return self.queryset
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieve event with performances, the payload is cached until the
+        event, its performances or their artists change.
+        """
+        try:
+            event_id = int(self.kwargs[self.lookup_field])
+        except ValueError:
+            raise NotFound()
+
+        # The database built JSON document skips the renderer, it is used
+        # only when JSON is requested. Its bytes differ from the rendered
+        # data, so it is cached and tagged separately.
+        use_document = (
+            use_event_document() and request.accepted_renderer.format == "json"
+        )
+        # The version is read before the data, a change made meanwhile
+        # bumps it and the payload cached here is never read.
+        version = get_event_version(event_id)
+        name = f"event-{event_id}-document" if use_document else f"event-{event_id}"
+        response = self.get_not_modified_response(request, name, version)
+        if response is not None:
+            return response
+
+        cache_key = get_event_cache_key(event_id, version, document=use_document)
+        data = cache.get(cache_key)
+        if data is None:
+            data = (get_event_document if use_document else get_event_detail)(event_id)
+            if data is None:
+                discard_event_version(event_id)
+                raise NotFound()
+            cache.set(cache_key, data, settings.EVENT_RETRIEVE_CACHE_TIMEOUT)
+        if use_document:
+            response = HttpResponse(data, content_type="application/json")
+        else:
+            response = Response(data)
+        return self.set_version_headers(response, name, version)
 
     def get_serializer_class(self):
         match self.action:
@@ -50,24 +207,110 @@ class EventViewSet(
     def initiate_export_csv(self, request):
         """
         Initiate export events to csv file.
+
+        With "since" only events updated after that time are exported and
+        events deleted after it are reported in the webhook payload. The
+        returned job id can be used to follow the export progress.
         """
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         webhook_url = serializer.validated_data["webhook_url"]
+        file_format = serializer.validated_data["format"]
+        since = serializer.validated_data.get("since")
 
-        queryset = self.get_queryset()
-        serializer = self.serializer_class(queryset, many=True)
-        data = serializer.data
+        # Only the export specification is sent to the broker, the worker
+        # reads and serializes the data itself. Identical concurrent
+        # requests share one export job.
+        export_spec = {
+            "model": models.Event._meta.label,
+            "filters": {},
+            "fields": list(self.serializer_class.Meta.fields),
+        }
+        if since:
+            export_spec["since"] = since.isoformat()
 
-        generate_csv_and_send_task.delay(webhook_url, "event", data)
+        job = request_export(webhook_url, "event", export_spec, file_format)
 
         return Response(
-            {"status": "CSV export process initiated."}, status=status.HTTP_200_OK
+            {"status": "CSV export process initiated.", "job_id": job.id},
+            status=status.HTTP_200_OK,
         )
 
 
-class PerformanceViewSet(viewsets.ModelViewSet):
+@extend_schema_view(
+    list=extend_schema(parameters=[serializers.PerformanceFilterSerializer]),
+    download=extend_schema(
+        parameters=[
+            serializers.DownloadSerializer,
+            serializers.PerformanceFilterSerializer,
+        ],
+        responses={200: OpenApiTypes.BINARY},
+    ),
+)
+class PerformanceViewSet(
+    ConditionalGetMixin,
+    StreamingDownloadMixin,
+    viewsets.ModelViewSet,
+):
     """Performance API vie wset"""
 
     queryset = models.Performance.objects.prefetch_related("artists").all()
     serializer_class = serializers.PerformanceSerializer
+    pagination_class = StartCursorPagination
+    filter_backends = [PerformanceFilterBackend]
+    query_budget = {
+        "list": 1,
+        "retrieve": 2,
+        "create": 9,
+        "update": 7,
+        "partial_update": 7,
+        "destroy": 5,
+        "download": 1,
+        "bulk_create": 9,
+    }
+    download_fields = ("id", "event", "start", "end")
+
+    def list(self, request, *args, **kwargs):
+        """
+        List performances, answered with 304 Not Modified when no
+        performance changed since the client's copy.
+        """
+        version = get_performances_version()
+        response = self.get_not_modified_response(request, "performances", version)
+        if response is not None:
+            return response
+
+        # Read-only rows, the serializer field tree is not needed.
+        queryset = get_performance_rows(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        response = self.get_paginated_response(build_performances(page))
+        return self.set_version_headers(response, "performances", version)
+
+    @extend_schema(
+        request=serializers.PerformanceBulkCreateSerializer(many=True),
+        responses={201: serializers.PerformanceSerializer(many=True)},
+    )
+    @action(detail=False, methods=["POST"], url_path="bulk")
+    def bulk_create(self, request):
+        """
+        Create many performances in a single transaction.
+        """
+        serializer = serializers.PerformanceBulkCreateSerializer(
+            data=request.data, many=True
+        )
+        serializer.is_valid(raise_exception=True)
+        performances = serializer.save()
+
+        queryset = self.get_queryset().filter(
+            id__in=[performance.id for performance in performances]
+        )
+        serializer = self.get_serializer(queryset.order_by("id"), many=True)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class ExportJobViewSet(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    """Export job status view set."""
+
+    queryset = models.ExportJob.objects.all()
+    serializer_class = serializers.ExportJobSerializer
+    query_budget = {"retrieve": 1}
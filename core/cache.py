@@ -0,0 +1,188 @@
+"""
+Core module cache.
+
+Every cached resource has a version, the time of its last change. Writes
+bump the version once their transaction commits, so cached payloads stored
+under an older version are never read again and clients can revalidate
+with ETag.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from . import models
+
+PERFORMANCES_VERSION_KEY = "core:performances:version"
+
+
+def get_event_version_key(event_id):
+    """
+    Get the cache key of an event version.
+
+    Args:
+        event_id (int): Event id.
+
+    Returns:
+        str: Cache key.
+    """
+    return f"core:event:{event_id}:version"
+
+
+def get_event_cache_key(event_id, version, document=False):
+    """
+    Get the cache key of an event detail payload.
+
+    Args:
+        event_id (int): Event id.
+        version (float): Event version.
+        document (bool): Whether the payload is the JSON document built by
+            the database instead of the response data.
+
+    Returns:
+        str: Cache key.
+    """
+    if document:
+        return f"core:event:{event_id}:{version}:document"
+    return f"core:event:{event_id}:{version}"
+
+
+def get_version(key):
+    """
+    Get a resource version, a missing version is started at the current time.
+
+    Args:
+        key (str): Version cache key.
+
+    Returns:
+        float: Timestamp of the last change.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time(), settings.CACHE_VERSION_TIMEOUT)
+        version = cache.get(key)
+    return version
+
+
+def bump_versions(keys):
+    """
+    Mark resources as changed when the current transaction commits.
+
+    A version bumped before the commit could be read by a concurrent request
+    that still sees the old rows and caches them under the new version.
+
+    Args:
+        keys (list): Version cache keys.
+    """
+    if keys:
+        transaction.on_commit(
+            lambda: cache.set_many(
+                dict.fromkeys(keys, time.time()), settings.CACHE_VERSION_TIMEOUT
+            )
+        )
+
+
+def get_event_version(event_id):
+    """Get the version of an event detail payload."""
+    return get_version(get_event_version_key(event_id))
+
+
+def discard_event_version(event_id):
+    """
+    Remove the version of a missing event.
+
+    A version is started for every requested id, ids of events that do not
+    exist must not keep keys in the cache. A discarded version is started
+    again at a later time, so it is always safe.
+
+    Args:
+        event_id (int): Event id.
+    """
+    cache.delete(get_event_version_key(event_id))
+
+
+def get_performances_version():
+    """Get the version of the performance list."""
+    return get_version(PERFORMANCES_VERSION_KEY)
+
+
+def invalidate_events(event_ids):
+    """
+    Mark event detail payloads as changed.
+
+    Args:
+        event_ids (Iterable): Ids of changed events, None values are ignored.
+    """
+    bump_versions(
+        [get_event_version_key(event_id) for event_id in event_ids if event_id]
+    )
+
+
+def invalidate_performances():
+    """Mark the performance list as changed."""
+    bump_versions([PERFORMANCES_VERSION_KEY])
+
+
+def get_artist_id_key(name):
+    """
+    Get the cache key of an artist id.
+
+    Args:
+        name (str): Artist name.
+
+    Returns:
+        str: Cache key, the name is hashed to keep the key valid.
+    """
+    return f"core:artist-id:{hashlib.md5(name.encode()).hexdigest()}"
+
+
+def get_artist_ids(names):
+    """
+    Resolve artist names to ids.
+
+    Cached ids are read with a single cache call, the rest is fetched with
+    a single query and cached.
+
+    Args:
+        names (Iterable): Artist names.
+
+    Returns:
+        dict: Mapping of name to id, unknown names are missing.
+    """
+    keys = {name: get_artist_id_key(name) for name in set(names)}
+    cached = cache.get_many(keys.values())
+    artist_ids = {name: cached[key] for name, key in keys.items() if key in cached}
+
+    missing_names = keys.keys() - artist_ids.keys()
+    if missing_names:
+        fetched = dict(
+            models.Artist.objects.filter(name__in=missing_names).values_list(
+                "name", "id"
+            )
+        )
+        cache.set_many(
+            {keys[name]: artist_id for name, artist_id in fetched.items()},
+            settings.ARTIST_ID_CACHE_TIMEOUT,
+        )
+        artist_ids.update(fetched)
+
+    return artist_ids
+
+
+def invalidate_artist_names(names):
+    """
+    Remove cached ids of artist names when the current transaction commits.
+
+    Removed before the commit, an old id could be cached again by a
+    concurrent request and used for an hour, e.g. of an already deleted
+    artist.
+
+    Args:
+        names (Iterable): Artist names, None values are ignored.
+    """
+    keys = [get_artist_id_key(name) for name in names if name]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
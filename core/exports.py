@@ -0,0 +1,144 @@
+"""
+Core module export jobs.
+
+Exports are deduplicated: requests for the same data subscribe to one job
+and a recently finished file is reused instead of being generated again.
+Active jobs not finished in EXPORT_JOB_STALE_TIMEOUT, e.g. after a worker
+crash, are failed, so they do not hold their key forever.
+"""
+
+import hashlib
+import json
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .helpers import get_data_version
+from .models import EXPORT_JOB_ACTIVE_STATES, ExportJob
+from .tasks import fail_export_job, run_export_job_task
+from .webhooks import notify_export_subscriptions
+
+
+def get_export_job_key(export_spec, file_format, data_version):
+    """
+    Get the key of the export job producing a file.
+
+    Parameters:
+        export_spec (dict): Export specification.
+        file_format (str): Export file format.
+        data_version (str): Version of the exported data.
+
+    Returns:
+        str: Hex digest identifying the export file content.
+    """
+    key = json.dumps(
+        {
+            "export_spec": export_spec,
+            "file_format": file_format,
+            "data_version": data_version,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def is_stale_export_job(job):
+    """
+    Check whether an active export job is not expected to finish any more.
+
+    Parameters:
+        job (ExportJob): Active export job.
+
+    Returns:
+        bool: True if the job was queued or started too long ago.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.EXPORT_JOB_STALE_TIMEOUT)
+    return (job.started_at or job.created_at) < cutoff
+
+
+def get_reusable_export_job(key):
+    """
+    Get the active or still fresh finished export job with the given key.
+
+    A stale active job is failed, its subscribers are notified and a new
+    job has to be created. Must be called in a transaction, the job row
+    is locked.
+
+    Parameters:
+        key (str): Export job key.
+
+    Returns:
+        ExportJob | None: Reusable export job.
+    """
+    fresh = timezone.now() - timedelta(seconds=settings.EXPORT_JOB_REUSE_TIMEOUT)
+    job = (
+        ExportJob.objects.select_for_update()
+        .filter(key=key)
+        .filter(
+            Q(state__in=EXPORT_JOB_ACTIVE_STATES)
+            | Q(state="succeeded", finished_at__gte=fresh)
+        )
+        .order_by("-created_at")
+        .first()
+    )
+    if job and job.state == "succeeded":
+        file_name = os.path.basename(job.payload["file_url"])
+        if not os.path.exists(os.path.join(settings.MEDIA_ROOT, file_name)):
+            return None
+    elif job and is_stale_export_job(job):
+        fail_export_job(job.id, "Export job did not finish in time.")
+        return None
+    return job
+
+
+def request_export(webhook_url, prefix, export_spec, file_format="csv"):
+    """
+    Subscribe a webhook to the export job of an export specification.
+
+    A new job is queued only if there is no active job for the same data
+    and no fresh finished file to reuse.
+
+    Parameters:
+        webhook_url (str): Webhook notified when the file is ready.
+        prefix (str): The prefix for the file name.
+        export_spec (dict): Export specification, see
+            ``helpers.get_queryset_from_export_spec``.
+        file_format (str): Export file format.
+
+    Returns:
+        ExportJob: Export job the webhook is subscribed to.
+    """
+    data_version = get_data_version(export_spec)
+    key = get_export_job_key(export_spec, file_format, data_version)
+
+    with transaction.atomic():
+        job = get_reusable_export_job(key)
+        created = job is None
+        if created:
+            try:
+                with transaction.atomic():
+                    job = ExportJob.objects.create(
+                        key=key,
+                        prefix=prefix,
+                        export_spec=export_spec,
+                        file_format=file_format,
+                        data_version=data_version,
+                    )
+            except IntegrityError:
+                # A concurrent request created the job first.
+                created = False
+                job = ExportJob.objects.select_for_update().get(
+                    key=key, state__in=EXPORT_JOB_ACTIVE_STATES
+                )
+
+        subscription = job.subscriptions.create(webhook_url=webhook_url)
+        if job.state == "succeeded":
+            notify_export_subscriptions(job, [subscription])
+        elif created:
+            transaction.on_commit(lambda: run_export_job_task.delay(job.id))
+
+    return job
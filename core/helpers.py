@@ -1,10 +1,295 @@
 """Core module helpers."""
 
 import os
+import io
 import csv
+import gzip
+import datetime
+import importlib.util
+import itertools
+import shutil
+import uuid
 
+import orjson
+from django.apps import apps
+from django.db import connections
+from django.db.models import (
+    CharField,
+    DateTimeField,
+    F,
+    Func,
+    Max,
+    TextField,
+    Value,
+    Window,
+)
+from django.db.models.functions import NullIf, RowNumber
 from django.utils import timezone
 from django.conf import settings
+from rest_framework import fields
+
+DATETIME_FIELD = fields.DateTimeField()
+
+
+def iter_batches(iterable, size):
+    """
+    Split an iterable into lists of at most ``size`` elements.
+
+    Args:
+        iterable (Iterable): The iterable to split.
+        size (int): Maximum batch size.
+
+    Yields:
+        list: Consecutive batches of elements.
+    """
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def get_export_file_name(prefix, extension):
+    """
+    Get a unique export file name.
+
+    A random suffix is added to the timestamp, so files generated in the
+    same second do not overwrite each other.
+
+    Args:
+        prefix (str): The prefix for the file name.
+        extension (str): The file extension, without the leading dot.
+
+    Returns:
+        str: The file name.
+    """
+    timestamp = timezone.now().strftime("%Y-%m-%d_%H-%M-%S")
+    return f"{prefix}_{timestamp}_{uuid.uuid4().hex[:8]}.{extension}"
+
+
+def format_value(value):
+    """
+    Format a raw database value the same way the API serializers do.
+
+    Args:
+        value: A value read from the database.
+
+    Returns:
+        The value ready to be written to an export file.
+    """
+    if isinstance(value, datetime.datetime):
+        return DATETIME_FIELD.to_representation(value)
+    return value
+
+
+def get_queryset_from_export_spec(export_spec):
+    """
+    Build a queryset from an export specification.
+
+    Args:
+        export_spec (dict): Export specification with "model" (app label and
+            model name, e.g. "core.Event"), optional "filters" (lookups passed
+            to ``filter()``), "fields" (field names to export) and optional
+            "since" (only rows updated after this datetime are exported).
+
+    Returns:
+        QuerySet: Queryset of field values ordered by primary key.
+    """
+    model = apps.get_model(export_spec["model"])
+    filters = export_spec.get("filters") or {}
+    queryset = model.objects.filter(**filters)
+    if export_spec.get("since"):
+        queryset = queryset.filter(updated_at__gt=export_spec["since"])
+    return queryset.order_by("pk").values_list(*export_spec["fields"])
+
+
+def get_deleted_ids_from_export_spec(export_spec):
+    """
+    Get ids of objects deleted since the export specification watermark.
+
+    Args:
+        export_spec (dict): Export specification, see
+            ``get_queryset_from_export_spec``.
+
+    Returns:
+        list: Ids of deleted objects, empty for full exports.
+    """
+    if not export_spec.get("since"):
+        return []
+    Tombstone = apps.get_model("core.Tombstone")
+    return list(
+        Tombstone.objects.filter(
+            model=apps.get_model(export_spec["model"])._meta.label,
+            deleted_at__gt=export_spec["since"],
+        )
+        .order_by("object_id")
+        .values_list("object_id", flat=True)
+        .distinct()
+    )
+
+
+def get_data_version(export_spec):
+    """
+    Get the version of the data read by an export specification.
+
+    The version changes whenever a row of the exported model is created,
+    updated or deleted, so exports of the same version have the same
+    content.
+
+    Args:
+        export_spec (dict): Export specification, see
+            ``get_queryset_from_export_spec``.
+
+    Returns:
+        str: Last update and last deletion time of the exported model.
+    """
+    model = apps.get_model(export_spec["model"])
+    Tombstone = apps.get_model("core.Tombstone")
+    updated_at = model.objects.aggregate(version=Max("updated_at"))["version"]
+    deleted_at = Tombstone.objects.filter(model=model._meta.label).aggregate(
+        version=Max("deleted_at")
+    )["version"]
+    return "|".join(
+        value.isoformat() if value else "" for value in (updated_at, deleted_at)
+    )
+
+
+def iter_queryset(queryset):
+    """
+    Iterate a queryset using a server-side cursor.
+
+    Rows are fetched in chunks of ``settings.EXPORT_CHUNK_SIZE``, so memory
+    usage does not depend on the number of rows.
+
+    Args:
+        queryset (QuerySet): The queryset to iterate.
+
+    Returns:
+        Iterator: Iterator over queryset rows.
+    """
+    return queryset.iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+
+
+class Echo:
+    """File-like object that returns what is written instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(field_names, rows):
+    """
+    Stream rows as CSV text.
+
+    Args:
+        field_names (list): Column names written in the header.
+        rows (Iterable): Iterable of value tuples in ``field_names`` order.
+
+    Yields:
+        str: The header followed by CSV lines, one chunk per batch of rows.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(field_names)
+    for batch in iter_batches(rows, settings.EXPORT_CHUNK_SIZE):
+        yield "".join(
+            writer.writerow([format_value(value) for value in row]) for row in batch
+        )
+
+
+def stream_ndjson(field_names, rows):
+    """
+    Stream rows as newline-delimited JSON.
+
+    Args:
+        field_names (list): Keys of every JSON object.
+        rows (Iterable): Iterable of value tuples in ``field_names`` order.
+
+    Yields:
+        bytes: UTF-8 JSON lines, one chunk per batch of rows.
+    """
+    for batch in iter_batches(rows, settings.EXPORT_CHUNK_SIZE):
+        yield b"".join(
+            orjson.dumps(dict(zip(field_names, map(format_value, row)))) + b"\n"
+            for row in batch
+        )
+
+
+class CopyDateTime(Func):
+    """
+    Datetime formatted by PostgreSQL like ``str()`` of an aware UTC datetime.
+
+    E.g. "2024-01-01 10:00:00+00:00", microseconds are added only when they
+    are not zero, so COPY output matches the csv module output.
+    """
+
+    template = (
+        "regexp_replace(to_char(%(expressions)s AT TIME ZONE 'UTC', "
+        "'YYYY-MM-DD HH24:MI:SS.US'), '\\.000000$', '') || '+00:00'"
+    )
+    output_field = TextField()
+
+
+class CRLFRowsFile(io.TextIOBase):
+    """
+    Text file wrapper ending CSV rows with "\r\n" like the csv module.
+
+    COPY always ends rows with "\n". Newlines inside quoted values are kept,
+    the quoting state is tracked across writes.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.quoted = False
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        parts = data.split('"')
+        for index, part in enumerate(parts):
+            if index:
+                # Escaped quotes ("") toggle the state twice.
+                self.quoted = not self.quoted
+            if not self.quoted:
+                parts[index] = part.replace("\n", "\r\n")
+        self.file.write('"'.join(parts))
+        return len(data)
+
+
+def copy_queryset_to_file(queryset, file):
+    """
+    Write queryset rows to a file with PostgreSQL ``COPY ... TO STDOUT``.
+
+    The queryset is compiled to SQL and the rows are formatted as CSV by the
+    database server, which is much faster than formatting them in Python.
+    Values use PostgreSQL text representation, datetimes should be
+    formatted with ``CopyDateTime``.
+
+    Args:
+        queryset (QuerySet): A values queryset, column order is preserved.
+        file: A file object the CSV rows (without a header) are written to.
+    """
+    with connections[queryset.db].cursor() as cursor:
+        sql, params = queryset.query.sql_with_params()
+        query = cursor.mogrify(sql, params).decode()
+        cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv)", file)
+
+
+def get_copy_column(field):
+    """
+    Get the COPY column of a field, formatted like by the csv module.
+
+    Args:
+        field (Field): Model field.
+
+    Returns:
+        str | Expression: Field name or an expression formatting it.
+    """
+    if isinstance(field, DateTimeField):
+        return CopyDateTime(F(field.name))
+    if isinstance(field, (CharField, TextField)):
+        # COPY quotes empty strings to tell them from NULL, the csv module
+        # writes both unquoted.
+        return NullIf(F(field.name), Value(""))
+    return field.name
 
 
 def generate_csv_from_queryset(queryset):
@@ -12,7 +297,8 @@ def generate_csv_from_queryset(queryset):
     Create CSV file from queryset.
 
     This function generates a CSV file with the data from the queryset.
-    The file is saved in the MEDIA_ROOT directory with a timestamp in its name.
+    The file is saved in the MEDIA_ROOT directory with a timestamp and
+    a random suffix in its name.
 
     Args:
         queryset (QuerySet): A Django queryset to generate CSV from.
@@ -20,9 +306,7 @@ def generate_csv_from_queryset(queryset):
     Returns:
         str: Path to the generated CSV file.
     """
-    timestamp = timezone.now().strftime("%Y-%m-%d_%H-%M-%S")
-    model_name = queryset.model._meta.model_name
-    file_name = f"{model_name}_{timestamp}.csv"
+    file_name = get_export_file_name(queryset.model._meta.model_name, "csv")
     file_root = os.path.join(settings.MEDIA_ROOT, file_name)
     file_url = os.path.join(settings.MEDIA_URL, file_name)
     field_names = [field.name for field in queryset.model._meta.concrete_fields]
@@ -30,11 +314,22 @@ def generate_csv_from_queryset(queryset):
     if not os.path.exists(settings.MEDIA_ROOT):
         os.mkdir(settings.MEDIA_ROOT)
 
-    with open(file_root, "w", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=field_names)
-        writer.writeheader()
-        data = queryset.values(*field_names)
-        writer.writerows(data)
+    with open(file_root, "w", encoding="utf-8", newline="") as csvfile:
+        # Fast path, PostgreSQL formats the rows itself. The output is
+        # normalised to the csv module one, so both paths write the same bytes.
+        if connections[queryset.db].vendor == "postgresql":
+            writer = csv.writer(csvfile)
+            writer.writerow(field_names)
+            columns = [
+                get_copy_column(field) for field in queryset.model._meta.concrete_fields
+            ]
+            copy_queryset_to_file(queryset.values_list(*columns), CRLFRowsFile(csvfile))
+        else:
+            writer = csv.DictWriter(csvfile, fieldnames=field_names)
+            writer.writeheader()
+            data = iter_queryset(queryset.values(*field_names))
+            for batch in iter_batches(data, settings.EXPORT_CHUNK_SIZE):
+                writer.writerows(batch)
 
     return file_url
 
@@ -50,8 +345,7 @@ def generate_csv_from_serialized_data(prefix, data):
     Returns:
         str: The file url of the generated CSV file.
     """
-    timestamp = timezone.now().strftime("%Y-%m-%d_%H-%M-%S")
-    file_name = f"{prefix}_{timestamp}.csv"
+    file_name = get_export_file_name(prefix, "csv")
     file_root = os.path.join(settings.MEDIA_ROOT, file_name)
     file_url = os.path.join(settings.MEDIA_URL, file_name)
     field_names = data[0].keys() if len(data) else []
@@ -65,3 +359,253 @@ def generate_csv_from_serialized_data(prefix, data):
         writer.writerows(data)
 
     return file_url
+
+
+def write_csv_rows(csvfile, field_names, rows, progress=None, header=True):
+    """
+    Write a header and rows to a CSV file in batches.
+
+    Args:
+        csvfile: A text file object.
+        field_names (list): Column names written in the header.
+        rows (Iterable): Iterable of value tuples in ``field_names`` order.
+        progress (Callable, optional): Called with the number of rows of
+            every written batch.
+        header (bool): Whether to write the header, False for all but the
+            first part of a partitioned export.
+    """
+    writer = csv.writer(csvfile)
+    if header:
+        writer.writerow(field_names)
+    for batch in iter_batches(rows, settings.EXPORT_CHUNK_SIZE):
+        writer.writerows([format_value(value) for value in row] for row in batch)
+        if progress:
+            progress(len(batch))
+
+
+def write_csv_file(file_root, model, field_names, rows, progress=None, header=True):
+    """Write rows to a CSV file."""
+    with open(file_root, "w", encoding="utf-8") as csvfile:
+        write_csv_rows(csvfile, field_names, rows, progress, header)
+
+
+def write_csv_gz_file(file_root, model, field_names, rows, progress=None, header=True):
+    """Write rows to a gzip compressed CSV file."""
+    with gzip.open(file_root, "wt", encoding="utf-8") as csvfile:
+        write_csv_rows(csvfile, field_names, rows, progress, header)
+
+
+def get_arrow_type(field):
+    """
+    Get the Arrow data type matching a model field.
+
+    Args:
+        field (Field): Model field.
+
+    Returns:
+        pyarrow.DataType: Arrow data type, string for unknown field types.
+    """
+    import pyarrow
+
+    match field.get_internal_type():
+        case "AutoField" | "BigAutoField" | "IntegerField" | "BigIntegerField":
+            return pyarrow.int64()
+        case "ForeignKey":
+            return pyarrow.int64()
+        case "BooleanField":
+            return pyarrow.bool_()
+        case "DateTimeField":
+            return pyarrow.timestamp("us", tz="UTC")
+        case _:
+            return pyarrow.string()
+
+
+def write_parquet_file(file_root, model, field_names, rows, progress=None, header=True):
+    """
+    Write rows to a Parquet file.
+
+    Values keep their native types and every batch of rows is written
+    as a separate row group. The schema is always written, ``header`` is
+    accepted for compatibility with the CSV writers.
+    """
+    import pyarrow
+    import pyarrow.parquet
+
+    schema = pyarrow.schema(
+        [(name, get_arrow_type(model._meta.get_field(name))) for name in field_names]
+    )
+    with pyarrow.parquet.ParquetWriter(file_root, schema) as writer:
+        for batch in iter_batches(rows, settings.EXPORT_CHUNK_SIZE):
+            columns = zip(*batch)
+            arrays = [
+                pyarrow.array(column, type=field.type)
+                for column, field in zip(columns, schema)
+            ]
+            writer.write_table(pyarrow.Table.from_arrays(arrays, schema=schema))
+            if progress:
+                progress(len(batch))
+
+
+def is_parquet_available():
+    """Check whether the optional Parquet dependency (pyarrow) is installed."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+EXPORT_FILE_WRITERS = {
+    "csv": write_csv_file,
+    "csv.gz": write_csv_gz_file,
+    "parquet": write_parquet_file,
+}
+
+
+def write_export_file(file_root, export_spec, file_format, progress=None, header=True):
+    """
+    Write the rows of an export specification to a file.
+
+    Args:
+        file_root (str): Path of the written file.
+        export_spec (dict): Export specification, see
+            ``get_queryset_from_export_spec``.
+        file_format (str): One of ``EXPORT_FILE_WRITERS`` keys.
+        progress (Callable, optional): Called after every written batch
+            with the number of rows and bytes written so far. Bytes still
+            buffered by the writer are not counted until flushed.
+        header (bool): Whether to write the CSV header.
+    """
+    queryset = get_queryset_from_export_spec(export_spec)
+    write_file = EXPORT_FILE_WRITERS[file_format]
+    rows_written = 0
+
+    def report_batch(rows):
+        nonlocal rows_written
+        rows_written += rows
+        progress(rows_written, os.path.getsize(file_root))
+
+    write_file(
+        file_root,
+        queryset.model,
+        export_spec["fields"],
+        iter_queryset(queryset),
+        report_batch if progress else None,
+        header,
+    )
+    if progress:
+        progress(rows_written, os.path.getsize(file_root))
+
+
+def generate_file_from_export_spec(
+    prefix, export_spec, file_format="csv", progress=None
+):
+    """
+    Generate an export file from an export specification.
+
+    The data is read from the database by the caller (e.g. a Celery worker),
+    so only the lightweight specification has to be passed around.
+
+    Args:
+        prefix (str): The prefix for the file name.
+        export_spec (dict): Export specification, see
+            ``get_queryset_from_export_spec``.
+        file_format (str): One of ``EXPORT_FILE_WRITERS`` keys.
+        progress (Callable, optional): See ``write_export_file``.
+
+    Returns:
+        str: The file url of the generated file.
+    """
+    file_name = get_export_file_name(prefix, file_format)
+    file_root = os.path.join(settings.MEDIA_ROOT, file_name)
+    file_url = os.path.join(settings.MEDIA_URL, file_name)
+
+    if not os.path.exists(settings.MEDIA_ROOT):
+        os.mkdir(settings.MEDIA_ROOT)
+
+    write_export_file(file_root, export_spec, file_format, progress)
+
+    return file_url
+
+
+def get_pk_partitions(queryset, total_rows, partitions):
+    """
+    Split a queryset into primary key ranges with similar numbers of rows.
+
+    Args:
+        queryset (QuerySet): The queryset to split.
+        total_rows (int): Number of rows of the queryset.
+        partitions (int): Maximum number of ranges.
+
+    Returns:
+        list: ``(low, high)`` tuples, rows with ``low <= pk < high`` belong
+        to the range. ``None`` means the range is open on that side.
+    """
+    partitions = max(min(partitions, total_rows), 1)
+    # Row numbers of the first rows of all but the first range, all
+    # boundaries are read with one scan of the primary keys instead of an
+    # OFFSET scan per boundary.
+    row_numbers = [
+        total_rows * index // partitions + 1 for index in range(1, partitions)
+    ]
+    boundaries = []
+    if row_numbers:
+        boundaries = list(
+            queryset.annotate(row_number=Window(RowNumber(), order_by=F("pk").asc()))
+            .filter(row_number__in=row_numbers)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+    return list(zip([None, *boundaries], [*boundaries, None]))
+
+
+def get_partition_export_spec(export_spec, low, high):
+    """
+    Get the export specification of a primary key range.
+
+    Args:
+        export_spec (dict): Export specification.
+        low (int | None): Inclusive lower primary key bound.
+        high (int | None): Exclusive upper primary key bound.
+
+    Returns:
+        dict: Export specification limited to the range.
+    """
+    filters = dict(export_spec.get("filters") or {})
+    if low is not None:
+        filters["pk__gte"] = low
+    if high is not None:
+        filters["pk__lt"] = high
+    return {**export_spec, "filters": filters}
+
+
+def concatenate_parquet_files(file_root, part_roots):
+    """Rewrite the row groups of Parquet files into a single file."""
+    import pyarrow.parquet
+
+    schema = pyarrow.parquet.read_schema(part_roots[0])
+    with pyarrow.parquet.ParquetWriter(file_root, schema) as writer:
+        for part_root in part_roots:
+            part = pyarrow.parquet.ParquetFile(part_root)
+            for index in range(part.num_row_groups):
+                writer.write_table(part.read_row_group(index))
+
+
+def concatenate_export_parts(file_root, part_roots, file_format):
+    """
+    Concatenate the part files of a partitioned export and remove them.
+
+    CSV parts are appended as they are, only the first one has a header.
+    Gzip parts are complete gzip members, a file of concatenated members
+    is a valid gzip file, so they are appended without recompression.
+
+    Args:
+        file_root (str): Path of the concatenated file.
+        part_roots (list): Paths of the part files in order.
+        file_format (str): One of ``EXPORT_FILE_WRITERS`` keys.
+    """
+    if file_format == "parquet":
+        concatenate_parquet_files(file_root, part_roots)
+    else:
+        with open(file_root, "wb") as file:
+            for part_root in part_roots:
+                with open(part_root, "rb") as part:
+                    shutil.copyfileobj(part, file)
+    for part_root in part_roots:
+        os.remove(part_root)
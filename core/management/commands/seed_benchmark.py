@@ -0,0 +1,187 @@
+"""
+Seed the database with a large synthetic dataset for benchmarks.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from ...cache import invalidate_artist_names, invalidate_events, invalidate_performances
+from ...models import Artist, Event, Performance, Tombstone
+
+# Names of seeded rows start with this marker, so they can be removed. It has
+# no LIKE wildcards and is not expected in names of real rows.
+NAME_PREFIX = "[seed-benchmark] "
+
+GENRES = [choice for choice, _label in Artist.MUSIC_GENRE_CHOICES]
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk create benchmark events, performances and artists. "
+        "The same --seed always generates the same dataset."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=100_000)
+        parser.add_argument("--performances-per-event", type=int, default=20)
+        parser.add_argument("--artists", type=int, default=50_000)
+        parser.add_argument("--artists-per-performance", type=int, default=3)
+        parser.add_argument("--batch-size", type=int, default=5_000)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Remove previously seeded rows first.",
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        batch_size = options["batch_size"]
+
+        if options["clear"]:
+            self.clear()
+
+        artist_ids = self.create_artists(rng, options["artists"], batch_size)
+        # UTC, time arithmetic across DST changes would overlap performances.
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for offset in range(0, options["events"], batch_size):
+            count = min(batch_size, options["events"] - offset)
+            with transaction.atomic():
+                events = self.create_events(rng, start, offset, count, options["seed"])
+                self.create_performances(
+                    rng,
+                    events,
+                    artist_ids,
+                    options["performances_per_event"],
+                    options["artists_per_performance"],
+                    batch_size,
+                )
+            self.stdout.write(f"Events: {offset + count}/{options['events']}")
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        # Bulk created rows do not send the signals invalidating the cache.
+        invalidate_performances()
+        self.stdout.write(self.style.SUCCESS("Benchmark data seeded."))
+
+    def clear(self):
+        """
+        Remove seeded rows with bulk deletes.
+
+        Deletes do not send per-row signals, so tombstones of the deleted
+        events and performances are inserted by the same statements and
+        cached payloads and artist ids are invalidated afterwards.
+        """
+        Through = Performance.artists.through
+        pattern = f"{NAME_PREFIX}%"
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                DELETE FROM {Through._meta.db_table} WHERE performance_id IN (
+                    SELECT p.id FROM {Performance._meta.db_table} p
+                    JOIN {Event._meta.db_table} e ON e.id = p.event_id
+                    WHERE e.name LIKE %s
+                )
+                """,
+                [pattern],
+            )
+            cursor.execute(
+                f"""
+                WITH deleted AS (
+                    DELETE FROM {Performance._meta.db_table} WHERE event_id IN (
+                        SELECT id FROM {Event._meta.db_table} WHERE name LIKE %s
+                    )
+                    RETURNING id
+                )
+                INSERT INTO {Tombstone._meta.db_table} (model, object_id, deleted_at)
+                SELECT %s, id, now() FROM deleted
+                """,
+                [pattern, Performance._meta.label],
+            )
+            cursor.execute(
+                f"""
+                WITH deleted AS (
+                    DELETE FROM {Event._meta.db_table} WHERE name LIKE %s
+                    RETURNING id
+                )
+                INSERT INTO {Tombstone._meta.db_table} (model, object_id, deleted_at)
+                SELECT %s, id, now() FROM deleted
+                RETURNING object_id
+                """,
+                [pattern, Event._meta.label],
+            )
+            invalidate_events([event_id for (event_id,) in cursor.fetchall()])
+            cursor.execute(
+                f"""
+                DELETE FROM {Artist._meta.db_table} a WHERE a.name LIKE %s
+                AND NOT EXISTS (
+                    SELECT 1 FROM {Through._meta.db_table} t WHERE t.artist_id = a.id
+                )
+                RETURNING a.name
+                """,
+                [pattern],
+            )
+            invalidate_artist_names([name for (name,) in cursor.fetchall()])
+            invalidate_performances()
+
+    def create_artists(self, rng, count, batch_size):
+        """Create artists, existing seeded artists are reused."""
+        artists = [
+            Artist(name=f"{NAME_PREFIX}Artist {index}", music_genre=rng.choice(GENRES))
+            for index in range(count)
+        ]
+        Artist.objects.bulk_create(
+            artists, batch_size=batch_size, ignore_conflicts=True
+        )
+        return list(
+            Artist.objects.filter(name__startswith=f"{NAME_PREFIX}Artist ")
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    def create_events(self, rng, start, offset, count, seed):
+        """Create consecutive events lasting one to three days."""
+        events = []
+        for index in range(offset, offset + count):
+            event_start = start + timedelta(hours=index * 6)
+            event_end = event_start + timedelta(days=rng.randint(1, 3))
+            events.append(
+                Event(
+                    name=f"{NAME_PREFIX}Event {seed}-{index}",
+                    start=event_start,
+                    end=event_end,
+                )
+            )
+        return Event.objects.bulk_create(events)
+
+    def create_performances(
+        self, rng, events, artist_ids, per_event, artists_per_performance, batch_size
+    ):
+        """Create non overlapping performances with random artists."""
+        performances = []
+        for event in events:
+            slot = (event.end - event.start) / per_event
+            for index in range(per_event):
+                start = event.start + slot * index
+                duration = slot * rng.uniform(0.5, 1)
+                performances.append(
+                    Performance(event=event, start=start, end=start + duration)
+                )
+        performances = Performance.objects.bulk_create(
+            performances, batch_size=batch_size
+        )
+
+        if not artist_ids:
+            return
+        Through = Performance.artists.through
+        through = [
+            Through(performance_id=performance.id, artist_id=artist_id)
+            for performance in performances
+            for artist_id in rng.sample(
+                artist_ids, min(artists_per_performance, len(artist_ids))
+            )
+        ]
+        Through.objects.bulk_create(through, batch_size=batch_size)
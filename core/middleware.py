@@ -0,0 +1,269 @@
+"""
+Core module middleware.
+
+Opt-in request instrumentation, enabled with the INSTRUMENTATION setting.
+For every API request the number of SQL queries, time spent in the
+database, in the view (serialization included) and in rendering, and the
+response size are measured, sent as a Server-Timing header and added to
+per-endpoint counters.
+
+The middleware supports both WSGI and ASGI, so async views are not
+adapted to run synchronously. Queries are recorded on every connection
+used by the request, also by views running sync code in worker threads.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import Signal, receiver
+
+# Sent with the metrics of every instrumented request.
+request_metrics = Signal()
+
+_metrics = {}
+_metrics_lock = threading.Lock()
+
+# Recorder of the current request, copied to threads running its sync code.
+_current_recorder = ContextVar("current_recorder", default=None)
+
+COUNTERS = ("requests", "queries", "db_time", "app_time", "render_time", "bytes")
+
+
+def get_metrics():
+    """
+    Get the aggregated counters of all instrumented endpoints.
+
+    Returns:
+        dict: Counters by endpoint, times are in milliseconds.
+    """
+    with _metrics_lock:
+        return {endpoint: dict(counters) for endpoint, counters in _metrics.items()}
+
+
+def reset_metrics():
+    """Reset the aggregated counters."""
+    with _metrics_lock:
+        _metrics.clear()
+
+
+def add_metrics(metrics):
+    """Add request metrics to the endpoint counters."""
+    with _metrics_lock:
+        counters = _metrics.setdefault(metrics["endpoint"], dict.fromkeys(COUNTERS, 0))
+        counters["requests"] += 1
+        for name in COUNTERS[1:]:
+            counters[name] += metrics[name]
+
+
+def record_query(execute, sql, params, many, context):
+    """Database execute wrapper passing queries to the current recorder."""
+    recorder = _current_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def install_query_recorder(connection):
+    """Add the ``record_query`` execute wrapper to a connection once."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@receiver(connection_created)
+def install_query_recorder_on_connect(sender, connection, **kwargs):
+    # Connections of new threads, e.g. of sync_to_async under ASGI.
+    install_query_recorder(connection)
+
+
+class QueryRecorder:
+    """Database execute wrapper counting queries and their time."""
+
+    def __init__(self):
+        self.queries = 0
+        self.time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.time += time.perf_counter() - started
+
+    @contextmanager
+    def record(self):
+        """Record queries of the current context on all connections."""
+        for connection in connections.all():
+            install_query_recorder(connection)
+        previous = _current_recorder.get()
+        _current_recorder.set(self)
+        try:
+            yield
+        finally:
+            # Set back instead of reset, streamed content may be read in
+            # another context than the one it was created in.
+            _current_recorder.set(previous)
+
+
+class InstrumentationMiddleware:
+    """
+    Measure API requests handled by DRF views.
+
+    Views may declare ``query_budget``, a mapping of action (or HTTP
+    method for plain API views) to the maximum number of queries, the
+    metrics report whether the budget was exceeded.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+            # Django runs sync hooks of async middleware in a thread.
+            self.process_view = self.aprocess_view
+            self.process_template_response = self.aprocess_template_response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        recorder = QueryRecorder()
+        request._instrumentation = {"recorder": recorder}
+        started = time.perf_counter()
+        with recorder.record():
+            response = self.get_response(request)
+        return self.measure(request, response, recorder, started)
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        request._instrumentation = {"recorder": recorder}
+        started = time.perf_counter()
+        with recorder.record():
+            response = await self.get_response(request)
+        return self.measure(request, response, recorder, started)
+
+    def measure(self, request, response, recorder, started):
+        """Add the Server-Timing header and send the request metrics."""
+        state = request._instrumentation
+        if "endpoint" not in state:
+            return response
+
+        view_time = state.get("view_finished", time.perf_counter()) - started
+        render_time = state.get("render_finished", started + view_time) - (
+            started + view_time
+        )
+        db_time = recorder.time
+        metrics = {
+            "endpoint": state["endpoint"],
+            "budget": state["budget"],
+            "queries": recorder.queries,
+            "db_time": db_time * 1000,
+            "app_time": max(view_time - db_time, 0) * 1000,
+            "render_time": render_time * 1000,
+            "bytes": 0,
+        }
+
+        response["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={metrics["db_time"]:.2f};desc="{recorder.queries} queries"',
+                f'app;dur={metrics["app_time"]:.2f}',
+                f'render;dur={metrics["render_time"]:.2f}',
+            ]
+        )
+
+        if response.streaming:
+            # Rows are read while the response is sent, keep recording.
+            iter_content = (
+                self.aiter_streaming_content
+                if response.is_async
+                else self.iter_streaming_content
+            )
+            response.streaming_content = iter_content(
+                response.streaming_content, recorder, metrics
+            )
+        else:
+            metrics["bytes"] = len(response.content)
+            self.send_metrics(metrics)
+        return response
+
+    def iter_streaming_content(self, content, recorder, metrics):
+        """
+        Yield streamed content, then record its queries and size.
+
+        Metrics are sent also when the client disconnects and the content
+        is not read to the end.
+        """
+        queries, db_time = recorder.queries, recorder.time
+        try:
+            with recorder.record():
+                for chunk in content:
+                    metrics["bytes"] += len(chunk)
+                    yield chunk
+        finally:
+            self.send_streaming_metrics(recorder, metrics, queries, db_time)
+
+    async def aiter_streaming_content(self, content, recorder, metrics):
+        """Async version of ``iter_streaming_content``."""
+        queries, db_time = recorder.queries, recorder.time
+        try:
+            with recorder.record():
+                async for chunk in content:
+                    metrics["bytes"] += len(chunk)
+                    yield chunk
+        finally:
+            self.send_streaming_metrics(recorder, metrics, queries, db_time)
+
+    def send_streaming_metrics(self, recorder, metrics, queries, db_time):
+        """Add queries made while streaming and send the metrics."""
+        metrics["queries"] += recorder.queries - queries
+        metrics["db_time"] += (recorder.time - db_time) * 1000
+        self.send_metrics(metrics)
+
+    def send_metrics(self, metrics):
+        metrics["exceeded"] = (
+            metrics["budget"] is not None and metrics["queries"] > metrics["budget"]
+        )
+        add_metrics(metrics)
+        request_metrics.send(sender=self.__class__, metrics=metrics)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        self.start_view(request, view_func)
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        self.start_view(request, view_func)
+
+    def process_template_response(self, request, response):
+        self.finish_view(request, response)
+        return response
+
+    async def aprocess_template_response(self, request, response):
+        self.finish_view(request, response)
+        return response
+
+    def start_view(self, request, view_func):
+        """Set the endpoint and query budget of the view."""
+        # DRF views set "cls", plain Django class-based views "view_class".
+        view_class = getattr(view_func, "cls", getattr(view_func, "view_class", None))
+        if view_class is None or not hasattr(request, "_instrumentation"):
+            return
+        method = request.method.lower()
+        action = (getattr(view_func, "actions", None) or {}).get(method, method)
+        request._instrumentation.update(
+            endpoint=f"{view_class.__name__}.{action}",
+            budget=getattr(view_class, "query_budget", {}).get(action),
+        )
+
+    def finish_view(self, request, response):
+        """Time the end of the view and of the rendering of its response."""
+        state = getattr(request, "_instrumentation", None)
+        if state is not None and "endpoint" in state:
+            state["view_finished"] = time.perf_counter()
+            response.add_post_render_callback(
+                lambda response: state.update(render_finished=time.perf_counter())
+            )
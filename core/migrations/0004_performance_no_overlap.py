@@ -0,0 +1,42 @@
+# Generated by Django 5.0.4 on 2026-10-18 10:35
+
+import core.models
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_updated_at_tombstone"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="performance",
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(
+                expressions=[
+                    (
+                        core.models.Int8Range(
+                            "event",
+                            "event",
+                            django.contrib.postgres.fields.ranges.RangeBoundary(
+                                inclusive_lower=True, inclusive_upper=True
+                            ),
+                        ),
+                        "&&",
+                    ),
+                    (
+                        core.models.TsTzRange(
+                            "start",
+                            "end",
+                            django.contrib.postgres.fields.ranges.RangeBoundary(),
+                        ),
+                        "&&",
+                    ),
+                ],
+                name="core_performance_no_overlap",
+            ),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.0.4 on 2026-10-18 10:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_performance_no_overlap"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["start", "end"], name="core_event_start_end_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="performance",
+            index=models.Index(
+                fields=["event", "start"],
+                include=("end",),
+                name="core_perf_event_start_idx",
+            ),
+        ),
+        # Only drop the now redundant FK index, AlterField would also
+        # recreate and revalidate the foreign key constraint.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="performance",
+                    name="event",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="performances",
+                        to="core.event",
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    sql='DROP INDEX IF EXISTS "core_performance_event_id_f39f03d4";',
+                    reverse_sql='CREATE INDEX "core_performance_event_id_f39f03d4" ON "core_performance" ("event_id");',
+                ),
+            ],
+        ),
+    ]
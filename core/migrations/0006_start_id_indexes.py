@@ -0,0 +1,21 @@
+# Generated by Django 5.0.4 on 2026-10-18 10:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0005_composite_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(fields=["start", "id"], name="core_event_start_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="performance",
+            index=models.Index(fields=["start", "id"], name="core_perf_start_id_idx"),
+        ),
+    ]
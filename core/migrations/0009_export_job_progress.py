@@ -0,0 +1,33 @@
+# Generated by Django 5.0.4 on 2026-10-18 10:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0008_export_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exportjob",
+            name="bytes_written",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="exportjob",
+            name="rows_written",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="exportjob",
+            name="started_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="exportjob",
+            name="total_rows",
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.0.4 on 2026-10-18 11:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_export_job_progress"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WebhookDeliveryAttempt",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("attempted_at", models.DateTimeField()),
+                ("response_status", models.PositiveIntegerField(blank=True, null=True)),
+                ("error", models.TextField(blank=True)),
+                (
+                    "delivery",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="delivery_attempts",
+                        to="core.webhookdelivery",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -2,8 +2,34 @@
 Core module models.
 """
 
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import (
+    BigIntegerRangeField,
+    DateTimeRangeField,
+    RangeBoundary,
+    RangeOperators,
+)
 from django.db import models
 
+PERFORMANCE_OVERLAP_CONSTRAINT_NAME = "core_performance_no_overlap"
+
+# States of an export job that is still producing its file.
+EXPORT_JOB_ACTIVE_STATES = ["pending", "running"]
+
+
+class Int8Range(models.Func):
+    """PostgreSQL int8range constructor."""
+
+    function = "INT8RANGE"
+    output_field = BigIntegerRangeField()
+
+
+class TsTzRange(models.Func):
+    """PostgreSQL tstzrange constructor."""
+
+    function = "TSTZRANGE"
+    output_field = DateTimeRangeField()
+
 
 class Event(models.Model):
     """Event representation in db."""
@@ -11,6 +37,13 @@ class Event(models.Model):
     name = models.CharField(max_length=150, unique=True)
     start = models.DateTimeField()
     end = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["start", "end"], name="core_event_start_end_idx"),
+            models.Index(fields=["start", "id"], name="core_event_start_id_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -40,7 +73,164 @@ class Performance(models.Model):
         Event,
         on_delete=models.CASCADE,
         related_name="performances",
+        # Covered by the (event, start) index.
+        db_index=False,
     )
     artists = models.ManyToManyField(Artist, related_name="performances")
     start = models.DateTimeField()
     end = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["event", "start"],
+                include=["end"],
+                name="core_perf_event_start_idx",
+            ),
+            models.Index(fields=["start", "id"], name="core_perf_start_id_idx"),
+        ]
+        constraints = [
+            # Performances of the same event may not overlap. The event is
+            # compared as a single-value range, so the GiST index works with
+            # built-in range operator classes and does not need btree_gist.
+            ExclusionConstraint(
+                name=PERFORMANCE_OVERLAP_CONSTRAINT_NAME,
+                expressions=[
+                    (
+                        Int8Range(
+                            "event",
+                            "event",
+                            RangeBoundary(inclusive_lower=True, inclusive_upper=True),
+                        ),
+                        RangeOperators.OVERLAPS,
+                    ),
+                    (
+                        TsTzRange("start", "end", RangeBoundary()),
+                        RangeOperators.OVERLAPS,
+                    ),
+                ],
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # The event the performance was loaded with, the cached payload of
+        # that event is invalidated when the performance is moved.
+        if "event_id" in instance.__dict__:
+            instance._loaded_event_id = instance.event_id
+        return instance
+
+
+class Tombstone(models.Model):
+    """Deleted object representation in db, used by incremental exports."""
+
+    model = models.CharField(max_length=100)
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["model", "deleted_at"])]
+
+    def __str__(self):
+        return f"{self.model} {self.object_id}"
+
+
+class WebhookDelivery(models.Model):
+    """Webhook notification and its delivery attempts representation in db."""
+
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("succeeded", "Succeeded"),
+        ("failed", "Failed"),
+    ]
+
+    url = models.URLField()
+    payload = models.JSONField()
+    status = models.CharField(max_length=9, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveIntegerField(default=0)
+    response_status = models.PositiveIntegerField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_attempt_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.url} {self.status}"
+
+
+class WebhookDeliveryAttempt(models.Model):
+    """Single webhook delivery attempt representation in db."""
+
+    delivery = models.ForeignKey(
+        WebhookDelivery, on_delete=models.CASCADE, related_name="delivery_attempts"
+    )
+    attempted_at = models.DateTimeField()
+    response_status = models.PositiveIntegerField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    def __str__(self):
+        return f"{self.delivery} {self.attempted_at}"
+
+
+class ExportJob(models.Model):
+    """
+    Export file generation representation in db.
+
+    Jobs are keyed by the export specification, file format and data
+    version. Identical requests subscribe to the same job, at most one
+    job per key is active at a time.
+    """
+
+    STATE_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("succeeded", "Succeeded"),
+        ("failed", "Failed"),
+    ]
+
+    key = models.CharField(max_length=64)
+    prefix = models.CharField(max_length=50)
+    export_spec = models.JSONField()
+    file_format = models.CharField(max_length=10)
+    data_version = models.CharField(max_length=100)
+    state = models.CharField(max_length=9, choices=STATE_CHOICES, default="pending")
+    payload = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    total_rows = models.PositiveBigIntegerField(null=True, blank=True)
+    rows_written = models.PositiveBigIntegerField(default=0)
+    bytes_written = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["key", "-created_at"], name="core_exportjob_key_idx")
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["key"],
+                condition=models.Q(state__in=EXPORT_JOB_ACTIVE_STATES),
+                name="core_exportjob_active_key",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.prefix} {self.file_format} {self.state}"
+
+
+class ExportSubscription(models.Model):
+    """Webhook waiting for an export job file representation in db."""
+
+    job = models.ForeignKey(
+        ExportJob, on_delete=models.CASCADE, related_name="subscriptions"
+    )
+    webhook_url = models.URLField()
+    delivery = models.OneToOneField(
+        WebhookDelivery, on_delete=models.SET_NULL, null=True, blank=True
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.webhook_url
@@ -0,0 +1,112 @@
+"""
+Core module signals.
+"""
+
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from . import models
+from .cache import (
+    invalidate_artist_names,
+    invalidate_events,
+    invalidate_performances,
+)
+
+
+@receiver(post_delete, sender=models.Event)
+@receiver(post_delete, sender=models.Performance)
+def create_tombstone(sender, instance, **kwargs):
+    """Record deleted objects so incremental exports can report them."""
+    models.Tombstone.objects.create(model=sender._meta.label, object_id=instance.pk)
+
+
+@receiver(post_save, sender=models.Event)
+@receiver(post_delete, sender=models.Event)
+def invalidate_event(sender, instance, **kwargs):
+    """Invalidate the cached payload of a changed event."""
+    invalidate_events([instance.pk])
+
+
+@receiver(pre_save, sender=models.Performance)
+def store_previous_event(sender, instance, **kwargs):
+    """
+    Remember the event of an updated performance, it may be moved.
+
+    Instances loaded from the database or saved before know the event they
+    were loaded with, only other instances with a primary key are queried.
+    """
+    if hasattr(instance, "_loaded_event_id"):
+        instance._previous_event_id = instance._loaded_event_id
+    elif instance.pk:
+        instance._previous_event_id = (
+            sender.objects.filter(pk=instance.pk)
+            .values_list("event_id", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=models.Performance)
+@receiver(post_delete, sender=models.Performance)
+def invalidate_performance_event(sender, instance, **kwargs):
+    """Invalidate the cached payload of the event of a changed performance."""
+    invalidate_performances()
+    invalidate_events(
+        [instance.event_id, getattr(instance, "_previous_event_id", None)]
+    )
+    instance._loaded_event_id = instance.event_id
+
+
+@receiver(m2m_changed, sender=models.Performance.artists.through)
+def invalidate_performance_artists_events(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """Invalidate events of performances which artists changed."""
+    if action.startswith("post_"):
+        invalidate_performances()
+    if not reverse:
+        if action.startswith("post_"):
+            invalidate_events([instance.event_id])
+        return
+
+    # Changed from the artist side, pk_set holds performance ids.
+    if action in ("post_add", "post_remove"):
+        performances = models.Performance.objects.filter(pk__in=pk_set)
+    elif action == "pre_clear":
+        performances = instance.performances.all()
+    else:
+        return
+    invalidate_events(performances.values_list("event_id", flat=True).distinct())
+
+
+@receiver(post_save, sender=models.Artist)
+@receiver(pre_delete, sender=models.Artist)
+def invalidate_artist_events(sender, instance, **kwargs):
+    """Invalidate events the renamed or deleted artist performs at."""
+    invalidate_performances()
+    invalidate_events(
+        models.Performance.objects.filter(artists=instance)
+        .values_list("event_id", flat=True)
+        .distinct()
+    )
+
+
+@receiver(pre_save, sender=models.Artist)
+def store_previous_name(sender, instance, **kwargs):
+    """Remember the name of an updated artist, it may be renamed."""
+    if instance.pk:
+        instance._previous_name = (
+            sender.objects.filter(pk=instance.pk).values_list("name", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=models.Artist)
+@receiver(post_delete, sender=models.Artist)
+def invalidate_artist_id(sender, instance, **kwargs):
+    """Invalidate cached ids of the current and previous artist name."""
+    invalidate_artist_names([instance.name, getattr(instance, "_previous_name", None)])
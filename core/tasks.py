@@ -1,11 +1,203 @@
-import requests
+import math
+import os
+from datetime import timedelta
 
-from celery import shared_task
-from .helpers import generate_csv_from_serialized_data
+from celery import chord, shared_task
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .helpers import (
+    concatenate_export_parts,
+    get_deleted_ids_from_export_spec,
+    get_export_file_name,
+    get_partition_export_spec,
+    get_pk_partitions,
+    get_queryset_from_export_spec,
+    write_export_file,
+)
+from .models import EXPORT_JOB_ACTIVE_STATES, ExportJob
+from .webhooks import notify_export_subscriptions
+
+
+def fail_export_job(job_id, exc):
+    """
+    Mark an active export job as failed and notify its subscribers.
+
+    A job that is not active any more, e.g. failed by another part of a
+    partitioned export, is left as it is, so subscribers are notified once.
+
+    Parameters:
+        job_id (int): Export job id.
+        exc (Exception | str): Failure reason.
+    """
+    with transaction.atomic():
+        job = (
+            ExportJob.objects.select_for_update()
+            .filter(pk=job_id, state__in=EXPORT_JOB_ACTIVE_STATES)
+            .first()
+        )
+        if job is None:
+            return
+        job.state = "failed"
+        job.error = str(exc)
+        job.payload = {"error": job.error}
+        job.finished_at = timezone.now()
+        job.save(update_fields=["state", "error", "payload", "finished_at"])
+        notify_export_subscriptions(job, job.subscriptions.all())
+
+
+def finish_export_job(job_id, file_name, watermark):
+    """
+    Mark an export job as succeeded and notify its subscribers.
+
+    Parameters:
+        job_id (int): Export job id.
+        file_name (str): Name of the export file in MEDIA_ROOT.
+        watermark (str): Time the export started reading rows at.
+
+    Returns:
+        dict: Webhook payload.
+    """
+    # The lock makes requests subscribing meanwhile wait, they are either
+    # notified here or see the finished job.
+    with transaction.atomic():
+        job = ExportJob.objects.select_for_update().get(pk=job_id)
+        if job.state not in EXPORT_JOB_ACTIVE_STATES:
+            # Failed as stale meanwhile, its subscribers were notified.
+            os.remove(os.path.join(settings.MEDIA_ROOT, file_name))
+            return job.payload
+        job.state = "succeeded"
+        job.payload = {
+            "file_url": os.path.join(settings.MEDIA_URL, file_name),
+            "watermark": watermark,
+            "deleted_ids": get_deleted_ids_from_export_spec(job.export_spec),
+        }
+        job.finished_at = timezone.now()
+        job.save(update_fields=["state", "payload", "finished_at"])
+        notify_export_subscriptions(job, job.subscriptions.all())
+    return job.payload
+
+
+@shared_task
+def run_export_job_task(job_id):
+    started = ExportJob.objects.filter(pk=job_id, state="pending").update(
+        state="running", started_at=timezone.now()
+    )
+    if not started:
+        # Failed as stale before a worker picked it up.
+        return None
+    job = ExportJob.objects.get(pk=job_id)
+
+    def report_progress(rows_written, bytes_written):
+        # One UPDATE per written batch, not per row.
+        ExportJob.objects.filter(pk=job_id).update(
+            rows_written=rows_written, bytes_written=bytes_written
+        )
+
+    try:
+        # Taken before reading any rows, so changes made during the export
+        # are picked up by the next incremental export. updated_at is set
+        # before the writing transaction commits, a row committed after
+        # this export read the table may carry an earlier time, so the
+        # watermark is moved back and such rows are exported again.
+        overlap = timedelta(seconds=settings.EXPORT_WATERMARK_OVERLAP)
+        watermark = (timezone.now() - overlap).isoformat()
+        queryset = get_queryset_from_export_spec(job.export_spec)
+        total_rows = queryset.count()
+        ExportJob.objects.filter(pk=job_id).update(total_rows=total_rows)
+        file_name = get_export_file_name(job.prefix, job.file_format)
+        if not os.path.exists(settings.MEDIA_ROOT):
+            os.mkdir(settings.MEDIA_ROOT)
+
+        partitions = min(
+            math.ceil(total_rows / settings.EXPORT_PARTITION_ROWS),
+            settings.EXPORT_MAX_PARTITIONS,
+        )
+        if partitions > 1:
+            # Parts are written in parallel by the workers and joined by
+            # the chord callback, which also finishes the job.
+            header = [
+                export_partition_task.s(job_id, file_name, index, low, high)
+                for index, (low, high) in enumerate(
+                    get_pk_partitions(queryset, total_rows, partitions)
+                )
+            ]
+            chord(header)(
+                finish_partitioned_export_task.s(job_id, file_name, watermark).on_error(
+                    cleanup_partitioned_export_task.si(job_id, file_name, len(header))
+                )
+            )
+            return None
+
+        write_export_file(
+            os.path.join(settings.MEDIA_ROOT, file_name),
+            job.export_spec,
+            job.file_format,
+            report_progress,
+        )
+    except Exception as exc:
+        fail_export_job(job_id, exc)
+        raise
+
+    return finish_export_job(job_id, file_name, watermark)
+
+
+@shared_task
+def export_partition_task(job_id, file_name, index, low, high):
+    job = ExportJob.objects.get(pk=job_id)
+    part_root = os.path.join(settings.MEDIA_ROOT, f"{file_name}.part{index}")
+    written = {"rows": 0, "bytes": 0}
+
+    def report_progress(rows_written, bytes_written):
+        # Parts run concurrently, so they add their progress to the job.
+        ExportJob.objects.filter(pk=job_id).update(
+            rows_written=F("rows_written") + rows_written - written["rows"],
+            bytes_written=F("bytes_written") + bytes_written - written["bytes"],
+        )
+        written.update(rows=rows_written, bytes=bytes_written)
+
+    try:
+        write_export_file(
+            part_root,
+            get_partition_export_spec(job.export_spec, low, high),
+            job.file_format,
+            report_progress,
+            header=index == 0,
+        )
+    except Exception as exc:
+        fail_export_job(job_id, exc)
+        raise
+    return part_root
+
+
+def remove_export_parts(file_name, partitions):
+    """Remove the part files of a partitioned export that exist."""
+    for index in range(partitions):
+        part_root = os.path.join(settings.MEDIA_ROOT, f"{file_name}.part{index}")
+        if os.path.exists(part_root):
+            os.remove(part_root)
+
+
+@shared_task
+def finish_partitioned_export_task(part_roots, job_id, file_name, watermark):
+    job = ExportJob.objects.get(pk=job_id)
+    file_root = os.path.join(settings.MEDIA_ROOT, file_name)
+    try:
+        concatenate_export_parts(file_root, part_roots, job.file_format)
+    except Exception as exc:
+        remove_export_parts(file_name, len(part_roots))
+        if os.path.exists(file_root):
+            os.remove(file_root)
+        fail_export_job(job_id, exc)
+        raise
+    ExportJob.objects.filter(pk=job_id).update(bytes_written=os.path.getsize(file_root))
+    return finish_export_job(job_id, file_name, watermark)
 
 
 @shared_task
-def generate_csv_and_send_task(webhook_url, csv_prefix, data):
-    path = generate_csv_from_serialized_data(csv_prefix, data)
-    # response = requests.post(webhook_url, json={"csv_url": path})
-    print(f"\n\nRequest to: {webhook_url} sent.\nCSV url: {path}\n\n")
+def cleanup_partitioned_export_task(job_id, file_name, partitions):
+    """Chord error callback, remove the written parts and fail the job."""
+    remove_export_parts(file_name, partitions)
+    fail_export_job(job_id, "A part of the partitioned export failed.")
@@ -2,13 +2,23 @@
 Configuration our tests user module tests.
 """
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
+from ..middleware import request_metrics
+
 from ..models import (
     Event,
     Artist,
+    ExportJob,
     Performance,
+    Tombstone,
+    WebhookDelivery,
 )
 from .factories import (
     EventFactory,
@@ -17,6 +27,48 @@ from .factories import (
 )
 
 
+@pytest.fixture(autouse=True)
+def query_budget(request, settings):
+    """
+    Fixture to instrument every request made by a test and fail the test
+    when an endpoint makes more queries than its declared query budget.
+
+    Collected metrics are available as the fixture value, tests marked
+    with ``no_query_budget`` are not failed.
+    """
+    settings.MIDDLEWARE = [
+        "core.middleware.InstrumentationMiddleware",
+        *settings.MIDDLEWARE,
+    ]
+    collected = []
+
+    def collect(sender, metrics, **kwargs):
+        collected.append(metrics)
+
+    request_metrics.connect(collect)
+    yield collected
+    request_metrics.disconnect(collect)
+
+    if request.node.get_closest_marker("no_query_budget"):
+        return
+    exceeded = [
+        f"{metrics['endpoint']} made {metrics['queries']} queries, "
+        f"budget is {metrics['budget']}"
+        for metrics in collected
+        if metrics["exceeded"]
+    ]
+    if exceeded:
+        pytest.fail("Query budget exceeded:\n" + "\n".join(exceeded))
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Fixture to start every test with an empty cache."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def event_model():
     """Fixture to provide Event model"""
@@ -53,6 +105,59 @@ def performance_factory():
     return PerformanceFactory
 
 
+@pytest.fixture
+def tombstone_model():
+    """Fixture to provide Tombstone model"""
+    return Tombstone
+
+
+@pytest.fixture
+def export_job_model():
+    """Fixture to provide ExportJob model"""
+    return ExportJob
+
+
+@pytest.fixture
+def webhook_delivery_model():
+    """Fixture to provide WebhookDelivery model"""
+    return WebhookDelivery
+
+
+@pytest.fixture
+def webhook_server():
+    """
+    Fixture to provide a local webhook endpoint.
+
+    Responds with the status codes queued in ``server.statuses`` (200 once
+    the queue is empty) and records ``(client port, payload)`` of every
+    request in ``server.received``.
+    """
+
+    class WebhookHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            self.server.received.append((self.client_address[1], json.loads(body)))
+            status = self.server.statuses.pop(0) if self.server.statuses else 200
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), WebhookHandler)
+    server.statuses = []
+    server.received = []
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/webhook"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
@@ -46,11 +46,9 @@ class PerformanceFactory(factory.django.DjangoModelFactory):
         end_date="now",
         tzinfo=timezone.get_current_timezone(),
     )
-    end = factory.Faker(
-        "date_time_between",
-        start_date=start,
-        end_date="+1y",
-        tzinfo=timezone.get_current_timezone(),
+    # The end has to follow the start, the database rejects reversed ranges.
+    end = factory.LazyAttribute(
+        lambda performance: performance.start + timezone.timedelta(hours=1)
     )
 
     class Meta:
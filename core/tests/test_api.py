@@ -1,15 +1,33 @@
 """Core module API tests."""
 
+import csv
+import json
 import pytest
+from unittest import mock
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
 from django.utils import timezone
+from django.utils.http import http_date
 from django.urls import reverse
 
+from rest_framework.renderers import JSONRenderer
+
 from core.api import serializers
+from core.cache import get_event_version_key
 
 EVENT_URL = reverse("core:events-list")
 EVENT_INITIATE_EXPORT_CSV_URL = reverse("core:events-initiate-export-csv")
+EVENT_DOWNLOAD_URL = reverse("core:events-download")
 
 PERFORMANCE_URL = reverse("core:performances-list")
+PERFORMANCE_DOWNLOAD_URL = reverse("core:performances-download")
+PERFORMANCE_BULK_CREATE_URL = reverse("core:performances-bulk-create")
+ASYNC_PERFORMANCE_URL = reverse("core:async-performances-list")
+
+
+def get_async_event_detail_url(event_id):
+    """Get async event detail url."""
+    return reverse("core:async-events-detail", args=[event_id])
 
 
 def get_event_detail_url(event):
@@ -17,6 +35,11 @@ def get_event_detail_url(event):
     return reverse("core:events-detail", args=[event.id])
 
 
+def get_export_detail_url(export_id):
+    """Get export job detail url."""
+    return reverse("core:exports-detail", args=[export_id])
+
+
 def get_performance_detail_url(performance):
     """Get performance detail url."""
     return reverse("core:performances-detail", args=[performance.id])
@@ -41,6 +64,24 @@ class TestPublicEventAPI:
         assert response.data["start"] == payload["start"]
         assert response.data["end"] == payload["end"]
 
+    def test_list_events(self, api_client, event_factory):
+        """Test list events is paginated with a cursor ordered by start."""
+        events = event_factory.create_batch(5)
+        expected = sorted(events, key=lambda event: (event.start, event.id))
+
+        response = api_client.get(EVENT_URL, {"page_size": 3})
+        next_response = api_client.get(response.data["next"])
+
+        assert response.status_code == 200
+        assert next_response.status_code == 200
+        assert next_response.data["next"] is None
+        assert [e["id"] for e in response.data["results"]] == [
+            e.id for e in expected[:3]
+        ]
+        assert [e["id"] for e in next_response.data["results"]] == [
+            e.id for e in expected[3:]
+        ]
+
     def test_update_event(self, api_client, event_factory):
         """Test update event."""
         event = event_factory.create()
@@ -84,6 +125,250 @@ class TestPublicEventAPI:
         assert response.status_code == 200
         assert response.data == serializer.data
 
+    def test_retrieve_event_with_performances(
+        self,
+        api_client,
+        django_assert_num_queries,
+        event_factory,
+        artist_factory,
+        performance_factory,
+    ):
+        """Test retrieve event loads the event tree in a fixed number of queries."""
+        event = event_factory.create()
+        artists = artist_factory.create_batch(3)
+        start = timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0))
+        for hour in reversed(range(5)):
+            performance = performance_factory.create(
+                event=event, start=start + timezone.timedelta(hours=hour)
+            )
+            performance.artists.set(artists)
+        event_detail_url = get_event_detail_url(event)
+
+        # Event and performances with their aggregated artist names.
+        with django_assert_num_queries(2):
+            response = api_client.get(event_detail_url)
+        serializer = serializers.EventRetrieveSerializer(instance=event)
+        performances = response.data["performances"]
+
+        assert response.status_code == 200
+        assert response.data == serializer.data
+        assert [p["start"] for p in performances] == sorted(
+            p["start"] for p in performances
+        )
+        assert all(len(p["artists"]) == 3 for p in performances)
+
+    def test_retrieve_event_cached(
+        self, api_client, django_assert_num_queries, event_factory
+    ):
+        """Test retrieve event is served from cache."""
+        event = event_factory.create()
+        event_detail_url = get_event_detail_url(event)
+
+        first_response = api_client.get(event_detail_url)
+        with django_assert_num_queries(0):
+            response = api_client.get(event_detail_url)
+
+        assert response.status_code == 200
+        assert response.data == first_response.data
+
+    def test_retrieve_event_cache_invalidation(
+        self,
+        api_client,
+        django_capture_on_commit_callbacks,
+        event_factory,
+        artist_factory,
+        performance_factory,
+    ):
+        """Test cached event is invalidated when its tree changes."""
+        event = event_factory.create()
+        artist = artist_factory.create()
+        event_detail_url = get_event_detail_url(event)
+
+        def get_artists():
+            response = api_client.get(event_detail_url)
+            return [p["artists"] for p in response.data["performances"]]
+
+        # Versions are bumped when the writing transaction commits.
+        commit = django_capture_on_commit_callbacks
+
+        assert get_artists() == []
+
+        with commit(execute=True):
+            performance = performance_factory.create(event=event)
+        assert get_artists() == [[]]
+
+        with commit(execute=True):
+            performance.artists.add(artist)
+        assert get_artists() == [[artist.name]]
+
+        artist.name = "RenamedArtist"
+        with commit(execute=True):
+            artist.save()
+        assert get_artists() == [["RenamedArtist"]]
+
+        with commit(execute=True):
+            artist.performances.clear()
+        assert get_artists() == [[]]
+
+        event.name = "RenamedEvent"
+        with commit(execute=True):
+            event.save()
+        assert api_client.get(event_detail_url).data["name"] == "RenamedEvent"
+
+        other_event = event_factory.create()
+        performance.event = other_event
+        with commit(execute=True):
+            performance.save()
+        assert get_artists() == []
+
+    def test_retrieve_event_invalidated_on_commit(
+        self, api_client, django_capture_on_commit_callbacks, event_factory
+    ):
+        """Test cached event is served until the writing transaction commits."""
+        event = event_factory.create()
+        event_detail_url = get_event_detail_url(event)
+        etag = api_client.get(event_detail_url)["ETag"]
+
+        event.name = "RenamedEvent"
+        with django_capture_on_commit_callbacks() as callbacks:
+            event.save()
+            uncommitted_response = api_client.get(event_detail_url)
+        for callback in callbacks:
+            callback()
+        committed_response = api_client.get(event_detail_url)
+
+        assert uncommitted_response["ETag"] == etag
+        assert committed_response["ETag"] != etag
+        assert committed_response.data["name"] == "RenamedEvent"
+
+    def test_retrieve_event_not_modified(
+        self,
+        api_client,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+        event_factory,
+    ):
+        """Test retrieve event honours If-None-Match only."""
+        event = event_factory.create()
+        event_detail_url = get_event_detail_url(event)
+
+        response = api_client.get(event_detail_url)
+        etag = response["ETag"]
+        with django_assert_num_queries(0):
+            not_modified_response = api_client.get(
+                event_detail_url, HTTP_IF_NONE_MATCH=etag
+            )
+        # Whole second dates could not tell apart changes made in a second.
+        if_modified_since_response = api_client.get(
+            event_detail_url, HTTP_IF_MODIFIED_SINCE=http_date()
+        )
+        event.name = "RenamedEvent"
+        with django_capture_on_commit_callbacks(execute=True):
+            event.save()
+        modified_response = api_client.get(event_detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        assert not_modified_response.status_code == 304
+        assert "Last-Modified" not in response
+        assert if_modified_since_response.status_code == 200
+        assert modified_response.status_code == 200
+        assert modified_response["ETag"] != etag
+        assert modified_response.data["name"] == "RenamedEvent"
+
+    def test_retrieve_event_postgres_engine(
+        self,
+        api_client,
+        django_assert_num_queries,
+        settings,
+        event_factory,
+        artist_factory,
+        performance_factory,
+    ):
+        """Test event document built by PostgreSQL is the same as serialized one."""
+        event = event_factory.create(
+            start=timezone.make_aware(timezone.datetime(2024, 3, 30, 12, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 4, 2, 12, 0, 0)),
+        )
+        artists = [
+            artist_factory.create(name=name)
+            for name in ['Zoë "The Voice"', "Ąbc\\def", "abc\u2028"]
+        ]
+        for day in reversed(range(3)):
+            performance = performance_factory.create(
+                event=event,
+                start=event.start + timezone.timedelta(days=day),
+                end=event.start + timezone.timedelta(days=day, hours=2),
+            )
+            performance.artists.set(artists[day:])
+        performance_factory.create(
+            event=event_factory.create(start=event.start, end=event.end)
+        )
+        event_detail_url = get_event_detail_url(event)
+        expected = api_client.get(event_detail_url, HTTP_ACCEPT="application/json")
+        cache.clear()
+
+        settings.EVENT_RETRIEVE_ENGINE = "postgres"
+        with django_assert_num_queries(1):
+            response = api_client.get(event_detail_url, HTTP_ACCEPT="application/json")
+        cached_response = api_client.get(
+            event_detail_url, HTTP_ACCEPT="application/json"
+        )
+        async_response = api_client.get(get_async_event_detail_url(event.id))
+        missing_response = api_client.get("/api/events/0/")
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        # Same keys in the same order, the whitespace differs.
+        assert json.dumps(json.loads(response.content)) == json.dumps(
+            json.loads(expected.content)
+        )
+        assert "\u2028".encode() not in response.content
+        assert cached_response.content == response.content
+        assert async_response.content == response.content
+        assert missing_response.status_code == 404
+
+    def test_retrieve_event_document_per_format(
+        self, api_client, django_assert_num_queries, settings, event_factory
+    ):
+        """Test event document and rendered data are cached and tagged apart."""
+        settings.EVENT_RETRIEVE_ENGINE = "postgres"
+        event_detail_url = get_event_detail_url(event_factory.create())
+
+        response = api_client.get(event_detail_url, HTTP_ACCEPT="application/json")
+        html_response = api_client.get(event_detail_url, HTTP_ACCEPT="text/html")
+        with django_assert_num_queries(0):
+            cached_response = api_client.get(
+                event_detail_url, HTTP_ACCEPT="application/json"
+            )
+        html_not_modified_response = api_client.get(
+            event_detail_url,
+            HTTP_ACCEPT="text/html",
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+
+        assert cached_response.content == response.content
+        assert html_response["ETag"] != response["ETag"]
+        assert html_not_modified_response.status_code == 200
+
+    def test_retrieve_event_unknown_engine(self, api_client, settings, event_factory):
+        """Test retrieve event fails with an unknown engine."""
+        settings.EVENT_RETRIEVE_ENGINE = "postgresql"
+
+        with pytest.raises(ImproperlyConfigured):
+            api_client.get(get_event_detail_url(event_factory.create()))
+
+    def test_retrieve_event_not_found(self, api_client):
+        """Test retrieve missing event keeps no version in the cache."""
+        response = api_client.get("/api/events/0/")
+
+        assert response.status_code == 404
+        assert cache.get(get_event_version_key(0)) is None
+
+    def test_retrieve_event_invalid_id(self, api_client):
+        """Test retrieve event with not numeric id."""
+        response = api_client.get("/api/events/abc/")
+
+        assert response.status_code == 404
+
     def test_initiate_export_csv(self, api_client, event_factory):
         """Test initiate export csv."""
         payload = {"webhook_url": "http://test.com/test"}
@@ -92,6 +377,80 @@ class TestPublicEventAPI:
 
         assert response.status_code == 200
 
+    def test_initiate_export_csv_sends_export_spec(
+        self,
+        api_client,
+        event_factory,
+        export_job_model,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test initiate export csv does not send serialized data to the worker."""
+        payload = {"webhook_url": "http://test.com/test"}
+        event_factory.create_batch(2)
+
+        with mock.patch("core.exports.run_export_job_task") as task:
+            with django_capture_on_commit_callbacks(execute=True):
+                response = api_client.post(EVENT_INITIATE_EXPORT_CSV_URL, payload)
+
+        job = export_job_model.objects.get()
+        assert response.status_code == 200
+        task.delay.assert_called_once_with(job.id)
+        assert job.prefix == "event"
+        assert job.file_format == "csv"
+        assert job.export_spec == {
+            "model": "core.Event",
+            "filters": {},
+            "fields": ["id", "name", "start", "end"],
+        }
+        assert job.subscriptions.get().webhook_url == payload["webhook_url"]
+
+    def test_initiate_export_csv_returns_job_id(self, api_client, export_job_model):
+        """Test initiate export csv returns the export job id."""
+        payload = {"webhook_url": "http://test.com/test"}
+
+        response = api_client.post(EVENT_INITIATE_EXPORT_CSV_URL, payload)
+
+        assert response.data["job_id"] == export_job_model.objects.get().id
+
+    def test_initiate_export_csv_since(self, api_client, export_job_model):
+        """Test initiate incremental export passes the watermark to the worker."""
+        payload = {
+            "webhook_url": "http://test.com/test",
+            "since": "2024-01-01 10:00:00",
+        }
+
+        response = api_client.post(EVENT_INITIATE_EXPORT_CSV_URL, payload)
+
+        export_spec = export_job_model.objects.get().export_spec
+        assert response.status_code == 200
+        assert export_spec["since"] == "2024-01-01T10:00:00+01:00"
+
+    def test_initiate_export_csv_invalid_format(self, api_client):
+        """Test initiate export with unsupported format."""
+        payload = {"webhook_url": "http://test.com/test", "format": "xlsx"}
+        response = api_client.post(EVENT_INITIATE_EXPORT_CSV_URL, payload)
+
+        assert response.status_code == 400
+
+    def test_download_events_csv(self, api_client, event_factory):
+        """Test download events as streamed csv."""
+        events = event_factory.create_batch(3)
+
+        response = api_client.get(EVENT_DOWNLOAD_URL)
+        content = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(content.splitlines()))
+        expected = serializers.EventSerializer(events, many=True).data
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/csv"
+        assert rows == [{k: str(v) for k, v in row.items()} for row in expected]
+
+    def test_download_events_invalid_format(self, api_client):
+        """Test download events with unsupported file format."""
+        response = api_client.get(EVENT_DOWNLOAD_URL, {"file_format": "xml"})
+
+        assert response.status_code == 400
+
 
 @pytest.mark.django_db
 class TestPublicPerformanceAPI:
@@ -115,6 +474,273 @@ class TestPublicPerformanceAPI:
         assert response.data["start"] == performance_data["start"]
         assert response.data["end"] == performance_data["end"]
 
+    def test_list_performances(
+        self, api_client, django_assert_num_queries, performance_factory
+    ):
+        """Test list performances is paginated with a cursor ordered by start."""
+        performances = performance_factory.create_batch(4)
+        expected = sorted(performances, key=lambda p: (p.start, p.id))
+
+        with django_assert_num_queries(1):
+            response = api_client.get(PERFORMANCE_URL, {"page_size": 2})
+
+        assert response.status_code == 200
+        assert response.data["previous"] is None
+        assert [p["id"] for p in response.data["results"]] == [
+            p.id for p in expected[:2]
+        ]
+
+    def test_list_performances_same_as_serializer(
+        self, api_client, artist_factory, performance_factory
+    ):
+        """Test list performances read path renders the serializer output."""
+        performances = performance_factory.create_batch(3)
+        performances[0].artists.set(artist_factory.create_batch(3))
+        expected = sorted(performances, key=lambda p: (p.start, p.id))
+
+        response = api_client.get(PERFORMANCE_URL)
+
+        assert response.content == JSONRenderer().render(
+            {
+                "next": None,
+                "previous": None,
+                "results": serializers.PerformanceSerializer(expected, many=True).data,
+            }
+        )
+
+    def test_list_performances_artists_order(
+        self, api_client, artist_factory, performance_factory
+    ):
+        """Test list performances lists artists in the order they were added."""
+        performance = performance_factory.create()
+        for name in ["Zed", "Abba"]:
+            performance.artists.add(artist_factory.create(name=name))
+
+        response = api_client.get(PERFORMANCE_URL)
+        detail_response = api_client.get(get_event_detail_url(performance.event))
+
+        assert response.data["results"][0]["artists"] == ["Zed", "Abba"]
+        assert detail_response.data["performances"][0]["artists"] == ["Zed", "Abba"]
+
+    def test_list_performances_not_modified(
+        self,
+        api_client,
+        django_capture_on_commit_callbacks,
+        artist_factory,
+        performance_factory,
+    ):
+        """Test list performances honours If-None-Match."""
+        performance = performance_factory.create()
+        artist = artist_factory.create()
+
+        etag = api_client.get(PERFORMANCE_URL)["ETag"]
+        not_modified_response = api_client.get(PERFORMANCE_URL, HTTP_IF_NONE_MATCH=etag)
+        with django_capture_on_commit_callbacks(execute=True):
+            performance.artists.add(artist)
+        modified_response = api_client.get(PERFORMANCE_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert not_modified_response.status_code == 304
+        assert modified_response.status_code == 200
+        assert modified_response.data["results"][0]["artists"] == [artist.name]
+
+    def test_list_performances_filters(
+        self, api_client, event_factory, artist_factory, performance_factory
+    ):
+        """Test list performances filtered by time window, event and artists."""
+        event = event_factory.create(
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 20, 0, 0)),
+        )
+        rock_artist = artist_factory.create(music_genre="rock")
+        pop_artist = artist_factory.create(music_genre="pop")
+        performances = []
+        for hour, artist in zip(range(10, 14), [rock_artist, pop_artist] * 2):
+            performance = performance_factory.create(
+                event=event,
+                start=timezone.make_aware(timezone.datetime(2024, 1, 1, hour, 0, 0)),
+                end=timezone.make_aware(timezone.datetime(2024, 1, 1, hour + 1, 0, 0)),
+            )
+            performance.artists.set([artist])
+            performances.append(performance)
+        other_performance = performance_factory.create()
+        other_performance.artists.set([rock_artist])
+
+        cases = [
+            ({"event": event.id}, performances),
+            (
+                {"start_after": "2024-01-01 11:00:00", "event": event.id},
+                performances[1:],
+            ),
+            (
+                {"end_before": "2024-01-01 12:00:00", "event": event.id},
+                performances[:2],
+            ),
+            ({"artist": pop_artist.name}, performances[1::2]),
+            ({"music_genre": "rock", "event": event.id}, performances[::2]),
+        ]
+        for query_params, expected in cases:
+            response = api_client.get(PERFORMANCE_URL, query_params)
+
+            assert response.status_code == 200
+            assert [p["id"] for p in response.data["results"]] == [
+                p.id for p in expected
+            ], query_params
+
+    def test_list_performances_invalid_filter(self, api_client):
+        """Test list performances with invalid filter value."""
+        response = api_client.get(PERFORMANCE_URL, {"music_genre": "jazz"})
+
+        assert response.status_code == 400
+
+    def test_create_performance_overlapping(
+        self, api_client, event_factory, performance_factory
+    ):
+        """Test create performance overlapping another one."""
+        event = event_factory.create(
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 12, 0, 0)),
+        )
+        performance_factory.create(
+            event=event,
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 11, 0, 0)),
+        )
+        performance_data = {
+            "event": event.id,
+            "start": "2024-01-01 10:30:00",
+            "end": "2024-01-01 11:30:00",
+        }
+
+        response = api_client.post(PERFORMANCE_URL, performance_data)
+
+        assert response.status_code == 400
+        assert "overlaps" in str(response.data["start"])
+
+    def test_create_performance_empty_timeframe(
+        self, api_client, event_factory, performance_factory
+    ):
+        """Test create performance ending when it starts, inside another one."""
+        event = event_factory.create(
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 12, 0, 0)),
+        )
+        performance_factory.create(
+            event=event,
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 11, 0, 0)),
+        )
+        performance_data = {
+            "event": event.id,
+            "start": "2024-01-01 10:30:00",
+            "end": "2024-01-01 10:30:00",
+        }
+
+        response = api_client.post(PERFORMANCE_URL, performance_data)
+        bulk_response = api_client.post(
+            PERFORMANCE_BULK_CREATE_URL,
+            [{**performance_data, "artists": []}],
+            format="json",
+        )
+
+        assert response.status_code == 400
+        assert "later than the start" in str(response.data["end"])
+        assert bulk_response.status_code == 400
+        assert "later than the start" in str(bulk_response.data[0]["end"])
+
+    def test_create_performance_adjacent(
+        self, api_client, event_factory, performance_factory
+    ):
+        """Test create performance starting when another one ends."""
+        event = event_factory.create(
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 12, 0, 0)),
+        )
+        performance_factory.create(
+            event=event,
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 11, 0, 0)),
+        )
+        performance_data = {
+            "event": event.id,
+            "start": "2024-01-01 11:00:00",
+            "end": "2024-01-01 12:00:00",
+        }
+
+        response = api_client.post(PERFORMANCE_URL, performance_data)
+
+        assert response.status_code == 201
+
+    def test_update_performance_overlapping(
+        self, api_client, event_factory, performance_factory
+    ):
+        """Test update performance to overlap another one."""
+        event = event_factory.create(
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 12, 0, 0)),
+        )
+        performance_factory.create(
+            event=event,
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 11, 0, 0)),
+        )
+        performance = performance_factory.create(
+            event=event,
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 11, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 12, 0, 0)),
+        )
+
+        performance_detail_url = get_performance_detail_url(performance)
+        response = api_client.patch(
+            performance_detail_url, {"start": "2024-01-01 10:30:00"}
+        )
+
+        assert response.status_code == 400
+
+    def test_create_performance_with_artists(
+        self, api_client, django_assert_num_queries, event_factory, artist_factory
+    ):
+        """Test create performance resolves all artists with a single query."""
+        event = event_factory.create(
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 12, 0, 0)),
+        )
+        artists = artist_factory.create_batch(20)
+        performance_data = {
+            "event": event.id,
+            "artists": [artist.name for artist in artists],
+            "start": "2024-01-01 10:00:00",
+            "end": "2024-01-01 11:00:00",
+        }
+
+        # Event, artists, savepoint, insert, m2m set (3), savepoint release
+        # and artists representation, no query per artist name.
+        with django_assert_num_queries(9):
+            response = api_client.post(PERFORMANCE_URL, performance_data, format="json")
+
+        assert response.status_code == 201
+        assert response.data["artists"] == performance_data["artists"]
+
+    def test_create_performance_unknown_artists(
+        self, api_client, event_factory, artist_factory
+    ):
+        """Test create performance reports all unknown artists at once."""
+        event = event_factory.create(
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 12, 0, 0)),
+        )
+        artist = artist_factory.create()
+        performance_data = {
+            "event": event.id,
+            "artists": ["Unknown1", artist.name, "Unknown2"],
+            "start": "2024-01-01 10:00:00",
+            "end": "2024-01-01 11:00:00",
+        }
+
+        response = api_client.post(PERFORMANCE_URL, performance_data, format="json")
+
+        assert response.status_code == 400
+        assert "Unknown1, Unknown2" in str(response.data["artists"])
+
     def test_update_performance(self, api_client, event_factory, performance_factory):
         """Test update performance."""
         event = event_factory.create(
@@ -195,3 +821,320 @@ class TestPublicPerformanceAPI:
 
         assert response.status_code == 204
         assert not performance_model.objects.filter(id=performance.id).exists()
+
+    def test_download_performances_ndjson(self, api_client, performance_factory):
+        """Test download performances as streamed newline-delimited json."""
+        performances = performance_factory.create_batch(2)
+
+        response = api_client.get(PERFORMANCE_DOWNLOAD_URL, {"file_format": "ndjson"})
+        content = b"".join(response.streaming_content).decode()
+        rows = [json.loads(line) for line in content.splitlines()]
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert [(row["id"], row["event"]) for row in rows] == [
+            (performance.id, performance.event_id) for performance in performances
+        ]
+
+    def test_bulk_create_performances(
+        self,
+        api_client,
+        django_assert_max_num_queries,
+        django_capture_on_commit_callbacks,
+        event_factory,
+        artist_factory,
+        performance_model,
+    ):
+        """Test bulk create performances."""
+        event = event_factory.create(
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 20, 0, 0)),
+        )
+        artists = artist_factory.create_batch(3)
+        payload = [
+            {
+                "event": event.id,
+                "artists": [artist.name for artist in artists],
+                "start": f"2024-01-01 {hour}:00:00",
+                "end": f"2024-01-01 {hour + 1}:00:00",
+            }
+            for hour in range(10, 20)
+        ]
+
+        # Cache the event payload, bulk create has to invalidate it.
+        event_detail_url = get_event_detail_url(event)
+        api_client.get(event_detail_url)
+
+        with django_assert_max_num_queries(10), django_capture_on_commit_callbacks(
+            execute=True
+        ):
+            response = api_client.post(
+                PERFORMANCE_BULK_CREATE_URL, payload, format="json"
+            )
+
+        assert response.status_code == 201
+        assert len(response.data) == 10
+        assert performance_model.objects.filter(event=event).count() == 10
+        assert len(api_client.get(event_detail_url).data["performances"]) == 10
+        for performance in performance_model.objects.filter(event=event):
+            assert set(performance.artists.all()) == set(artists)
+
+    def test_bulk_create_performances_overlapping_in_batch(
+        self, api_client, event_factory, performance_model
+    ):
+        """Test bulk create rejects performances overlapping each other."""
+        event = event_factory.create(
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 20, 0, 0)),
+        )
+        payload = [
+            {
+                "event": event.id,
+                "artists": [],
+                "start": "2024-01-01 12:00:00",
+                "end": "2024-01-01 13:00:00",
+            },
+            {
+                "event": event.id,
+                "artists": [],
+                "start": "2024-01-01 10:00:00",
+                "end": "2024-01-01 11:00:00",
+            },
+            {
+                "event": event.id,
+                "artists": [],
+                "start": "2024-01-01 12:30:00",
+                "end": "2024-01-01 14:00:00",
+            },
+        ]
+
+        response = api_client.post(PERFORMANCE_BULK_CREATE_URL, payload, format="json")
+
+        assert response.status_code == 400
+        assert [bool(errors) for errors in response.data] == [False, False, True]
+        assert not performance_model.objects.filter(event=event).exists()
+
+    def test_bulk_create_performances_overlapping_existing(
+        self, api_client, event_factory, performance_factory
+    ):
+        """Test bulk create rejects performances overlapping existing ones."""
+        event = event_factory.create(
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 20, 0, 0)),
+        )
+        performance_factory.create(
+            event=event,
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 12, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 13, 0, 0)),
+        )
+        payload = [
+            {
+                "event": event.id,
+                "artists": [],
+                "start": "2024-01-01 11:00:00",
+                "end": "2024-01-01 12:00:00",
+            },
+            {
+                "event": event.id,
+                "artists": [],
+                "start": "2024-01-01 12:30:00",
+                "end": "2024-01-01 14:00:00",
+            },
+        ]
+
+        response = api_client.post(PERFORMANCE_BULK_CREATE_URL, payload, format="json")
+
+        assert response.status_code == 400
+        assert [bool(errors) for errors in response.data] == [False, True]
+
+    def test_bulk_create_performances_unknown_artists(self, api_client, event_factory):
+        """Test bulk create reports all unknown artists."""
+        event = event_factory.create(
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 20, 0, 0)),
+        )
+        payload = [
+            {
+                "event": event.id,
+                "artists": ["Unknown1", "Unknown2"],
+                "start": "2024-01-01 11:00:00",
+                "end": "2024-01-01 12:00:00",
+            },
+        ]
+
+        response = api_client.post(PERFORMANCE_BULK_CREATE_URL, payload, format="json")
+
+        assert response.status_code == 400
+        assert "Unknown1, Unknown2" in str(response.data[0]["artists"])
+
+    def test_bulk_create_performances_duplicate_artists(
+        self, api_client, event_factory, artist_factory, performance_model
+    ):
+        """Test bulk create adds an artist listed twice once."""
+        event = event_factory.create(
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 20, 0, 0)),
+        )
+        artist = artist_factory.create()
+        payload = [
+            {
+                "event": event.id,
+                "artists": [artist.name, artist.name],
+                "start": "2024-01-01 11:00:00",
+                "end": "2024-01-01 12:00:00",
+            },
+        ]
+
+        response = api_client.post(PERFORMANCE_BULK_CREATE_URL, payload, format="json")
+
+        assert response.status_code == 201
+        assert list(performance_model.objects.get(event=event).artists.all()) == [
+            artist
+        ]
+
+    def test_bulk_create_performances_invalid_artist_name(
+        self, api_client, event_factory, performance_model
+    ):
+        """Test bulk create with a blank artist name reports the item errors."""
+        event = event_factory.create(
+            start=timezone.make_aware(timezone.datetime(2024, 1, 1, 10, 0, 0)),
+            end=timezone.make_aware(timezone.datetime(2024, 1, 1, 20, 0, 0)),
+        )
+        payload = [
+            {
+                "event": event.id,
+                "artists": [""],
+                "start": "2024-01-01 11:00:00",
+                "end": "2024-01-01 12:00:00",
+            },
+        ]
+
+        response = api_client.post(PERFORMANCE_BULK_CREATE_URL, payload, format="json")
+
+        assert response.status_code == 400
+        assert response.json() == [{"artists": {"0": ["This field may not be blank."]}}]
+        assert not performance_model.objects.exists()
+
+
+@pytest.mark.django_db
+class TestPublicExportJobAPI:
+    """Public export job API tests."""
+
+    def test_retrieve_export_job_running(self, api_client, export_job_model):
+        """Test retrieve running export job progress."""
+        job = export_job_model.objects.create(
+            key="test",
+            prefix="test",
+            export_spec={},
+            file_format="csv",
+            state="running",
+            total_rows=1000,
+            rows_written=250,
+            bytes_written=4096,
+            started_at=timezone.now() - timezone.timedelta(seconds=10),
+        )
+
+        response = api_client.get(get_export_detail_url(job.id))
+
+        assert response.status_code == 200
+        assert response.data["state"] == "running"
+        assert response.data["rows_written"] == 250
+        assert response.data["bytes_written"] == 4096
+        assert response.data["throughput"] == pytest.approx(25, rel=0.1)
+        assert response.data["eta"] == pytest.approx(30, rel=0.1)
+        assert response.data["file_url"] is None
+
+    def test_retrieve_export_job_finished(self, api_client, export_job_model):
+        """Test retrieve finished export job."""
+        started_at = timezone.now() - timezone.timedelta(seconds=10)
+        job = export_job_model.objects.create(
+            key="test",
+            prefix="test",
+            export_spec={},
+            file_format="csv",
+            state="succeeded",
+            total_rows=100,
+            rows_written=100,
+            payload={"file_url": "media/test.csv"},
+            started_at=started_at,
+            finished_at=started_at + timezone.timedelta(seconds=4),
+        )
+
+        response = api_client.get(get_export_detail_url(job.id))
+
+        assert response.data["throughput"] == 25
+        assert response.data["eta"] is None
+        assert response.data["file_url"] == "media/test.csv"
+
+    def test_retrieve_export_job_pending(self, api_client, export_job_model):
+        """Test retrieve not started export job."""
+        job = export_job_model.objects.create(
+            key="test", prefix="test", export_spec={}, file_format="csv"
+        )
+
+        response = api_client.get(get_export_detail_url(job.id))
+
+        assert response.data["state"] == "pending"
+        assert response.data["throughput"] is None
+        assert response.data["eta"] is None
+
+    def test_retrieve_export_job_not_found(self, api_client):
+        """Test retrieve missing export job."""
+        response = api_client.get(get_export_detail_url(0))
+
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestPublicAsyncAPI:
+    """Public async read API tests."""
+
+    def test_retrieve_event(
+        self, client, event_factory, artist_factory, performance_factory
+    ):
+        """Test async retrieve event returns the same payload as the viewset."""
+        event = event_factory.create()
+        performance = performance_factory.create(event=event)
+        performance.artists.set(artist_factory.create_batch(2))
+
+        response = client.get(get_async_event_detail_url(event.id))
+        sync_response = client.get(get_event_detail_url(event))
+
+        assert response.status_code == 200
+        assert response.content == sync_response.content
+        assert response["ETag"] == sync_response["ETag"]
+
+    def test_retrieve_event_not_modified(self, client, event_factory):
+        """Test async retrieve event honours If-None-Match."""
+        event = event_factory.create()
+        url = get_async_event_detail_url(event.id)
+
+        etag = client.get(url)["ETag"]
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_retrieve_event_not_found(self, client):
+        """Test async retrieve missing event."""
+        response = client.get(get_async_event_detail_url(0))
+
+        assert response.status_code == 404
+        assert cache.get(get_event_version_key(0)) is None
+
+    def test_list_performances(self, client, performance_factory):
+        """Test async list performances returns the same page as the viewset."""
+        performance_factory.create_batch(3)
+        query_params = {"page_size": 2}
+
+        response = client.get(ASYNC_PERFORMANCE_URL, query_params)
+        sync_response = client.get(PERFORMANCE_URL, query_params)
+
+        assert response.status_code == 200
+        assert response.json()["results"] == sync_response.json()["results"]
+
+    def test_list_performances_invalid_filter(self, client):
+        """Test async list performances with invalid filter value."""
+        response = client.get(ASYNC_PERFORMANCE_URL, {"music_genre": "jazz"})
+
+        assert response.status_code == 400
+        assert "music_genre" in response.json()
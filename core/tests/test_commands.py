@@ -0,0 +1,94 @@
+"""Core module management commands tests."""
+
+import io
+
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+class TestSeedBenchmarkCommand:
+    """Test benchmark data seeding."""
+
+    def seed(self, **options):
+        call_command(
+            "seed_benchmark",
+            events=3,
+            performances_per_event=4,
+            artists=5,
+            artists_per_performance=2,
+            batch_size=2,
+            stdout=io.StringIO(),
+            **options,
+        )
+
+    def test_seed(self, event_model, performance_model, artist_model):
+        """Test seeded row counts."""
+        self.seed()
+
+        assert event_model.objects.count() == 3
+        assert performance_model.objects.count() == 12
+        assert artist_model.objects.count() == 5
+        assert performance_model.artists.through.objects.count() == 24
+
+    def test_seed_reproducible(self, performance_model):
+        """Test the same seed generates the same dataset."""
+        self.seed()
+        first = list(
+            performance_model.objects.order_by("id", "artists__name").values_list(
+                "start", "end", "artists__name"
+            )
+        )
+
+        self.seed(clear=True)
+        second = list(
+            performance_model.objects.order_by("id", "artists__name").values_list(
+                "start", "end", "artists__name"
+            )
+        )
+
+        assert first == second
+
+    def test_clear(
+        self,
+        event_model,
+        event_factory,
+        artist_model,
+        artist_factory,
+        performance_model,
+        tombstone_model,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test clear removes only seeded rows and records their tombstones."""
+        event = event_factory(name="Bench Sessions")
+        artist = artist_factory(name="Bench Press")
+        self.seed()
+        seeded_event_ids = set(
+            event_model.objects.exclude(pk=event.pk).values_list("id", flat=True)
+        )
+        seeded_ids = set(
+            performance_model.objects.exclude(event=event).values_list("id", flat=True)
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self.seed(clear=True)
+
+        assert event_model.objects.filter(pk=event.pk).exists()
+        assert artist_model.objects.filter(pk=artist.pk).exists()
+        assert performance_model.objects.count() == 12
+        assert (
+            set(
+                tombstone_model.objects.filter(
+                    model=performance_model._meta.label
+                ).values_list("object_id", flat=True)
+            )
+            == seeded_ids
+        )
+        assert (
+            set(
+                tombstone_model.objects.filter(
+                    model=event_model._meta.label
+                ).values_list("object_id", flat=True)
+            )
+            == seeded_event_ids
+        )
@@ -0,0 +1,168 @@
+"""Core module export jobs tests."""
+
+import os
+import pytest
+from datetime import timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.utils import timezone
+
+from core.exports import request_export
+from core.tasks import run_export_job_task
+
+EXPORT_SPEC = {"model": "core.Event", "filters": {}, "fields": ["id", "name"]}
+
+
+@pytest.fixture
+def export(django_capture_on_commit_callbacks):
+    """
+    Fixture to provide request_export recording queued jobs in ``queued``,
+    ``run()`` runs them and stores their payloads in ``finished``.
+    """
+
+    def request(webhook_url, export_spec=EXPORT_SPEC, file_format="csv"):
+        with mock.patch("core.exports.run_export_job_task") as task:
+            with django_capture_on_commit_callbacks(execute=True):
+                job = request_export(webhook_url, "test", export_spec, file_format)
+        request.queued.extend(call.args[0] for call in task.delay.call_args_list)
+        return job
+
+    def run():
+        for job_id in request.queued:
+            if job_id not in request.finished:
+                request.finished[job_id] = run_export_job_task(job_id)
+
+    request.queued = []
+    request.finished = {}
+    request.run = run
+    yield request
+
+    for payload in request.finished.values():
+        os.remove(os.path.join(settings.MEDIA_ROOT, payload["file_url"].split("/")[-1]))
+
+
+@pytest.mark.django_db
+class TestRequestExport:
+    """Test export job deduplication."""
+
+    def test_identical_requests_coalesced(self, export, event_factory):
+        """Test identical requests share one queued job."""
+        event_factory.create()
+
+        first = export("http://test.com/first")
+        second = export("http://test.com/second")
+
+        assert first == second
+        assert export.queued == [first.id]
+        assert first.subscriptions.count() == 2
+
+    def test_subscribers_notified(self, export, event_factory, webhook_delivery_model):
+        """Test every subscriber of a job receives its payload."""
+        event_factory.create()
+        job = export("http://test.com/first")
+        export("http://test.com/second")
+
+        export.run()
+
+        deliveries = webhook_delivery_model.objects.order_by("url")
+        assert [delivery.url for delivery in deliveries] == [
+            "http://test.com/first",
+            "http://test.com/second",
+        ]
+        assert all(
+            delivery.payload == export.finished[job.id] for delivery in deliveries
+        )
+
+    def test_finished_file_reused(self, export, event_factory, webhook_delivery_model):
+        """Test a recent finished file of unchanged data is reused."""
+        event_factory.create()
+        job = export("http://test.com/first")
+        export.run()
+
+        reused = export("http://test.com/second")
+
+        assert reused == job
+        assert export.queued == [job.id]
+        assert webhook_delivery_model.objects.get(
+            url="http://test.com/second"
+        ).payload == (export.finished[job.id])
+
+    def test_stale_file_not_reused(self, export, event_factory, export_job_model):
+        """Test a finished file older than the reuse timeout is not reused."""
+        event_factory.create()
+        job = export("http://test.com/first")
+        export.run()
+        export_job_model.objects.filter(pk=job.id).update(
+            finished_at=timezone.now()
+            - timedelta(seconds=settings.EXPORT_JOB_REUSE_TIMEOUT + 1)
+        )
+
+        new_job = export("http://test.com/second")
+
+        assert new_job != job
+
+    def test_new_job_after_data_change(self, export, event_factory):
+        """Test a data change starts a new job."""
+        event = event_factory.create()
+        job = export("http://test.com/first")
+
+        event.name = "Changed"
+        event.save()
+        new_job = export("http://test.com/second")
+
+        assert new_job != job
+        assert export.queued == [job.id, new_job.id]
+
+    def test_new_job_after_delete(self, export, event_factory):
+        """Test a delete starts a new job."""
+        event_factory.create()
+        event = event_factory.create()
+        job = export("http://test.com/first")
+
+        event.delete()
+        new_job = export("http://test.com/second")
+
+        assert new_job != job
+
+    def test_different_format_not_coalesced(self, export, event_factory):
+        """Test requests for another file format get their own job."""
+        event_factory.create()
+
+        job = export("http://test.com/first")
+        new_job = export("http://test.com/second", file_format="csv.gz")
+
+        assert new_job != job
+
+    def test_failed_job_not_reused(self, export, event_factory, export_job_model):
+        """Test a failed job is not reused."""
+        event_factory.create()
+        job = export("http://test.com/first")
+        export_job_model.objects.filter(pk=job.id).update(state="failed")
+
+        new_job = export("http://test.com/second")
+
+        assert new_job != job
+
+    def test_stale_job_replaced(
+        self, export, event_factory, export_job_model, webhook_delivery_model
+    ):
+        """Test a job running past the stale timeout is failed and replaced."""
+        event_factory.create()
+        job = export("http://test.com/first")
+        export_job_model.objects.filter(pk=job.id).update(
+            created_at=timezone.now()
+            - timedelta(seconds=settings.EXPORT_JOB_STALE_TIMEOUT + 1)
+        )
+
+        new_job = export("http://test.com/second")
+        job.refresh_from_db()
+
+        assert new_job != job
+        assert export.queued == [job.id, new_job.id]
+        assert job.state == "failed"
+        assert webhook_delivery_model.objects.get(
+            url="http://test.com/first"
+        ).payload == {"error": job.error}
+        # A worker picking the lost job up late does not run it.
+        assert run_export_job_task(job.id) is None
@@ -1,15 +1,26 @@
 """Core module helpers tests."""
 
+import io
 import os
+import datetime
 import csv
+import gzip
 import pytest
+from unittest import mock
 
 from django.utils import timezone
 from django.conf import settings
 
+from core.api.serializers import EventSerializer
 from core.helpers import (
     generate_csv_from_queryset,
     generate_csv_from_serialized_data,
+    generate_file_from_export_spec,
+    get_deleted_ids_from_export_spec,
+    get_partition_export_spec,
+    get_pk_partitions,
+    get_queryset_from_export_spec,
+    iter_batches,
 )
 
 
@@ -39,8 +50,9 @@ class TestCSVGeneration:
         file_root = os.path.join(settings.MEDIA_ROOT, file_url.split("/")[-1])
         model_name = queryset.model._meta.model_name
         timestamp = timezone.now().strftime("%Y-%m-%d_%H-%M-%S")
-        expected_file_name = f"{model_name}_{timestamp}.csv"
-        assert file_url.split("/")[-1] == expected_file_name
+        file_name = file_url.split("/")[-1]
+        assert file_name.startswith(f"{model_name}_{timestamp}_")
+        assert file_name.endswith(".csv")
         os.remove(file_root)
 
     def test_generate_csv_from_queryset_content(self, event_model):
@@ -53,6 +65,48 @@ class TestCSVGeneration:
                 assert row
         os.remove(file_root)
 
+    def test_generate_csv_from_queryset_copy_same_as_fallback(
+        self, event_model, event_factory
+    ):
+        # Test that the COPY and the fallback path write the same bytes
+        start = timezone.make_aware(timezone.datetime(2024, 7, 1, 10, 0, 0))
+        events = [
+            event_factory.create(name='Comma, "quoted"', start=start),
+            event_factory.create(
+                name="Multi\nline", start=start + timezone.timedelta(microseconds=1500)
+            ),
+            event_factory.create(name="", start=start),
+        ]
+        queryset = event_model.objects.order_by("id")
+        expected_header = ["id", "name", "start", "end", "updated_at"]
+
+        file_url = generate_csv_from_queryset(queryset)
+        file_root = os.path.join(settings.MEDIA_ROOT, file_url.split("/")[-1])
+        with open(file_root, "rb") as csvfile:
+            copy_content = csvfile.read()
+        os.remove(file_root)
+
+        with mock.patch("core.helpers.connections") as connections:
+            connections.__getitem__.return_value.vendor = "sqlite"
+            file_url = generate_csv_from_queryset(queryset)
+        file_root = os.path.join(settings.MEDIA_ROOT, file_url.split("/")[-1])
+        with open(file_root, "rb") as csvfile:
+            fallback_content = csvfile.read()
+        os.remove(file_root)
+
+        rows = list(csv.reader(io.StringIO(copy_content.decode(), newline="")))
+        assert copy_content == fallback_content
+        assert copy_content.startswith(b"id,name,start,end,updated_at\r\n")
+        assert rows[0] == expected_header
+        assert [row[:3] for row in rows[1:]] == [
+            [
+                str(event.id),
+                event.name,
+                str(event.start.astimezone(datetime.timezone.utc)),
+            ]
+            for event in events
+        ]
+
     def test_generate_csv_from_serialized_data_without_media_root_folder(self):
         if os.path.exists(settings.MEDIA_ROOT):
             os.rmdir(settings.MEDIA_ROOT)
@@ -86,10 +140,19 @@ class TestCSVGeneration:
         file_url = generate_csv_from_serialized_data("test", data)
         file_root = os.path.join(settings.MEDIA_ROOT, file_url.split("/")[-1])
         timestamp = timezone.now().strftime("%Y-%m-%d_%H-%M-%S")
-        expected_file_name = f"test_{timestamp}.csv"
-        assert file_url.split("/")[-1] == expected_file_name
+        file_name = file_url.split("/")[-1]
+        assert file_name.startswith(f"test_{timestamp}_")
+        assert file_name.endswith(".csv")
         os.remove(file_root)
 
+    def test_generate_csv_from_serialized_data_unique_file_name(self):
+        data = [{"col1": "v1_1"}]
+        first_url = generate_csv_from_serialized_data("test", data)
+        second_url = generate_csv_from_serialized_data("test", data)
+        for file_url in (first_url, second_url):
+            os.remove(os.path.join(settings.MEDIA_ROOT, file_url.split("/")[-1]))
+        assert first_url != second_url
+
     def test_generate_csv_from_serializer_data_content(self):
         # Test if the file contains the correct data
         data = [
@@ -103,3 +166,183 @@ class TestCSVGeneration:
             for row in reader:
                 assert row
         os.remove(file_root)
+
+    def test_generate_file_from_export_spec_content(self, event_model, event_factory):
+        # Test if the file contains the same data as the serializer output
+        events = event_factory.create_batch(3)
+        export_spec = {
+            "model": event_model._meta.label,
+            "filters": {},
+            "fields": list(EventSerializer.Meta.fields),
+        }
+        file_url = generate_file_from_export_spec("test", export_spec)
+        file_root = os.path.join(settings.MEDIA_ROOT, file_url.split("/")[-1])
+        with open(file_root, "r", encoding="utf-8") as csvfile:
+            rows = list(csv.DictReader(csvfile))
+        os.remove(file_root)
+
+        expected = EventSerializer(sorted(events, key=lambda e: e.id), many=True).data
+        assert rows == [{k: str(v) for k, v in row.items()} for row in expected]
+
+    @pytest.mark.parametrize("file_format", ["csv", "csv.gz", "parquet"])
+    def test_generate_file_from_export_spec_progress(
+        self, event_model, event_factory, settings, file_format
+    ):
+        settings.EXPORT_CHUNK_SIZE = 2
+        event_factory.create_batch(5)
+        export_spec = {
+            "model": event_model._meta.label,
+            "filters": {},
+            "fields": ["id", "name"],
+        }
+        reports = []
+        file_url = generate_file_from_export_spec(
+            "test",
+            export_spec,
+            file_format,
+            lambda rows, size: reports.append((rows, size)),
+        )
+        file_root = os.path.join(settings.MEDIA_ROOT, file_url.split("/")[-1])
+        file_size = os.path.getsize(file_root)
+        os.remove(file_root)
+
+        assert [rows for rows, _size in reports] == [2, 4, 5, 5]
+        assert reports[-1][1] == file_size
+
+    def test_generate_file_from_export_spec_filters(self, event_model, event_factory):
+        events = event_factory.create_batch(2)
+        export_spec = {
+            "model": event_model._meta.label,
+            "filters": {"id": events[0].id},
+            "fields": ["id", "name"],
+        }
+        file_url = generate_file_from_export_spec("test", export_spec)
+        file_root = os.path.join(settings.MEDIA_ROOT, file_url.split("/")[-1])
+        with open(file_root, "r", encoding="utf-8") as csvfile:
+            rows = list(csv.DictReader(csvfile))
+        os.remove(file_root)
+
+        assert rows == [{"id": str(events[0].id), "name": events[0].name}]
+
+    def test_generate_file_from_export_spec_in_chunks(
+        self, settings, event_model, event_factory
+    ):
+        # Test that rows spanning several cursor chunks are all written
+        settings.EXPORT_CHUNK_SIZE = 2
+        events = event_factory.create_batch(5)
+        export_spec = {
+            "model": event_model._meta.label,
+            "filters": {},
+            "fields": ["id"],
+        }
+        file_url = generate_file_from_export_spec("test", export_spec)
+        file_root = os.path.join(settings.MEDIA_ROOT, file_url.split("/")[-1])
+        with open(file_root, "r", encoding="utf-8") as csvfile:
+            rows = list(csv.DictReader(csvfile))
+        os.remove(file_root)
+
+        assert [row["id"] for row in rows] == [str(event.id) for event in events]
+
+    def test_generate_file_from_export_spec_csv_gz(self, event_model, event_factory):
+        events = event_factory.create_batch(2)
+        export_spec = {
+            "model": event_model._meta.label,
+            "filters": {},
+            "fields": ["id", "name"],
+        }
+        file_url = generate_file_from_export_spec("test", export_spec, "csv.gz")
+        file_root = os.path.join(settings.MEDIA_ROOT, file_url.split("/")[-1])
+        with gzip.open(file_root, "rt", encoding="utf-8") as csvfile:
+            rows = list(csv.DictReader(csvfile))
+        os.remove(file_root)
+
+        assert file_url.endswith(".csv.gz")
+        assert rows == [{"id": str(e.id), "name": e.name} for e in events]
+
+    def test_generate_file_from_export_spec_parquet(
+        self, settings, event_model, event_factory
+    ):
+        pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+        settings.EXPORT_CHUNK_SIZE = 2
+        events = event_factory.create_batch(3)
+        export_spec = {
+            "model": event_model._meta.label,
+            "filters": {},
+            "fields": ["id", "name", "start"],
+        }
+        file_url = generate_file_from_export_spec("test", export_spec, "parquet")
+        file_root = os.path.join(settings.MEDIA_ROOT, file_url.split("/")[-1])
+        parquet_file = pyarrow_parquet.ParquetFile(file_root)
+        table = parquet_file.read()
+        os.remove(file_root)
+
+        assert parquet_file.metadata.num_row_groups == 2
+        assert table.column("id").to_pylist() == [e.id for e in events]
+        assert table.column("start").to_pylist() == [e.start for e in events]
+
+    def test_get_queryset_from_export_spec_since(self, event_model, event_factory):
+        old_event = event_factory.create()
+        since = timezone.now()
+        new_event = event_factory.create()
+        old_event_id = old_event.id
+        old_event.delete()
+        export_spec = {
+            "model": event_model._meta.label,
+            "filters": {},
+            "fields": ["id"],
+            "since": since.isoformat(),
+        }
+
+        rows = list(get_queryset_from_export_spec(export_spec))
+        deleted_ids = get_deleted_ids_from_export_spec(export_spec)
+
+        assert rows == [(new_event.id,)]
+        assert deleted_ids == [old_event_id]
+
+
+def test_iter_batches():
+    assert list(iter_batches(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(iter_batches([], 2)) == []
+
+
+@pytest.mark.django_db
+class TestPartitions:
+    """Test partitioned export helpers."""
+
+    @pytest.mark.parametrize("partitions", [1, 2, 3, 10])
+    def test_get_pk_partitions(
+        self, event_model, event_factory, django_assert_num_queries, partitions
+    ):
+        events = event_factory.create_batch(7)
+        queryset = event_model.objects.all()
+
+        # All boundaries are read at once.
+        with django_assert_num_queries(int(partitions > 1)):
+            ranges = get_pk_partitions(queryset, 7, partitions)
+        parts = [
+            get_queryset_from_export_spec(
+                get_partition_export_spec(
+                    {"model": "core.Event", "filters": {}, "fields": ["id"]},
+                    low,
+                    high,
+                )
+            )
+            for low, high in ranges
+        ]
+
+        assert len(ranges) == min(partitions, 7)
+        assert [pk for part in parts for (pk,) in part] == sorted(
+            event.id for event in events
+        )
+        assert max(len(part) for part in parts) - min(len(part) for part in parts) <= 1
+
+    def test_get_pk_partitions_empty(self, event_model):
+        assert get_pk_partitions(event_model.objects.all(), 0, 4) == [(None, None)]
+
+    def test_get_partition_export_spec_keeps_filters(self):
+        export_spec = {"model": "core.Event", "filters": {"name": "a"}, "fields": []}
+
+        part_spec = get_partition_export_spec(export_spec, 10, None)
+
+        assert part_spec["filters"] == {"name": "a", "pk__gte": 10}
+        assert export_spec["filters"] == {"name": "a"}
@@ -0,0 +1,107 @@
+"""Core module middleware tests."""
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+
+from core.api.views import EventViewSet
+from core.middleware import get_metrics, reset_metrics
+
+EVENT_URL = reverse("core:events-list")
+EVENT_DOWNLOAD_URL = reverse("core:events-download")
+ASYNC_EVENT_URL = reverse("core:async-events-detail", args=[0])
+
+
+@pytest.fixture(autouse=True)
+def metrics():
+    """Fixture to start every test with empty counters."""
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+@pytest.mark.django_db
+class TestInstrumentationMiddleware:
+    """Test request instrumentation."""
+
+    def test_server_timing(self, api_client, event_factory):
+        """Test Server-Timing header of an API response."""
+        event_factory.create_batch(2)
+
+        response = api_client.get(EVENT_URL)
+
+        timings = [part.split(";")[0] for part in response["Server-Timing"].split(", ")]
+        assert timings == ["db", "app", "render"]
+        assert 'desc="1 queries"' in response["Server-Timing"]
+
+    def test_metrics(self, api_client, event_factory, query_budget):
+        """Test metrics sent for an API request."""
+        event_factory.create_batch(2)
+
+        response = api_client.get(EVENT_URL)
+
+        (metrics,) = query_budget
+        assert metrics["endpoint"] == "EventViewSet.list"
+        assert metrics["queries"] == 1
+        assert metrics["budget"] == 1
+        assert metrics["bytes"] == len(response.content)
+        assert metrics["exceeded"] is False
+
+    def test_counters_aggregated(self, api_client):
+        """Test per-endpoint counters are aggregated."""
+        api_client.get(EVENT_URL)
+        api_client.get(EVENT_URL)
+
+        counters = get_metrics()["EventViewSet.list"]
+        assert counters["requests"] == 2
+        assert counters["queries"] == 2
+
+    def test_streaming_response(self, api_client, event_factory, query_budget):
+        """Test metrics of a streaming response are sent after its content."""
+        event_factory.create_batch(2)
+
+        response = api_client.get(EVENT_DOWNLOAD_URL)
+        content = b"".join(response.streaming_content)
+
+        (metrics,) = query_budget
+        assert metrics["endpoint"] == "EventViewSet.download"
+        assert metrics["queries"] == 1
+        assert metrics["bytes"] == len(content)
+
+    def test_streaming_response_closed(self, api_client, event_factory, query_budget):
+        """Test metrics of a streaming response closed early are sent."""
+        event_factory.create_batch(2)
+
+        response = api_client.get(EVENT_DOWNLOAD_URL)
+        chunk = next(iter(response.streaming_content))
+        response.close()
+
+        (metrics,) = query_budget
+        assert metrics["endpoint"] == "EventViewSet.download"
+        assert metrics["bytes"] == len(chunk)
+
+    @pytest.mark.django_db(transaction=True)
+    def test_async_request(self, query_budget):
+        """Test queries of an async view are recorded."""
+        response = async_to_sync(AsyncClient().get)(ASYNC_EVENT_URL)
+
+        assert response.status_code == 404
+        (metrics,) = query_budget
+        assert metrics["endpoint"] == "EventRetrieveAsyncView.get"
+        assert metrics["queries"] == 1
+
+    @pytest.mark.no_query_budget
+    def test_budget_exceeded(self, api_client, query_budget, monkeypatch):
+        """Test metrics report an exceeded query budget."""
+        monkeypatch.setattr(EventViewSet, "query_budget", {"list": 0})
+
+        api_client.get(EVENT_URL)
+
+        assert query_budget[0]["exceeded"] is True
+
+    def test_not_api_request(self, client, query_budget):
+        """Test requests not routed to an API view are not measured."""
+        client.get("/not-found/")
+
+        assert query_budget == []
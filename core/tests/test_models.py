@@ -1,8 +1,11 @@
 """Core module models tests."""
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 
+from core.cache import get_artist_id_key, get_artist_ids, get_event_version
+
 
 @pytest.mark.django_db
 class TestEventModel:
@@ -20,6 +23,33 @@ class TestEventModel:
 
         assert str(event) == event_data["name"]
 
+    def test_update_event_updated_at(self, event_factory):
+        """Test updated_at changes on save."""
+        event = event_factory.create()
+        updated_at = event.updated_at
+
+        event.name = "TestEventNew"
+        event.save()
+
+        assert event.updated_at > updated_at
+
+    def test_delete_event_creates_tombstones(
+        self, event_factory, performance_factory, tombstone_model
+    ):
+        """Test deleting event records tombstones for it and its performances."""
+        event = event_factory.create()
+        performance = performance_factory.create(event=event)
+        event_id = event.id
+
+        event.delete()
+
+        assert tombstone_model.objects.filter(
+            model="core.Event", object_id=event_id
+        ).exists()
+        assert tombstone_model.objects.filter(
+            model="core.Performance", object_id=performance.id
+        ).exists()
+
 
 @pytest.mark.django_db
 class TestArtistModel:
@@ -62,3 +92,77 @@ class TestPerformanceModel:
 
         for performance_artist in performance.artists.all():
             assert performance_artist in artists
+
+    def test_move_performance(
+        self,
+        event_factory,
+        performance_factory,
+        performance_model,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test moving a loaded performance invalidates both events."""
+        performance = performance_factory.create()
+        old_event = performance.event
+        new_event = event_factory.create()
+        performance = performance_model.objects.get(pk=performance.pk)
+        versions = [get_event_version(old_event.id), get_event_version(new_event.id)]
+
+        performance.event = new_event
+        # Only the update, the previous event is known from the loaded row.
+        with django_assert_num_queries(1), django_capture_on_commit_callbacks(
+            execute=True
+        ):
+            performance.save()
+
+        assert get_event_version(old_event.id) != versions[0]
+        assert get_event_version(new_event.id) != versions[1]
+
+
+@pytest.mark.django_db
+class TestArtistIdCache:
+    """Test artist name to id cache."""
+
+    def test_get_artist_ids(self, artist_factory, django_assert_num_queries):
+        """Test artist ids are cached after the first lookup."""
+        artists = artist_factory.create_batch(3)
+        names = [artist.name for artist in artists] + ["Unknown"]
+        expected = {artist.name: artist.id for artist in artists}
+
+        with django_assert_num_queries(1):
+            assert get_artist_ids(names) == expected
+        with django_assert_num_queries(1):
+            # Unknown names are not cached.
+            assert get_artist_ids(names) == expected
+        with django_assert_num_queries(0):
+            assert get_artist_ids(expected) == expected
+
+    def test_get_artist_ids_after_rename(
+        self, artist_factory, django_capture_on_commit_callbacks
+    ):
+        """Test renamed artist is not resolved by its previous name."""
+        artist = artist_factory.create(name="OldName")
+        assert get_artist_ids(["OldName"]) == {"OldName": artist.id}
+
+        artist.name = "NewName"
+        with django_capture_on_commit_callbacks(execute=True):
+            artist.save()
+
+        assert get_artist_ids(["OldName", "NewName"]) == {"NewName": artist.id}
+
+    def test_get_artist_ids_after_delete(
+        self, artist_factory, django_capture_on_commit_callbacks
+    ):
+        """Test deleted artist is not resolved once the delete commits."""
+        artist = artist_factory.create()
+        artist_id = artist.id
+        get_artist_ids([artist.name])
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            artist.delete()
+        cached_before_commit = cache.get(get_artist_id_key(artist.name))
+        for callback in callbacks:
+            callback()
+
+        assert cached_before_commit == artist_id
+        assert get_artist_ids([artist.name]) == {}
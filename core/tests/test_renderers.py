@@ -0,0 +1,94 @@
+"""Core module API renderers and parsers tests."""
+
+import datetime
+import io
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from core.api.parsers import ORJSONParser
+from core.api.renderers import ORJSONRenderer
+from core.api.serializers import EventSerializer
+
+
+class TestORJSONRenderer:
+    """Test orjson renderer."""
+
+    def test_same_as_json_renderer(self):
+        """Test output is the same as of the DRF JSON renderer."""
+        data = {
+            "id": 1,
+            "name": "Zażółć   gęślą",
+            "detail": _("Not found."),
+            "price": Decimal("1.50"),
+            "items": [None, True, 1.5, {"nested": "value"}],
+        }
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_datetime_wire_format(self):
+        """Test datetimes are rendered in the API wire format."""
+        value = datetime.datetime(
+            2024, 1, 1, 9, 30, 15, 123, tzinfo=datetime.timezone.utc
+        )
+
+        content = ORJSONRenderer().render({"start": value})
+
+        expected = timezone.localtime(value).strftime("%Y-%m-%d %H:%M:%S")
+        assert content == f'{{"start":"{expected}"}}'.encode()
+
+    @pytest.mark.django_db
+    def test_serialized_event(self, event_factory):
+        """Test serialized events are rendered like by the DRF JSON renderer."""
+        data = EventSerializer(event_factory.create_batch(3), many=True).data
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_non_str_keys(self):
+        """Test non-string dict keys are rendered as strings."""
+        data = {"artists": {0: ["This field may not be blank."]}}
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_nan(self):
+        """Test NaN is rendered as null."""
+        assert ORJSONRenderer().render({"value": float("nan")}) == b'{"value":null}'
+
+    def test_indent(self):
+        """Test indented output."""
+        content = ORJSONRenderer().render({"id": 1}, "application/json; indent=2")
+
+        assert content == b'{\n  "id": 1\n}'
+
+    def test_none(self):
+        """Test None is rendered as an empty body."""
+        assert ORJSONRenderer().render(None) == b""
+
+
+class TestORJSONParser:
+    """Test orjson parser."""
+
+    def test_parse(self):
+        """Test JSON is parsed."""
+        stream = io.BytesIO('{"name": "Zażółć", "ids": [1, 2]}'.encode())
+
+        assert ORJSONParser().parse(stream) == {"name": "Zażółć", "ids": [1, 2]}
+
+    def test_parse_error(self):
+        """Test invalid JSON raises a parse error."""
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b"{invalid"))
+
+    @pytest.mark.django_db
+    def test_invalid_json_request(self, api_client):
+        """Test a request with invalid JSON is answered with 400."""
+        response = api_client.post(
+            reverse("core:events-list"), "{invalid", content_type="application/json"
+        )
+
+        assert response.status_code == 400
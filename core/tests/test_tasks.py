@@ -0,0 +1,206 @@
+"""Core module tasks tests."""
+
+import os
+import csv
+import glob
+import gzip
+import pytest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.utils import timezone
+
+from core import tasks
+from core.tasks import export_partition_task, run_export_job_task
+from simpleevent import celery_app
+
+
+@pytest.mark.django_db
+class TestRunExportJobTask:
+    """Test export task."""
+
+    def test_payload(self, event_factory, export_job_model, webhook_delivery_model):
+        """Test export job payload, state and webhook delivery."""
+        event = event_factory.create()
+        event_id = event.id
+        since = timezone.now()
+        event.delete()
+        export_spec = {
+            "model": "core.Event",
+            "filters": {},
+            "fields": ["id"],
+            "since": since.isoformat(),
+        }
+        job = export_job_model.objects.create(
+            key="test", prefix="test", export_spec=export_spec, file_format="csv"
+        )
+        job.subscriptions.create(webhook_url="http://test.com/test")
+
+        payload = run_export_job_task(job.id)
+        os.remove(os.path.join(settings.MEDIA_ROOT, payload["file_url"].split("/")[-1]))
+        job.refresh_from_db()
+
+        assert payload["deleted_ids"] == [event_id]
+        watermark = datetime.fromisoformat(payload["watermark"])
+        assert watermark.utcoffset() == timedelta(0)
+        overlap = timedelta(seconds=settings.EXPORT_WATERMARK_OVERLAP)
+        assert job.started_at - overlap <= watermark <= job.finished_at - overlap
+        assert job.state == "succeeded"
+        assert job.payload == payload
+        assert job.total_rows == 0
+        assert job.started_at <= job.finished_at
+        assert webhook_delivery_model.objects.get().payload == payload
+
+    def test_progress(self, event_factory, export_job_model, settings):
+        """Test export job progress counters."""
+        settings.EXPORT_CHUNK_SIZE = 2
+        event_factory.create_batch(5)
+        export_spec = {"model": "core.Event", "filters": {}, "fields": ["id"]}
+        job = export_job_model.objects.create(
+            key="test", prefix="test", export_spec=export_spec, file_format="csv"
+        )
+
+        payload = run_export_job_task(job.id)
+        file_root = os.path.join(
+            settings.MEDIA_ROOT, payload["file_url"].split("/")[-1]
+        )
+        job.refresh_from_db()
+
+        assert job.total_rows == 5
+        assert job.rows_written == 5
+        assert job.bytes_written == os.path.getsize(file_root)
+        os.remove(file_root)
+
+    def test_failed(self, export_job_model, webhook_delivery_model):
+        """Test failed export job is marked failed and its subscribers notified."""
+        export_spec = {"model": "core.Event", "filters": {}, "fields": ["missing"]}
+        job = export_job_model.objects.create(
+            key="test", prefix="test", export_spec=export_spec, file_format="csv"
+        )
+        job.subscriptions.create(webhook_url="http://test.com/test")
+
+        with pytest.raises(Exception):
+            run_export_job_task(job.id)
+        job.refresh_from_db()
+
+        assert job.state == "failed"
+        assert job.error
+        assert webhook_delivery_model.objects.get().payload == {"error": job.error}
+
+
+@pytest.fixture
+def celery_eager(monkeypatch):
+    """Fixture to run tasks and chords queued by tasks in process."""
+    monkeypatch.setattr(celery_app.conf, "task_always_eager", True)
+
+
+@pytest.mark.django_db
+class TestPartitionedExport:
+    """Test export split into primary key ranges."""
+
+    def run_export(self, export_job_model, file_format):
+        export_spec = {"model": "core.Event", "filters": {}, "fields": ["id", "name"]}
+        job = export_job_model.objects.create(
+            key="test", prefix="test", export_spec=export_spec, file_format=file_format
+        )
+        run_export_job_task(job.id)
+        job.refresh_from_db()
+        file_root = os.path.join(
+            settings.MEDIA_ROOT, job.payload["file_url"].split("/")[-1]
+        )
+        return job, file_root
+
+    def expected_rows(self, events):
+        return [["id", "name"]] + [
+            [str(event.id), event.name] for event in sorted(events, key=lambda e: e.id)
+        ]
+
+    @pytest.mark.parametrize("file_format", ["csv", "csv.gz"])
+    def test_csv_parts_concatenated(
+        self, celery_eager, event_factory, export_job_model, settings, file_format
+    ):
+        """Test CSV parts are concatenated under a single header."""
+        settings.EXPORT_PARTITION_ROWS = 2
+        events = event_factory.create_batch(5)
+
+        job, file_root = self.run_export(export_job_model, file_format)
+        opener = gzip.open if file_format == "csv.gz" else open
+        with opener(file_root, "rt", encoding="utf-8") as csvfile:
+            rows = list(csv.reader(csvfile))
+        file_size = os.path.getsize(file_root)
+        os.remove(file_root)
+
+        assert job.state == "succeeded"
+        assert rows == self.expected_rows(events)
+        assert job.rows_written == 5
+        assert job.bytes_written == file_size
+        assert not glob.glob(f"{file_root}.part*")
+
+    def test_parquet_parts_concatenated(
+        self, celery_eager, event_factory, export_job_model, settings
+    ):
+        """Test Parquet parts are concatenated into one table."""
+        pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+        settings.EXPORT_PARTITION_ROWS = 2
+        events = event_factory.create_batch(5)
+
+        job, file_root = self.run_export(export_job_model, "parquet")
+        table = pyarrow_parquet.read_table(file_root)
+        os.remove(file_root)
+
+        assert table.column_names == ["id", "name"]
+        assert table.column("id").to_pylist() == sorted(event.id for event in events)
+
+    def test_partitions_limited(
+        self, celery_eager, event_factory, export_job_model, settings
+    ):
+        """Test the number of partitions is limited."""
+        settings.EXPORT_PARTITION_ROWS = 1
+        settings.EXPORT_MAX_PARTITIONS = 2
+        event_factory.create_batch(5)
+
+        with mock.patch(
+            "core.tasks.export_partition_task.s", wraps=export_partition_task.s
+        ) as partition:
+            job, file_root = self.run_export(export_job_model, "csv")
+        os.remove(file_root)
+
+        assert partition.call_count == 2
+        assert job.rows_written == 5
+
+    def test_failed_part_cleaned_up(
+        self, event_factory, export_job_model, webhook_delivery_model, settings
+    ):
+        """Test a failed part removes the parts and fails the job."""
+        settings.EXPORT_PARTITION_ROWS = 2
+        event_factory.create_batch(5)
+        export_spec = {"model": "core.Event", "filters": {}, "fields": ["id"]}
+        job = export_job_model.objects.create(
+            key="test", prefix="test", export_spec=export_spec, file_format="csv"
+        )
+        job.subscriptions.create(webhook_url="http://test.com/test")
+
+        def write_export_file(file_root, *args, **kwargs):
+            if file_root.endswith(".part1"):
+                raise OSError("Disk full")
+            return real_write_export_file(file_root, *args, **kwargs)
+
+        real_write_export_file = tasks.write_export_file
+        # Eager chords do not call error callbacks, run the parts and the
+        # callback linked to the chord body like a worker would.
+        with mock.patch("core.tasks.chord") as chord:
+            run_export_job_task(job.id)
+        header = chord.call_args.args[0]
+        body = chord.return_value.call_args.args[0]
+        with mock.patch("core.tasks.write_export_file", write_export_file):
+            for part in header:
+                part.apply()
+        for errback in body.options["link_error"]:
+            errback.apply().get()
+        job.refresh_from_db()
+
+        assert job.state == "failed"
+        assert job.error == "Disk full"
+        assert webhook_delivery_model.objects.get().payload == {"error": "Disk full"}
+        assert not glob.glob(os.path.join(settings.MEDIA_ROOT, "test_*.part*"))
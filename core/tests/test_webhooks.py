@@ -0,0 +1,102 @@
+"""Core module webhooks tests."""
+
+import pytest
+
+from core.webhooks import get_session, send_webhook, send_webhook_task
+
+
+@pytest.fixture
+def deliver(monkeypatch, django_capture_on_commit_callbacks):
+    """Fixture to provide send_webhook running the delivery task eagerly."""
+    monkeypatch.setattr(
+        send_webhook_task, "delay", lambda *args: send_webhook_task.apply(args)
+    )
+    monkeypatch.setattr(send_webhook_task, "max_retries", 2)
+
+    def deliver(url, payload):
+        with django_capture_on_commit_callbacks(execute=True):
+            return send_webhook(url, payload)
+
+    return deliver
+
+
+@pytest.mark.django_db
+class TestSendWebhook:
+    """Test webhook delivery."""
+
+    def test_delivered(self, deliver, webhook_server):
+        """Test webhook delivered on the first attempt."""
+        payload = {"file_url": "media/test.csv"}
+
+        delivery = deliver(webhook_server.url, payload)
+        delivery.refresh_from_db()
+
+        assert webhook_server.received[0][1] == payload
+        assert delivery.status == "succeeded"
+        assert delivery.attempts == 1
+        assert delivery.response_status == 200
+
+    def test_connection_reused(self, deliver, webhook_server):
+        """Test deliveries to the same host reuse the connection."""
+        deliver(webhook_server.url, {"id": 1})
+        deliver(webhook_server.url, {"id": 2})
+
+        (first_port, _first), (second_port, _second) = webhook_server.received
+        assert first_port == second_port
+
+    def test_retried_on_server_error(self, deliver, webhook_server):
+        """Test delivery retried after server errors."""
+        webhook_server.statuses = [503, 500]
+
+        delivery = deliver(webhook_server.url, {})
+        delivery.refresh_from_db()
+
+        assert len(webhook_server.received) == 3
+        assert delivery.status == "succeeded"
+        assert delivery.attempts == 3
+        assert list(
+            delivery.delivery_attempts.order_by("id").values_list(
+                "response_status", flat=True
+            )
+        ) == [503, 500, 200]
+
+    def test_failed_after_max_retries(self, deliver, webhook_server):
+        """Test delivery failed after the last retry."""
+        webhook_server.statuses = [503, 503, 503]
+
+        delivery = deliver(webhook_server.url, {})
+        delivery.refresh_from_db()
+
+        assert delivery.status == "failed"
+        assert delivery.attempts == 3
+        assert delivery.response_status == 503
+
+    def test_not_retried_on_client_error(self, deliver, webhook_server):
+        """Test delivery failed at once on a client error."""
+        webhook_server.statuses = [404]
+
+        delivery = deliver(webhook_server.url, {})
+        delivery.refresh_from_db()
+
+        assert len(webhook_server.received) == 1
+        assert delivery.status == "failed"
+
+    def test_connection_error_recorded(self, deliver, webhook_server):
+        """Test connection errors are retried and recorded."""
+        url = webhook_server.url
+        webhook_server.shutdown()
+        webhook_server.server_close()
+        get_session().close()
+
+        delivery = deliver(url, {})
+        delivery.refresh_from_db()
+
+        assert delivery.status == "failed"
+        assert delivery.attempts == 3
+        assert delivery.response_status is None
+        assert delivery.error
+        attempts = delivery.delivery_attempts.all()
+        assert len(attempts) == 3
+        assert all(
+            attempt.error and attempt.response_status is None for attempt in attempts
+        )
@@ -0,0 +1,159 @@
+"""
+Core module webhook delivery.
+
+Webhooks are posted with one HTTP session per worker process, so
+connections to the same host are kept alive and reused between tasks
+instead of opening a new TCP and TLS connection per notification.
+"""
+
+import os
+
+import requests
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
+
+from .models import WebhookDelivery, WebhookDeliveryAttempt
+
+# Responses worth retrying, other 4xx responses fail the delivery at once.
+RETRY_STATUS_CODES = {408, 425, 429}
+
+_session = None
+_session_pid = None
+
+
+class WebhookDeliveryError(requests.RequestException):
+    """Webhook endpoint responded with a retryable status code."""
+
+
+def get_session():
+    """
+    Get the HTTP session of the current worker process.
+
+    The session is created again after a fork, connections of the parent
+    process must not be shared with its children.
+
+    Returns:
+        requests.Session: Session with a pooled HTTP adapter.
+    """
+    global _session, _session_pid
+
+    if _session is None or _session_pid != os.getpid():
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=settings.WEBHOOK_POOL_CONNECTIONS,
+            pool_maxsize=settings.WEBHOOK_POOL_MAXSIZE,
+            pool_block=True,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _session, _session_pid = session, os.getpid()
+    return _session
+
+
+def record_attempt(delivery):
+    """
+    Save the outcome of the last attempt of a delivery and keep its record.
+
+    Parameters:
+        delivery (WebhookDelivery): Attempted delivery.
+    """
+    with transaction.atomic():
+        delivery.save()
+        WebhookDeliveryAttempt.objects.create(
+            delivery=delivery,
+            attempted_at=delivery.last_attempt_at,
+            response_status=delivery.response_status,
+            error=delivery.error,
+        )
+
+
+def post_webhook(delivery):
+    """
+    Make a single delivery attempt and record it.
+
+    Parameters:
+        delivery (WebhookDelivery): Delivery to attempt.
+
+    Raises:
+        requests.RequestException: Attempt failed and may be retried.
+    """
+    delivery.attempts += 1
+    delivery.last_attempt_at = timezone.now()
+    try:
+        response = get_session().post(
+            delivery.url,
+            json=delivery.payload,
+            timeout=(settings.WEBHOOK_CONNECT_TIMEOUT, settings.WEBHOOK_READ_TIMEOUT),
+        )
+    except requests.RequestException as exc:
+        delivery.response_status = None
+        delivery.error = str(exc)
+        record_attempt(delivery)
+        raise
+
+    delivery.response_status = response.status_code
+    delivery.error = "" if response.ok else response.reason
+    retry = not response.ok and (
+        response.status_code >= 500 or response.status_code in RETRY_STATUS_CODES
+    )
+    if response.ok:
+        delivery.status = "succeeded"
+    elif not retry:
+        delivery.status = "failed"
+    record_attempt(delivery)
+    if retry:
+        raise WebhookDeliveryError(response.reason, response=response)
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(requests.RequestException,),
+    retry_backoff=True,
+    retry_backoff_max=600,
+    retry_jitter=True,
+    max_retries=settings.WEBHOOK_MAX_RETRIES,
+)
+def send_webhook_task(self, delivery_id):
+    delivery = WebhookDelivery.objects.get(pk=delivery_id)
+    if delivery.status != "pending":
+        return delivery.status
+    try:
+        post_webhook(delivery)
+    except requests.RequestException:
+        if self.request.retries >= self.max_retries:
+            delivery.status = "failed"
+            delivery.save(update_fields=["status"])
+        raise
+    return delivery.status
+
+
+def send_webhook(url, payload):
+    """
+    Record a webhook delivery and queue it once the transaction commits.
+
+    Parameters:
+        url (str): Webhook url.
+        payload (dict): JSON payload.
+
+    Returns:
+        WebhookDelivery: Queued delivery.
+    """
+    delivery = WebhookDelivery.objects.create(url=url, payload=payload)
+    transaction.on_commit(lambda: send_webhook_task.delay(delivery.id))
+    return delivery
+
+
+def notify_export_subscriptions(job, subscriptions):
+    """
+    Send the payload of a finished export job to its subscribers.
+
+    Parameters:
+        job (ExportJob): Succeeded export job.
+        subscriptions (Iterable[ExportSubscription]): Subscriptions to notify.
+    """
+    for subscription in subscriptions:
+        subscription.delivery = send_webhook(subscription.webhook_url, job.payload)
+        subscription.save(update_fields=["delivery"])
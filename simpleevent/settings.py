@@ -53,6 +53,12 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Opt-in per-request query count and timing instrumentation, reported in
+# Server-Timing headers, see core.middleware.
+INSTRUMENTATION = bool(os.environ.get("INSTRUMENTATION"))
+if INSTRUMENTATION:
+    MIDDLEWARE.insert(0, "core.middleware.InstrumentationMiddleware")
+
 ROOT_URLCONF = "simpleevent.urls"
 
 TEMPLATES = [
@@ -108,6 +114,40 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+if os.environ.get("CACHE_LOCATION"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ.get("CACHE_LOCATION"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Seconds resource versions are kept, an expired version is started again
+# and only costs clients a full response instead of 304 Not Modified.
+CACHE_VERSION_TIMEOUT = int(os.environ.get("CACHE_VERSION_TIMEOUT", 86400))
+
+# Seconds the event detail payload is cached, it is invalidated on writes.
+EVENT_RETRIEVE_CACHE_TIMEOUT = int(os.environ.get("EVENT_RETRIEVE_CACHE_TIMEOUT", 300))
+
+# Builder of the event detail payload: "python" serializes rows read with
+# the ORM, "postgres" builds the JSON document in the database. The latter
+# requires the "%Y-%m-%d %H:%M:%S" DATETIME_FORMAT. Other values are
+# rejected when an event is retrieved.
+EVENT_RETRIEVE_ENGINE = os.environ.get("EVENT_RETRIEVE_ENGINE", "python")
+
+# Seconds artist name to id mappings are cached, 0 disables the cache.
+ARTIST_ID_CACHE_TIMEOUT = int(os.environ.get("ARTIST_ID_CACHE_TIMEOUT", 3600))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
 
@@ -139,6 +179,19 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DATETIME_INPUT_FORMAT": "%Y-%m-%d %H:%M:%S",
     "DATETIME_FORMAT": "%Y-%m-%d %H:%M:%S",
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "core.api.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    "TEST_REQUEST_RENDERER_CLASSES": [
+        "rest_framework.renderers.MultiPartRenderer",
+        "core.api.renderers.ORJSONRenderer",
+    ],
 }
 
 SPECTACULAR_SETTINGS = {
@@ -149,5 +202,35 @@ SPECTACULAR_SETTINGS = {
     "COMPONENT_SPLIT_REQUEST": True,
 }
 
+# Number of rows fetched from the database cursor and written at once
+# during exports.
+EXPORT_CHUNK_SIZE = int(os.environ.get("EXPORT_CHUNK_SIZE", 2000))
+
+# Exports of more rows than EXPORT_PARTITION_ROWS are split into primary
+# key ranges written in parallel by up to EXPORT_MAX_PARTITIONS workers.
+EXPORT_PARTITION_ROWS = int(os.environ.get("EXPORT_PARTITION_ROWS", 500_000))
+EXPORT_MAX_PARTITIONS = int(os.environ.get("EXPORT_MAX_PARTITIONS", 8))
+
+# Seconds incremental export watermarks are moved back by, rows updated by
+# transactions committed up to this late are not missed.
+EXPORT_WATERMARK_OVERLAP = int(os.environ.get("EXPORT_WATERMARK_OVERLAP", 300))
+
+# Seconds a finished export file is reused for identical export requests
+# when the exported data did not change.
+EXPORT_JOB_REUSE_TIMEOUT = int(os.environ.get("EXPORT_JOB_REUSE_TIMEOUT", 3600))
+
+# Seconds after which a pending or running export job is considered lost,
+# e.g. after a worker crash. It is failed and identical requests start a
+# new job.
+EXPORT_JOB_STALE_TIMEOUT = int(os.environ.get("EXPORT_JOB_STALE_TIMEOUT", 3 * 3600))
+
+# Webhook delivery, timeouts are in seconds. Connections are pooled per
+# worker process, at most WEBHOOK_POOL_MAXSIZE connections per host.
+WEBHOOK_CONNECT_TIMEOUT = float(os.environ.get("WEBHOOK_CONNECT_TIMEOUT", 3.05))
+WEBHOOK_READ_TIMEOUT = float(os.environ.get("WEBHOOK_READ_TIMEOUT", 10))
+WEBHOOK_POOL_CONNECTIONS = int(os.environ.get("WEBHOOK_POOL_CONNECTIONS", 10))
+WEBHOOK_POOL_MAXSIZE = int(os.environ.get("WEBHOOK_POOL_MAXSIZE", 10))
+WEBHOOK_MAX_RETRIES = int(os.environ.get("WEBHOOK_MAX_RETRIES", 5))
+
 CELERY_BROKER_URL = os.environ.get("CELERY_BROKER")
 CELERY_RESULT_BACKEND = os.environ.get("CELERY_BACKEND")